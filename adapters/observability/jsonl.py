@@ -1,38 +1,88 @@
 """
 JSONL sink for local observability logs.
+Writes happen synchronously on the calling thread, which is the EventEmitter's
+dispatcher thread, so runtimes never block on this file I/O.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import threading
 from pathlib import Path
+from typing import Any, Iterable
+
+from core.observability.events import Event
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+_SLUG_TABLE = str.maketrans({ch: (ch if ch.isalnum() or ch in "_-" else "_") for ch in map(chr, range(128))})
 
 
 class JsonlFileSink:
     def __init__(self, run_name: str, run_id: str, base_dir: Path | None = None) -> None:
         self.run_name = run_name or "run"
         self.run_id = run_id
+        self._run_fields = {"run_id": self.run_id, "run_name": self.run_name}
         self.base_dir = Path(base_dir or "artifacts/observability")
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.path = self.base_dir / f"{self._slug()}_events.jsonl"
         self._lock = threading.Lock()
-        self.path.touch(exist_ok=True)
+        self._closed = False
+        self._handle = self.path.open("ab", buffering=1 << 16)
+        atexit.register(self.close)
 
     def _slug(self) -> str:
-        safe = "".join(ch if ch.isalnum() or ch in ("_", "-") else "_" for ch in self.run_name)
+        if self.run_name.isascii():
+            safe = self.run_name.translate(_SLUG_TABLE)
+        else:
+            safe = "".join(ch if ch.isalnum() or ch in ("_", "-") else "_" for ch in self.run_name)
         return safe or "run"
 
-    def send(self, event: object) -> None:
-        payload = getattr(event, "payload", {})
-        entry = {
-            "ts": getattr(event, "timestamp", None).isoformat() if getattr(event, "timestamp", None) else None,
-            "run_id": self.run_id,
-            "run_name": self.run_name,
-            "runtime": getattr(event, "runtime", None),
-            "event_type": getattr(event, "event_type", None),
-            "payload": payload,
+    def send(self, event: Event) -> None:
+        self._write(_dumps_line(self._entry(event)))
+
+    def send_many(self, events: Iterable[Event]) -> None:
+        """Serialize a batch of events and append them as a single record block."""
+        block = b"".join(_dumps_line(self._entry(event)) for event in events)
+        if block:
+            self._write(block)
+
+    def _entry(self, event: Event) -> dict:
+        return {
+            "ts": event.timestamp,
+            **self._run_fields,
+            "runtime": event.runtime,
+            "event_type": event.event_type,
+            "payload": event.payload,
         }
-        line = json.dumps(entry, ensure_ascii=True)
+
+    def close(self) -> None:
+        """Flush and close the log file; later sends are ignored."""
         with self._lock:
-            with self.path.open("a", encoding="utf-8") as handle:
-                handle.write(line + "\n")
+            if self._closed:
+                return
+            self._closed = True
+            self._handle.close()
+
+    def _write(self, data: bytes) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._handle.write(data)
+            self._handle.flush()
+
+
+def _dumps_line(entry: dict) -> bytes:
+    """Serialize one JSONL record (newline included) as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(entry, ensure_ascii=True, default=_json_default) + "\n").encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -5,13 +5,16 @@ tasks from the shared ``agent_tasks`` queue and emits results to ``RESULTS``.
 """
 from __future__ import annotations
 
+import os
 import threading
-from typing import Iterable, Set
+from pathlib import Path
+from typing import Any, Coroutine, Iterable, Optional, Set, Tuple
 
 import pika
 from core.schemas.contracts import AgentType, ResultMessage, TaskMessage, TaskStatus
 from core.observability.emitter import emit_runtime_event
 from core.observability.agentops_tracker import get_tracker
+from agents.common.llm_gateway import get_llm_loop
 
 try:
     from opentelemetry import context as otel_context
@@ -22,6 +25,9 @@ from core.runtime.retry import RetryableError, TaskInputError, get_retry_count,
 TASK_EXCHANGE = "tasks_exchange"
 RESULTS_ROUTING_KEY = "RESULTS"
 
+# Directories this process has already created; saves a stat chain per artifact write.
+_KNOWN_DIRS: Set[Path] = set()
+
 
 class AgentWorkerBase(threading.Thread):
     queue_name = "agent_tasks"
@@ -40,16 +46,52 @@ class AgentWorkerBase(threading.Thread):
             return False
         return agent_type in self.handled_types
 
+    def run_async(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the shared LLM event loop and block for its result.
+        Workers use this instead of asyncio.run() so no task builds and tears down its own
+        loop, and gateway HTTP clients keep their connection pools across tasks.
+        """
+        return get_llm_loop().run(coro).result()
+
+    def run_llm(self, messages: Any, config: Any) -> Any:
+        """Blocking generate() on this worker's gateway on the shared LLM loop."""
+        return get_llm_loop().submit(self.gateway, messages, config).result()  # type: ignore[attr-defined]
+
     def handle_task(self, task: TaskMessage) -> ResultMessage:  # pragma: no cover - overridden
         raise NotImplementedError
 
-    def _publish_result(self, ch: pika.adapters.blocking_connection.BlockingChannel, result: ResultMessage) -> None:
-        ch.basic_publish(
-            exchange=TASK_EXCHANGE,
-            routing_key=RESULTS_ROUTING_KEY,
-            body=result.model_dump_json().encode(),
-            properties=pika.BasicProperties(content_type="application/json"),
-        )
+    def execute(self, task: TaskMessage) -> Tuple[str, Optional[ResultMessage]]:
+        """
+        Run handle_task for an already-routed task with tracing attached.
+        Returns ("result", message), ("drop", None) for bad input, or ("retry", None).
+        Safe to call off the consumer thread; it never touches the channel and never raises.
+        """
+        token = None
+        try:
+            emit_runtime_event(
+                runtime=self.runtime_name,
+                event_type="task_received",
+                payload={"task_id": str(task.task_id), "agent": task.task_type.value},
+            )
+            otel_ctx = get_tracker().get_otel_context()
+            if otel_context is not None and otel_ctx is not None:
+                token = otel_context.attach(otel_ctx)
+            return "result", self.handle_task(task)
+        except TaskInputError:
+            return "drop", None
+        except RetryableError:
+            return "retry", None
+        except Exception as exc:  # noqa: BLE001
+            return "result", ResultMessage(
+                task_id=task.task_id,
+                correlation_id=task.correlation_id,
+                status=TaskStatus.FAILURE,
+                log_output=f"Unhandled agent error: {exc}",
+            )
+        finally:
+            if token is not None and otel_context is not None:
+                otel_context.detach(token)
 
     def run(self) -> None:
         with pika.BlockingConnection(self.connection_params) as conn:
@@ -68,43 +110,67 @@ class AgentWorkerBase(threading.Thread):
                 if not self.should_handle(task):
                     ch.basic_nack(method.delivery_tag, requeue=True)
                     continue
-                emit_runtime_event(
-                    runtime=self.runtime_name,
-                    event_type="task_received",
-                    payload={"task_id": str(task.task_id), "agent": task.task_type.value},
-                )
-                otel_ctx = get_tracker().get_otel_context()
-                token = None
-                if otel_context is not None and otel_ctx is not None:
-                    token = otel_context.attach(otel_ctx)
-                try:
-                    result = self.handle_task(task)
-                except TaskInputError:
-                    ch.basic_nack(method.delivery_tag, requeue=False)
-                    continue
-                except RetryableError as exc:
-                    retry_count = get_retry_count(props)
-                    if retry_count < MAX_RETRIES:
-                        headers = next_retry_headers(props)
-                        ch.basic_publish(
-                            exchange=TASK_EXCHANGE,
-                            routing_key=task.entity_type.value,
-                            body=body,
-                            properties=pika.BasicProperties(content_type="application/json", headers=headers),
-                        )
-                        ch.basic_ack(method.delivery_tag)
-                    else:
-                        ch.basic_nack(method.delivery_tag, requeue=False)
-                    continue
-                except Exception as exc:  # noqa: BLE001
-                    result = ResultMessage(
-                        task_id=task.task_id,
-                        correlation_id=task.correlation_id,
-                        status=TaskStatus.FAILURE,
-                        log_output=f"Unhandled agent error: {exc}",
-                    )
-                finally:
-                    if token is not None and otel_context is not None:
-                        otel_context.detach(token)
-                self._publish_result(ch, result)
-                ch.basic_ack(method.delivery_tag)
+                outcome, result = self.execute(task)
+                settle_task(ch, method, props, body, task, outcome, result)
+
+
+def settle_task(
+    ch: pika.adapters.blocking_connection.BlockingChannel,
+    method: Any,
+    props: pika.BasicProperties,
+    body: bytes,
+    task: TaskMessage,
+    outcome: str,
+    result: Optional[ResultMessage],
+) -> None:
+    """Ack/nack/republish a delivery according to an AgentWorkerBase.execute outcome."""
+    if outcome == "drop":
+        ch.basic_nack(method.delivery_tag, requeue=False)
+        return
+    if outcome == "retry":
+        retry_count = get_retry_count(props)
+        if retry_count < MAX_RETRIES:
+            headers = next_retry_headers(props)
+            ch.basic_publish(
+                exchange=TASK_EXCHANGE,
+                routing_key=task.entity_type.value,
+                body=body,
+                properties=pika.BasicProperties(content_type="application/json", headers=headers),
+            )
+            ch.basic_ack(method.delivery_tag)
+        else:
+            ch.basic_nack(method.delivery_tag, requeue=False)
+        return
+    ch.basic_publish(
+        exchange=TASK_EXCHANGE,
+        routing_key=RESULTS_ROUTING_KEY,
+        body=result.model_dump_json().encode(),  # type: ignore[union-attr]
+        properties=pika.BasicProperties(content_type="application/json"),
+    )
+    ch.basic_ack(method.delivery_tag)
+
+
+def ensure_dir(directory: Path) -> None:
+    """mkdir -p, skipped for directories this process already created."""
+    if directory in _KNOWN_DIRS:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(directory)
+
+
+def write_text_fast(path: Path, text: str) -> None:
+    """Write UTF-8 text with a single open/write/close (no fsync), creating the parent if needed."""
+    data = text.encode("utf-8")
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    except FileNotFoundError:
+        # Parent was removed (e.g. artifacts reset between runs); forget it and recreate.
+        _KNOWN_DIRS.discard(path.parent)
+        ensure_dir(path.parent)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -0,0 +1,96 @@
+"""
+Opt-in exact-match cache for LLM responses (enable with LLM_CACHE=1).
+Entries are keyed by provider, model, max_tokens, temperature and both prompts, and stored as
+JSON under artifacts/.llm_cache so reruns of an unchanged node skip the provider call.
+Note that a retry with an identical prompt replays the cached response.
+Hits are still recorded with the tracker, as zero-cost calls tagged ``cached: true``.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from core.observability.agentops_tracker import get_tracker
+
+try:
+    from adapters.llm.gateway import ModelResponse  # type: ignore
+except Exception:  # noqa: BLE001
+    ModelResponse = None  # type: ignore
+
+DEFAULT_CACHE_DIR = Path("artifacts/.llm_cache")
+_KEY_VERSION = b"llm-cache-v2\x00"
+
+
+def cache_enabled() -> bool:
+    return os.getenv("LLM_CACHE") == "1" and ModelResponse is not None
+
+
+def make_key(
+    system: str,
+    user: str,
+    temperature: Optional[float],
+    *,
+    model: str,
+    provider: str,
+    max_tokens: Optional[int],
+) -> str:
+    """Key over everything that shapes the completion; bump _KEY_VERSION when the inputs change."""
+    digest = hashlib.blake2b(_KEY_VERSION, digest_size=20)
+    for part in (provider, model, str(max_tokens), str(temperature), system, user):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def lookup(key: str) -> Optional["ModelResponse"]:
+    """Return the cached response for key, or None on a miss / when caching is off."""
+    if not cache_enabled():
+        return None
+    try:
+        return ModelResponse.model_validate_json(_entry_path(key).read_bytes())
+    except Exception:  # noqa: BLE001
+        # Missing or unreadable entries are just misses.
+        return None
+
+
+def store(key: str, resp: object) -> None:
+    """Persist a response; best-effort, never raises."""
+    if not cache_enabled() or not hasattr(resp, "model_dump_json"):
+        return
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(resp.model_dump_json())
+        tmp.replace(path)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def record_hit(resp: "ModelResponse", *, agent: str, node_id: Optional[str], stage: str) -> None:
+    """Log a cache hit as a zero-token, zero-cost LLM call so usage logs still count it."""
+    try:
+        get_tracker().log_llm_call_async(
+            agent=agent,
+            node_id=node_id,
+            model=getattr(resp, "model_name", "unknown"),
+            provider=getattr(resp, "provider", "unknown"),
+            prompt_tokens=0,
+            completion_tokens=0,
+            total_tokens=0,
+            estimated_cost_usd=0.0,
+            metadata={"stage": stage, "cached": True},
+        )
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _entry_path(key: str) -> Path:
+    base = Path(os.getenv("LLM_CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+    return base / key[:2] / f"{key}.json"
+
+
+__all__ = ["cache_enabled", "make_key", "lookup", "store", "record_hit"]
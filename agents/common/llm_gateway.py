@@ -4,8 +4,12 @@ Chooses provider based on env vars and returns a gateway instance or None.
 """
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import os
-from typing import Optional, Tuple
+import threading
+from functools import lru_cache
+from typing import Any, Coroutine, Dict, Optional, Tuple
 
 # External adapters live under adapters/llm to keep integration isolated.
 try:
@@ -22,33 +26,104 @@ except Exception:  # noqa: BLE001
 GatewayTuple = Tuple[object, object, object]
 
 
+_gateways: Dict[GatewayTuple, object] = {}
+_gateways_lock = threading.Lock()
+
+
 def init_llm_gateway() -> Optional[object]:
-    """Initialize an LLM gateway if env vars are set; otherwise return None."""
-    if os.getenv("USE_LLM") != "1":
+    """
+    Return the process-wide LLM gateway for the current env config, or None if LLMs are disabled.
+    Workers in one process share the instance (and its HTTP connection pool); drive it only
+    through get_llm_loop(), since async clients bind to the loop that first uses them.
+    """
+    spec = _resolve_gateway_spec(
+        os.getenv("USE_LLM"),
+        os.getenv("LLM_PROVIDER", "openai").lower(),
+        os.getenv("GROQ_API_KEY"),
+        os.getenv("GROQ_MODEL", "llama-3.1-8b-instant"),
+        os.getenv("OPENAI_API_KEY"),
+        os.getenv("OPENAI_MODEL", "gpt-4.1-mini"),
+    )
+    if spec is None:
         return None
+    gateway = _gateways.get(spec)
+    if gateway is not None:
+        return gateway
+    with _gateways_lock:
+        gateway = _gateways.get(spec)
+        if gateway is None:
+            factory, api_key, model = spec
+            try:
+                gateway = factory(api_key=api_key, model=model)
+            except Exception:  # noqa: BLE001
+                return None
+            _gateways[spec] = gateway
+    return gateway
+
 
-    provider = os.getenv("LLM_PROVIDER", "openai").lower()
+@lru_cache(maxsize=8)
+def _resolve_gateway_spec(
+    use_llm: Optional[str],
+    provider: str,
+    groq_key: Optional[str],
+    groq_model: str,
+    openai_key: Optional[str],
+    openai_model: str,
+) -> Optional[GatewayTuple]:
+    """Pick (gateway class, api key, model) for an env snapshot."""
+    if use_llm != "1":
+        return None
     if provider == "groq" and GroqGateway:
-        api_key = os.getenv("GROQ_API_KEY")
-        model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
-        if not api_key:
-            return None
-        try:
-            return GroqGateway(api_key=api_key, model=model)
-        except Exception:  # noqa: BLE001
+        if not groq_key:
             return None
-
+        return GroqGateway, groq_key, groq_model
     if OpenAIGateway:
-        api_key = os.getenv("OPENAI_API_KEY")
-        model = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-        if not api_key:
-            return None
-        try:
-            return OpenAIGateway(api_key=api_key, model=model)
-        except Exception:  # noqa: BLE001
+        if not openai_key:
             return None
-
+        return OpenAIGateway, openai_key, openai_model
     return None
 
 
-__all__ = ["init_llm_gateway", "Message", "MessageRole", "GenerationConfig"]
+class LLMLoop:
+    """
+    Runs gateway calls for every worker on one long-lived event loop thread.
+
+    Worker threads hand coroutines to ``run``/``submit`` and block on the returned
+    concurrent future, so no task pays for building and tearing down its own loop and
+    concurrent tasks are in flight together. Calls are not coalesced: each ``submit``
+    is exactly one ``gateway.generate()`` request.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-loop", daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def submit(self, gateway: object, messages: Any, config: Any) -> concurrent.futures.Future:
+        """Schedule a single generate() call from any thread."""
+        return self.run(self.generate(gateway, messages, config))
+
+    async def generate(self, gateway: object, messages: Any, config: Any) -> Any:
+        """Await a generate() call; must run on the shared loop (use ``run``/``submit`` elsewhere)."""
+        return await gateway.generate(messages=messages, config=config)  # type: ignore[attr-defined]
+
+
+_llm_loop: Optional[LLMLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_llm_loop() -> LLMLoop:
+    """Return the process-wide LLMLoop, starting its loop thread on first use."""
+    global _llm_loop
+    if _llm_loop is None:
+        with _loop_lock:
+            if _llm_loop is None:
+                _llm_loop = LLMLoop()
+    return _llm_loop
+
+
+__all__ = ["init_llm_gateway", "get_llm_loop", "LLMLoop", "Message", "MessageRole", "GenerationConfig"]
@@ -0,0 +1,79 @@
+"""
+Port-list formatting shared by the implementation and testbench prompts.
+Interfaces arrive as lists of {"direction", "name", "width"} dicts; width may be
+an int, a numeric string, or a parameter expression such as "WIDTH".
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Tuple
+
+# (direction, name, raw width) per signal; hashable key for port-block memoization.
+PortKey = Tuple[Tuple[str, str, Any], ...]
+
+_PORT_LINE = "- {} {} {}{}".format
+
+
+def width_expr(raw: Any) -> str:
+    if isinstance(raw, bool):
+        return "1"
+    if isinstance(raw, (int, float)):
+        return str(int(raw))
+    if isinstance(raw, str) and raw.strip():
+        return raw.strip()
+    return "1"
+
+
+def width_int(raw: Any) -> int | None:
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, float):
+        return int(raw)
+    if isinstance(raw, str):
+        text = raw.strip()
+        if text.isdigit():
+            return int(text)
+    return None
+
+
+def width_decl(raw: Any) -> str:
+    """Packed range for a declaration ("[7:0] ", "[(W)-1:0] "), or "" for a single bit."""
+    bits = width_int(raw)
+    if bits and bits > 1:
+        return f"[{bits - 1}:0] "
+    expr = width_expr(raw)
+    if expr not in ("1", ""):
+        return f"[({expr})-1:0] "
+    return ""
+
+
+def port_key(iface: Iterable[dict]) -> PortKey:
+    return tuple((sig["direction"].lower(), sig["name"], sig.get("width", 1)) for sig in iface)
+
+
+def format_port_block(iface: Iterable[dict], style: str) -> str:
+    """
+    Prompt-ready "- <port>" lines for an interface, memoized by interface shape.
+    style="rtl" declares every port as logic; style="tb" uses reg for driven
+    signals and wire for DUT outputs.
+    """
+    key = port_key(iface)
+    try:
+        return _format_port_block(key, style)
+    except TypeError:
+        # Unhashable width value (e.g. a list); format without caching.
+        return _format_port_block.__wrapped__(key, style)
+
+
+@lru_cache(maxsize=512)
+def _format_port_block(key: PortKey, style: str) -> str:
+    tb = style == "tb"
+    return "\n".join(
+        _PORT_LINE(dir_kw, ("wire" if dir_kw == "output" else "reg") if tb else "logic", width_decl(raw), name)
+        for dir_kw, name, raw in key
+    )
+
+
+__all__ = ["PortKey", "width_expr", "width_int", "width_decl", "port_key", "format_port_block"]
@@ -0,0 +1,51 @@
+"""
+Post-processing for LLM-generated RTL and testbenches.
+Strips stray fences/directives and rewrites SystemVerilog-only keywords so the
+output builds under Verilog-2001 toolchains (Icarus, Verilator in 2001 mode).
+"""
+from __future__ import annotations
+
+import re
+
+from agents.common.tb_sanitizer import sanitize_testbench
+
+_FENCE_LINE_RE = re.compile(r"^[^\S\n]*(?:```|`systemverilog)[^\n]*(?:\n|$)", re.MULTILINE)
+_RTL_REWRITE_MAP = {"always_ff": "always", "always_comb": "always @*", "logic": "wire"}
+_RTL_REWRITE_RE = re.compile(r"\b(?:always_ff|always_comb|logic)\b")
+_RTL_REWRITE_OUTPUT_RE = re.compile(r"\boutput\s+(?:logic|wire)\b|\b(?:always_ff|always_comb|logic)\b")
+_STOP_RE = re.compile(r"\$stop\s*(\([^;]*\))?\s*;")
+_PLUSARGS_DUMP_RE = re.compile(r"\$value\$plusargs\s*\(\s*(['\"])DUMP\1\s*\)")
+
+
+def sanitize_verilog(source: str, *, kind: str) -> str:
+    """
+    Clean generated source of the given kind ("rtl" or "tb"); other kinds pass through.
+    Each rewrite is a single regex pass over the text rather than a chain of
+    whole-text replace() copies.
+    """
+    text = _FENCE_LINE_RE.sub("", source) if "`" in source else source
+    if kind == "rtl":
+        # Outputs driven from always blocks must be regs; everything else is a whole-word keyword swap.
+        pattern = _RTL_REWRITE_OUTPUT_RE if "always" in text else _RTL_REWRITE_RE
+        return pattern.sub(_rtl_rewrite, text)
+    if kind == "tb":
+        text = text.replace("logic", "reg")
+        text = _STOP_RE.sub("$finish;", text)
+        # Fix common LLM mistake: $value$plusargs("DUMP") is invalid for Icarus.
+        text = _PLUSARGS_DUMP_RE.sub(r"$test$plusargs(\1DUMP\1)", text)
+        if not text.strip().startswith("`timescale"):
+            text = "`timescale 1ns/1ps\n\n" + text
+        if "endmodule" not in text:
+            text = text.rstrip() + "\nendmodule\n"
+        return sanitize_testbench(text)
+    return source
+
+
+def _rtl_rewrite(match: re.Match[str]) -> str:
+    token = match.group(0)
+    if token.startswith("output"):
+        return "output reg"
+    return _RTL_REWRITE_MAP[token]
+
+
+__all__ = ["sanitize_verilog"]
@@ -4,19 +4,21 @@ Fails hard if the LLM or inputs are unavailable.
 """
 from __future__ import annotations
 
-import asyncio
+import functools
 import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from pathlib import Path
+from typing import Callable
 
 from core.schemas.contracts import AgentType, ResultMessage, TaskMessage, TaskStatus
 from core.observability.emitter import emit_runtime_event
 from agents.common.base import AgentWorkerBase
 from agents.common.llm_gateway import GenerationConfig, Message, MessageRole, init_llm_gateway
-from agents.common.tb_sanitizer import sanitize_testbench
+from agents.common.verilog_sanitizer import sanitize_verilog
 from core.observability.agentops_tracker import get_tracker
+from core.runtime.json_codec import dumps_indented
 from core.runtime.retry import TaskInputError
 
 
@@ -52,15 +54,24 @@ class DebugWorker(AgentWorkerBase):
         debug_reason = str(ctx.get("debug_reason", "")).strip().lower() or "sim"
         task_memory_root = Path("artifacts/task_memory") / node_id
 
-        rtl_text = rtl_path.read_text() if rtl_path.exists() else ""
-        tb_text = tb_path.read_text() if tb_path.exists() else ""
+        # Cap prompt inputs: code keeps its head (module header/ports), logs keep their tail (final errors).
+        max_code_bytes = int(os.getenv("DEBUG_MAX_CODE_BYTES", "131072"))
+        max_log_bytes = int(os.getenv("DEBUG_MAX_LOG_BYTES", "65536"))
 
         # Attempt-aware logs/insights. Fall back to legacy stage names when attempt is missing.
-        lint_log = _read_optional_text(task_memory_root / _stage_dir("lint", sim_attempt) / "log.txt")
-        sim_log = _read_optional_text(task_memory_root / _stage_dir("sim", sim_attempt) / "log.txt")
-        tb_lint_log = _read_optional_text(task_memory_root / _stage_dir("tb_lint", sim_attempt) / "log.txt")
-        distilled = _read_optional_text(task_memory_root / _stage_dir("distill", sim_attempt) / "distilled_dataset.json")
-        reflection = _read_optional_text(task_memory_root / _stage_dir("reflect", sim_attempt) / "reflection_insights.json")
+        # The reads are independent, so they are issued concurrently.
+        reads = [
+            (rtl_path, max_code_bytes, False),
+            (tb_path, max_code_bytes, False),
+            (task_memory_root / _stage_dir("lint", sim_attempt) / "log.txt", max_log_bytes, True),
+            (task_memory_root / _stage_dir("sim", sim_attempt) / "log.txt", max_log_bytes, True),
+            (task_memory_root / _stage_dir("tb_lint", sim_attempt) / "log.txt", max_log_bytes, True),
+            (task_memory_root / _stage_dir("distill", sim_attempt) / "distilled_dataset.json", max_log_bytes, True),
+            (task_memory_root / _stage_dir("reflect", sim_attempt) / "reflection_insights.json", max_log_bytes, True),
+        ]
+        rtl_text, tb_text, lint_log, sim_log, tb_lint_log, distilled, reflection = _READ_POOL.map(
+            lambda args: _read_capped_text(args[0], args[1], tail=args[2]), reads
+        )
 
         system = (
             "You are a Debug Agent for an RTL design pipeline. Your job is to PATCH CODE.\n"
@@ -116,21 +127,22 @@ class DebugWorker(AgentWorkerBase):
         temperature = float(os.getenv("LLM_TEMPERATURE_DEBUG", "0.2"))
         cfg = GenerationConfig(temperature=temperature, max_tokens=max_tokens)
 
-        stage_dir = Path("artifacts/task_memory") / node_id / _stage_dir("debug", sim_attempt)
+        stage_dir = task_memory_root / _stage_dir("debug", sim_attempt)
         try:
             stage_dir.mkdir(parents=True, exist_ok=True)
-            prompt_payload = [
-                {"role": getattr(m.role, "value", str(m.role)), "content": m.content} for m in msgs  # type: ignore[attr-defined]
-            ]
-            (stage_dir / "prompt_messages.json").write_text(json.dumps(prompt_payload, indent=2), encoding="utf-8")
         except Exception:
             pass
+        prompt_payload = [
+            {"role": getattr(m.role, "value", str(m.role)), "content": m.content} for m in msgs  # type: ignore[attr-defined]
+        ]
+        # Trace artifacts are written off-thread so the dump overlaps the LLM round trip.
+        _write_trace_artifact(stage_dir / "prompt_messages.json", functools.partial(dumps_indented, prompt_payload))
 
         max_attempts = int(os.getenv("DEBUG_MAX_ATTEMPTS", "3"))
         last_error: str | None = None
         for llm_attempt in range(1, max_attempts + 1):
             try:
-                resp = asyncio.run(self.gateway.generate(messages=msgs, config=cfg))  # type: ignore[arg-type]
+                resp = self.run_llm(msgs, cfg)
             except Exception as exc:  # noqa: BLE001
                 last_error = f"Debug LLM call failed: {exc}"
                 if llm_attempt < max_attempts:
@@ -144,7 +156,7 @@ class DebugWorker(AgentWorkerBase):
 
             tracker = get_tracker()
             try:
-                tracker.log_llm_call(
+                tracker.log_llm_call_async(
                     agent=self.runtime_name,
                     node_id=node_id,
                     model=getattr(resp, "model_name", "unknown"),
@@ -158,20 +170,14 @@ class DebugWorker(AgentWorkerBase):
             except Exception:
                 pass
 
-            try:
-                (stage_dir / f"llm_raw_attempt{llm_attempt}.txt").write_text(resp.content, encoding="utf-8")
-            except Exception:
-                pass
+            _write_trace_artifact(stage_dir / f"llm_raw_attempt{llm_attempt}.txt", resp.content)
 
             parsed = _safe_json(resp.content)
             if parsed:
-                try:
-                    (stage_dir / f"llm_parsed_attempt{llm_attempt}.json").write_text(
-                        json.dumps(parsed, indent=2),
-                        encoding="utf-8",
-                    )
-                except Exception:
-                    pass
+                _write_trace_artifact(
+                    stage_dir / f"llm_parsed_attempt{llm_attempt}.json",
+                    functools.partial(dumps_indented, parsed),
+                )
                 try:
                     write_result = _apply_debug_patch(
                         node_id=node_id,
@@ -243,6 +249,19 @@ class DebugWorker(AgentWorkerBase):
         )
 
 
+def _write_trace_artifact(path: Path, content: str | Callable[[], str]) -> None:
+    """Best-effort background write; content may be a thunk so serialization also leaves the task thread."""
+
+    def _write() -> None:
+        try:
+            text = content() if callable(content) else content
+            path.write_text(text, encoding="utf-8")
+        except Exception:
+            pass
+
+    _TRACE_WRITER.submit(_write)
+
+
 def _safe_json(text: str):
     try:
         return json.loads(text)
@@ -258,7 +277,8 @@ def _safe_json(text: str):
     return None
 
 
-_NO_FENCE_PREFIXES = ("```", "`systemverilog")
+_READ_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="debug-read")
+_TRACE_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-trace")
 
 
 def _parse_attempt(value) -> int | None:
@@ -271,48 +291,31 @@ def _parse_attempt(value) -> int | None:
     return attempt if attempt > 0 else None
 
 
+@functools.lru_cache(maxsize=64)
 def _stage_dir(kind: str, attempt: int | None) -> str:
     if attempt is None:
         return kind
     return f"{kind}_attempt{attempt}"
 
 
-def _read_optional_text(path: Path) -> str:
+def _read_capped_text(path: Path, max_bytes: int, *, tail: bool = True) -> str:
+    """
+    Read at most max_bytes from path (the tail by default, otherwise the head).
+    Missing/unreadable files yield "". Truncation is marked inline so the LLM
+    knows the evidence is partial.
+    """
     try:
-        if path.exists():
-            return path.read_text()
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if max_bytes <= 0 or size <= max_bytes:
+                return handle.read().decode("utf-8", errors="replace")
+            if tail:
+                handle.seek(size - max_bytes)
+            data = handle.read(max_bytes).decode("utf-8", errors="replace")
     except Exception:
         return ""
-    return ""
-
-
-def _sanitize_verilog(source: str, *, kind: str) -> str:
-    lines = []
-    for line in source.splitlines():
-        stripped = line.strip()
-        if stripped.startswith(_NO_FENCE_PREFIXES):
-            continue
-        lines.append(line)
-    text = "\n".join(lines)
-    if kind == "rtl":
-        text = text.replace("always_ff", "always")
-        text = text.replace("always_comb", "always @*")
-        if "always" in text:
-            text = text.replace("output logic", "output reg")
-            text = text.replace("output wire", "output reg")
-        text = text.replace("logic", "wire")
-        return text
-    if kind == "tb":
-        text = text.replace("logic", "reg")
-        text = re.sub(r"\$stop\s*(\([^;]*\))?\s*;", "$finish;", text)
-        # Fix common LLM mistake: $value$plusargs("DUMP") is invalid for Icarus.
-        text = re.sub(r"\$value\$plusargs\s*\(\s*(['\"])DUMP\1\s*\)", r"$test$plusargs(\1DUMP\1)", text)
-        if not text.strip().startswith("`timescale"):
-            text = "`timescale 1ns/1ps\n\n" + text
-        if "endmodule" not in text:
-            text = text.rstrip() + "\nendmodule\n"
-        return sanitize_testbench(text)
-    return source
+    marker = f"[...truncated {size - max_bytes} bytes...]"
+    return f"{marker}\n{data}" if tail else f"{data}\n{marker}"
 
 
 def _apply_debug_patch(
@@ -339,16 +342,19 @@ def _apply_debug_patch(
     wrote_tb = False
     rtl_sha = None
     tb_sha = None
+    rtl_bytes = b""
+    tb_bytes = b""
 
     if "rtl" in touched_norm:
         rtl_lines = payload.get("rtl_lines")
         if not isinstance(rtl_lines, list) or not rtl_lines:
             raise ValueError("touched_files includes 'rtl' but rtl_lines is missing/empty")
         rtl_source = "\n".join(str(line) for line in rtl_lines)
-        rtl_source = _sanitize_verilog(rtl_source, kind="rtl")
+        rtl_source = sanitize_verilog(rtl_source, kind="rtl")
         rtl_path.parent.mkdir(parents=True, exist_ok=True)
-        rtl_path.write_text(rtl_source)
-        rtl_sha = sha256(rtl_source.encode()).hexdigest()
+        rtl_bytes = rtl_source.encode("utf-8")
+        rtl_path.write_bytes(rtl_bytes)
+        rtl_sha = sha256(rtl_bytes).hexdigest()
         wrote_rtl = True
 
     if "tb" in touched_norm:
@@ -356,10 +362,11 @@ def _apply_debug_patch(
         if not isinstance(tb_lines, list) or not tb_lines:
             raise ValueError("touched_files includes 'tb' but tb_lines is missing/empty")
         tb_source = "\n".join(str(line) for line in tb_lines)
-        tb_source = _sanitize_verilog(tb_source, kind="tb")
+        tb_source = sanitize_verilog(tb_source, kind="tb")
         tb_path.parent.mkdir(parents=True, exist_ok=True)
-        tb_path.write_text(tb_source)
-        tb_sha = sha256(tb_source.encode()).hexdigest()
+        tb_bytes = tb_source.encode("utf-8")
+        tb_path.write_bytes(tb_bytes)
+        tb_sha = sha256(tb_bytes).hexdigest()
         wrote_tb = True
 
     # Snapshot patched artifacts under task_memory for traceability across attempts.
@@ -367,9 +374,9 @@ def _apply_debug_patch(
         stage_dir = Path("artifacts/task_memory") / node_id / _stage_dir("debug", attempt)
         stage_dir.mkdir(parents=True, exist_ok=True)
         if wrote_rtl:
-            (stage_dir / f"patched_{node_id}.sv").write_text(rtl_path.read_text())
+            (stage_dir / f"patched_{node_id}.sv").write_bytes(rtl_bytes)
         if wrote_tb:
-            (stage_dir / f"patched_{node_id}_tb.sv").write_text(tb_path.read_text())
+            (stage_dir / f"patched_{node_id}_tb.sv").write_bytes(tb_bytes)
 
     touched_out = []
     if wrote_rtl:
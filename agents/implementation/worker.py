@@ -4,7 +4,6 @@ Fails hard if the LLM is unavailable or generation fails.
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import os
 from pathlib import Path
@@ -12,12 +11,36 @@ from typing import List, Tuple
 
 from core.schemas.contracts import AgentType, ResultMessage, TaskMessage, TaskStatus
 from core.observability.emitter import emit_runtime_event
-from agents.common.base import AgentWorkerBase
-from agents.common.llm_gateway import init_llm_gateway, Message, MessageRole, GenerationConfig
+from agents.common.base import AgentWorkerBase, ensure_dir, write_text_fast
+from agents.common import llm_cache
+from agents.common.sv_format import format_port_block
+from agents.common.llm_gateway import get_llm_loop, init_llm_gateway, Message, MessageRole, GenerationConfig
+from agents.common.verilog_sanitizer import sanitize_verilog
 from core.observability.agentops_tracker import get_tracker
 from core.runtime.retry import RetryableError, TaskInputError, is_transient_error
 
 
+# Static system prompts live at module scope so every request sends a byte-identical
+# leading message, which providers with automatic prefix caching can reuse.
+_IMPL_SYSTEM_PROMPT = (
+    "You are an RTL Implementation Agent. Generate synthesizable Verilog-2001.\n"
+    "Rules: no code fences, no `systemverilog` directive, avoid SystemVerilog-only keywords (no always_ff/always_comb/logic/interfaces). "
+    "If no clock is provided, emit pure combinational logic with continuous assigns only. "
+    "If sequential logic is used, declare outputs as reg and drive them in always blocks; no delays inside sequential logic. "
+    "Implement the behavior described by the spec summary; do not invent features not stated. "
+    "Prefer lint-clean RTL under Verilator: avoid constant comparisons due to bit-width (e.g., don't compare a 3-bit signal to > 7), "
+    "avoid unused signals, and avoid self-assignments like `x <= x`."
+)
+_IMPL_SYSTEM_PROMPT_WITH_CHILDREN = _IMPL_SYSTEM_PROMPT + (
+    "\nIntegration rules: If child modules are provided, you MUST instantiate them and wire their ports "
+    "exactly as specified by the connections list. Do not invent ports or rename them. "
+    "Use the top-level module ports when a connection endpoint references the current node. "
+    "If a child input has no connection, tie it to 0 (width-safe). "
+    "If a child output has no connection, it may be left unconnected. "
+    "If a connection is between two child ports, introduce an internal wire with a clear name."
+)
+
+
 class ImplementationWorker(AgentWorkerBase):
     handled_types = {AgentType.IMPLEMENTATION}
     runtime_name = "agent_implementation"
@@ -26,30 +49,6 @@ class ImplementationWorker(AgentWorkerBase):
         super().__init__(connection_params, stop_event)
         self.gateway = init_llm_gateway()
 
-    def _width_expr(self, sig) -> str:
-        raw = sig.get("width", 1)
-        if isinstance(raw, bool):
-            return "1"
-        if isinstance(raw, (int, float)):
-            return str(int(raw))
-        if isinstance(raw, str) and raw.strip():
-            return raw.strip()
-        return "1"
-
-    def _width_int(self, sig) -> int | None:
-        raw = sig.get("width", 1)
-        if isinstance(raw, bool):
-            return None
-        if isinstance(raw, int):
-            return raw
-        if isinstance(raw, float):
-            return int(raw)
-        if isinstance(raw, str):
-            text = raw.strip()
-            if text.isdigit():
-                return int(text)
-        return None
-
     def handle_task(self, task: TaskMessage) -> ResultMessage:
         ctx = task.context
         if "rtl_path" not in ctx:
@@ -60,7 +59,7 @@ class ImplementationWorker(AgentWorkerBase):
             raise TaskInputError("Missing node_id in task context.")
         node_id = ctx["node_id"]
         rtl_path = Path(ctx["rtl_path"])
-        rtl_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(rtl_path.parent)
 
         iface_signals = ctx["interface"]["signals"]
         if not isinstance(iface_signals, list) or not iface_signals:
@@ -75,7 +74,7 @@ class ImplementationWorker(AgentWorkerBase):
                 log_output="LLM gateway unavailable; set USE_LLM=1 and configure provider credentials.",
             )
         try:
-            rtl_source, log_output = asyncio.run(self._llm_generate_impl(ctx, node_id, iface_signals))
+            rtl_source, log_output = self.run_async(self._llm_generate_impl(ctx, node_id, iface_signals))
         except Exception as exc:  # noqa: BLE001
             if is_transient_error(exc):
                 raise RetryableError(f"LLM generation transient error: {exc}")
@@ -96,22 +95,10 @@ class ImplementationWorker(AgentWorkerBase):
             )
 
         # Sanitize for Verilog-only toolchains.
-        lines = []
-        for line in rtl_source.splitlines():
-            stripped = line.strip()
-            if stripped.startswith(("`systemverilog", "```")):
-                continue
-            lines.append(line)
-        rtl_source = "\n".join(lines)
-        rtl_source = rtl_source.replace("always_ff", "always")
-        rtl_source = rtl_source.replace("always_comb", "always @*")
-        if "always" in rtl_source:
-            rtl_source = rtl_source.replace("output logic", "output reg")
-            rtl_source = rtl_source.replace("output wire", "output reg")
-        rtl_source = rtl_source.replace("logic", "wire")
+        rtl_source = sanitize_verilog(rtl_source, kind="rtl")
 
         try:
-            rtl_path.write_text(rtl_source)
+            write_text_fast(rtl_path, rtl_source)
         except Exception as exc:  # noqa: BLE001
             return ResultMessage(
                 task_id=task.task_id,
@@ -134,18 +121,6 @@ class ImplementationWorker(AgentWorkerBase):
         )
 
     async def _llm_generate_impl(self, ctx, node_id: str, iface) -> Tuple[str, str]:
-        port_lines = []
-        for sig in iface:
-            dir_kw = sig["direction"].lower()
-            name = sig["name"]
-            width_expr = self._width_expr(sig)
-            width_int = self._width_int(sig)
-            if width_int and width_int > 1:
-                port_lines.append(f"{dir_kw} logic [{width_int-1}:0] {name}")
-            elif width_expr not in ("1", ""):
-                port_lines.append(f"{dir_kw} logic [({width_expr})-1:0] {name}")
-            else:
-                port_lines.append(f"{dir_kw} logic {name}")
         behavior = ctx.get("demo_behavior", "").strip()
         clocking = ctx.get("clocking", {})
         verification = ctx.get("verification", {})
@@ -153,27 +128,10 @@ class ImplementationWorker(AgentWorkerBase):
         children = ctx.get("children") or []
         child_interfaces = ctx.get("child_interfaces") or {}
         connections = ctx.get("connections") or []
-        system = (
-            "You are an RTL Implementation Agent. Generate synthesizable Verilog-2001.\n"
-            "Rules: no code fences, no `systemverilog` directive, avoid SystemVerilog-only keywords (no always_ff/always_comb/logic/interfaces). "
-            "If no clock is provided, emit pure combinational logic with continuous assigns only. "
-            "If sequential logic is used, declare outputs as reg and drive them in always blocks; no delays inside sequential logic. "
-            "Implement the behavior described by the spec summary; do not invent features not stated. "
-            "Prefer lint-clean RTL under Verilator: avoid constant comparisons due to bit-width (e.g., don't compare a 3-bit signal to > 7), "
-            "avoid unused signals, and avoid self-assignments like `x <= x`."
-        )
-        if children:
-            system += (
-                "\nIntegration rules: If child modules are provided, you MUST instantiate them and wire their ports "
-                "exactly as specified by the connections list. Do not invent ports or rename them. "
-                "Use the top-level module ports when a connection endpoint references the current node. "
-                "If a child input has no connection, tie it to 0 (width-safe). "
-                "If a child output has no connection, it may be left unconnected. "
-                "If a connection is between two child ports, introduce an internal wire with a clear name."
-            )
+        system = _IMPL_SYSTEM_PROMPT_WITH_CHILDREN if children else _IMPL_SYSTEM_PROMPT
         user = (
             f"Module name: {node_id}\n"
-            f"Ports:\n" + "\n".join(f"- {p}" for p in port_lines) + "\n"
+            f"Ports:\n{format_port_block(iface, 'rtl')}\n"
             f"Behavior summary:\n{behavior or 'None provided.'}\n"
             f"Clocking:\n{json.dumps(clocking, indent=2)}\n"
             f"Verification hints:\n{json.dumps(verification, indent=2)}\n"
@@ -190,10 +148,23 @@ class ImplementationWorker(AgentWorkerBase):
         max_tokens = int(os.getenv("LLM_MAX_TOKENS", 10000))
         temperature = float(os.getenv("LLM_TEMPERATURE", 0.2))
         cfg = GenerationConfig(temperature=temperature, max_tokens=max_tokens)
-        resp = await self.gateway.generate(messages=msgs, config=cfg)  # type: ignore[arg-type]
+        cache_key = llm_cache.make_key(
+            system,
+            user,
+            temperature,
+            model=getattr(self.gateway, "model_name", "unknown"),
+            provider=getattr(self.gateway, "provider", "unknown"),
+            max_tokens=max_tokens,
+        )
+        cached = llm_cache.lookup(cache_key)
+        if cached is not None:
+            llm_cache.record_hit(cached, agent=self.runtime_name, node_id=node_id, stage="implementation")
+            return cached.content, f"LLM cache hit ({cache_key[:12]})"
+        resp = await get_llm_loop().generate(self.gateway, msgs, cfg)
+        llm_cache.store(cache_key, resp)
         tracker = get_tracker()
         try:
-            tracker.log_llm_call(
+            tracker.log_llm_call_async(
                 agent=self.runtime_name,
                 node_id=node_id,
                 model=getattr(resp, "model_name", "unknown"),
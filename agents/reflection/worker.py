@@ -4,9 +4,9 @@ Fails hard if the LLM or distilled dataset is unavailable.
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from core.schemas.contracts import AgentType, ReflectionInsights, ResultMessage, TaskMessage, TaskStatus
@@ -14,9 +14,26 @@ from core.observability.emitter import emit_runtime_event
 from agents.common.base import AgentWorkerBase
 from agents.common.llm_gateway import GenerationConfig, Message, MessageRole, init_llm_gateway
 from core.observability.agentops_tracker import get_tracker
+from core.runtime import json_codec
 from core.runtime.retry import RetryableError, TaskInputError, is_transient_error
 
 
+# Constant instruction preamble; node-specific data goes in the user message only.
+_REFLECTION_SYSTEM_PROMPT = (
+    "You are a Reflection Agent for RTL verification. "
+    "Analyze the distilled simulation/log data and the full RTL/TB code to produce debugging insights. "
+    "Return JSON with keys: hypotheses (list of strings), likely_failure_points (list of strings), "
+    "recommended_probes (list of strings), confidence_score (0-1), analysis_notes (string). "
+    "Do NOT return objects inside the lists; every list entry must be a plain string. "
+    "Evidence anchoring is required: each hypothesis and likely_failure_point MUST include a bracketed "
+    "evidence citation referencing the provided data (e.g., [evidence: log_excerpt L12 'FAIL: ...'], "
+    "[evidence: waveform_excerpt signal=tb.dut.count time=6000], "
+    "[evidence: RTL L42 'always @(posedge clk...)']). "
+    "If evidence is insufficient, state that explicitly in the analysis_notes. "
+    "Do not include code fences or extra text."
+)
+
+
 class ReflectionWorker(AgentWorkerBase):
     handled_types = {AgentType.REFLECTION}
     runtime_name = "agent_reflection"
@@ -43,30 +60,26 @@ class ReflectionWorker(AgentWorkerBase):
         if not distill_path.exists():
             raise TaskInputError(f"Missing distilled dataset: {distill_path}")
 
-        distill_text = distill_path.read_text()
         rtl_path = Path(ctx.get("rtl_path", "")) if ctx.get("rtl_path") else Path("artifacts/generated/rtl") / f"{node_id}.sv"
         tb_path = Path(ctx.get("tb_path", "")) if ctx.get("tb_path") else rtl_path.with_name(f"{node_id}_tb.sv")
-        rtl_text = rtl_path.read_text() if rtl_path.exists() else f"<<RTL missing at {rtl_path}>>"
-        tb_text = tb_path.read_text() if tb_path.exists() else f"<<TB missing at {tb_path}>>"
-        system = (
-            "You are a Reflection Agent for RTL verification. "
-            "Analyze the distilled simulation/log data and the full RTL/TB code to produce debugging insights. "
-            "Return JSON with keys: hypotheses (list of strings), likely_failure_points (list of strings), "
-            "recommended_probes (list of strings), confidence_score (0-1), analysis_notes (string). "
-            "Do NOT return objects inside the lists; every list entry must be a plain string. "
-            "Evidence anchoring is required: each hypothesis and likely_failure_point MUST include a bracketed "
-            "evidence citation referencing the provided data (e.g., [evidence: log_excerpt L12 'FAIL: ...'], "
-            "[evidence: waveform_excerpt signal=tb.dut.count time=6000], "
-            "[evidence: RTL L42 'always @(posedge clk...)']). "
-            "If evidence is insufficient, state that explicitly in the analysis_notes. "
-            "Do not include code fences or extra text."
+        # The three inputs are independent; read them concurrently.
+        distill_text, rtl_text, tb_text = _READ_POOL.map(
+            _read_or_placeholder, (distill_path, rtl_path, tb_path), (None, "RTL", "TB")
         )
+        system = _REFLECTION_SYSTEM_PROMPT
+        # Bound the prompt for large designs: keep the head and tail of each source (line numbers
+        # stay those of the real file so evidence citations remain valid) and cap the distill dump.
+        max_rtl_lines = int(os.getenv("REFLECT_MAX_RTL_LINES", "400"))
+        max_tb_lines = int(os.getenv("REFLECT_MAX_TB_LINES", "300"))
+        max_distill_chars = int(os.getenv("REFLECT_MAX_DISTILL_CHARS", "100000"))
+        rtl_numbered, rtl_cut = _number_lines_windowed(rtl_text, max_rtl_lines)
+        tb_numbered, tb_cut = _number_lines_windowed(tb_text, max_tb_lines)
         user = (
             f"Node: {node_id}\n"
             f"Coverage goals: {json.dumps(ctx.get('coverage_goals', {}), indent=2)}\n"
-            f"Distilled dataset:\n{distill_text}\n\n"
-            f"RTL source (full, line-numbered):\n{_number_lines(rtl_text)}\n\n"
-            f"Testbench source (full, line-numbered):\n{_number_lines(tb_text)}\n"
+            f"Distilled dataset:\n{_window_chars(distill_text, max_distill_chars)}\n\n"
+            f"RTL source ({_source_label(rtl_cut)}):\n{rtl_numbered}\n\n"
+            f"Testbench source ({_source_label(tb_cut)}):\n{tb_numbered}\n"
         )
         msgs = [
             Message(role=MessageRole.SYSTEM, content=system),
@@ -77,7 +90,7 @@ class ReflectionWorker(AgentWorkerBase):
         cfg = GenerationConfig(temperature=temperature, max_tokens=max_tokens)
 
         try:
-            resp = asyncio.run(self.gateway.generate(messages=msgs, config=cfg))  # type: ignore[arg-type]
+            resp = self.run_llm(msgs, cfg)
         except Exception as exc:  # noqa: BLE001
             if is_transient_error(exc):
                 raise RetryableError(f"Reflection LLM transient error: {exc}")
@@ -90,7 +103,7 @@ class ReflectionWorker(AgentWorkerBase):
 
         tracker = get_tracker()
         try:
-            tracker.log_llm_call(
+            tracker.log_llm_call_async(
                 agent=self.runtime_name,
                 node_id=node_id,
                 model=getattr(resp, "model_name", "unknown"),
@@ -141,16 +154,35 @@ class ReflectionWorker(AgentWorkerBase):
         )
 
 
+_JSON_DECODER = json.JSONDecoder()
+_READ_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="reflection-read")
+
+
+def _read_or_placeholder(path: Path, label: str | None) -> str:
+    """Read path; a missing file becomes a <<label missing>> marker (label=None means required)."""
+    if label is not None and not path.exists():
+        return f"<<{label} missing at {path}>>"
+    return path.read_text()
+
+
 def _safe_json(text: str):
     try:
-        return json.loads(text)
+        return json_codec.loads(text)
     except Exception:
         pass
     start = text.find("{")
+    if start == -1:
+        return None
+    # Decode in place from the first brace and stop at the end of that object, so
+    # trailing prose (even with braces) needs no slice copy or rescan.
+    try:
+        return _JSON_DECODER.raw_decode(text, start)[0]
+    except Exception:
+        pass
     end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
+    if end > start:
         try:
-            return json.loads(text[start : end + 1])
+            return json_codec.loads(text[start : end + 1])
         except Exception:
             return None
     return None
@@ -172,10 +204,44 @@ def _stage_dir(kind: str, attempt: int | None) -> str:
     return f"{kind}_attempt{attempt}"
 
 
-def _number_lines(text: str) -> str:
+def _number_lines_windowed(text: str, max_lines: int) -> tuple[str, int]:
+    """
+    Line-number text; past max_lines (0 = unlimited) keep the head and tail halves
+    with their original numbers and mark the gap. Returns (text, omitted line count).
+    """
     lines = text.splitlines()
-    width = len(str(len(lines))) if lines else 1
-    return "\n".join(f"{idx+1:>{width}}: {line}" for idx, line in enumerate(lines))
+    total = len(lines)
+    # One bound format per call instead of re-parsing a nested f-string spec per line.
+    fmt = f"{{:>{len(str(total))}}}: {{}}".format
+    if max_lines <= 0 or total <= max_lines:
+        return "\n".join(map(fmt, range(1, total + 1), lines)), 0
+    head = max_lines // 2
+    tail_start = total - (max_lines - head)
+    omitted = tail_start - head
+    return (
+        "\n".join(
+            [
+                *map(fmt, range(1, head + 1), lines[:head]),
+                f"...<<{omitted} lines omitted ({head + 1}-{tail_start})>>...",
+                *map(fmt, range(tail_start + 1, total + 1), lines[tail_start:]),
+            ]
+        ),
+        omitted,
+    )
+
+
+def _window_chars(text: str, max_chars: int) -> str:
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    head = max_chars // 2
+    omitted = len(text) - max_chars
+    return f"{text[:head]}\n...<<{omitted} chars omitted>>...\n{text[len(text) - (max_chars - head):]}"
+
+
+def _source_label(omitted: int) -> str:
+    if not omitted:
+        return "full, line-numbered"
+    return f"line-numbered, {omitted} middle lines omitted"
 
 
 def _normalize_reflection_payload(payload: dict) -> dict:
@@ -185,6 +251,10 @@ def _normalize_reflection_payload(payload: dict) -> dict:
     return normalized
 
 
+_TEXT_KEYS = ("hypothesis", "point", "item", "text", "summary", "detail", "statement")
+_EVIDENCE_KEYS = ("evidence", "citation", "citations", "source", "sources")
+
+
 def _normalize_list_field(value) -> list[str]:
     items: list[str] = []
     if isinstance(value, dict):
@@ -196,34 +266,39 @@ def _normalize_list_field(value) -> list[str]:
             text = item.strip()
             if text:
                 items.append(text)
-            continue
-        if isinstance(item, dict):
-            text = None
-            for key in ("hypothesis", "point", "item", "text", "summary", "detail", "statement"):
-                if key in item and isinstance(item[key], str):
-                    text = item[key].strip()
-                    break
-            if text is None:
-                for val in item.values():
-                    if isinstance(val, str):
-                        text = val.strip()
-                        break
-            if text is None:
-                text = json.dumps(item, ensure_ascii=True)
-            evidence = None
-            for key in ("evidence", "citation", "citations", "source", "sources"):
-                if key in item:
-                    ev = item[key]
-                    if isinstance(ev, str):
-                        evidence = ev.strip()
-                    elif isinstance(ev, list):
-                        ev_items = [e.strip() for e in ev if isinstance(e, str) and e.strip()]
-                        if ev_items:
-                            evidence = "; ".join(ev_items)
-                    break
+        elif isinstance(item, dict):
+            text = _dict_item_text(item)
+            evidence = _dict_item_evidence(item)
             if evidence and "[evidence:" not in text:
                 text = f"{text} [evidence: {evidence}]"
             items.append(text)
-            continue
-        items.append(str(item))
+        else:
+            items.append(str(item))
     return items
+
+
+def _dict_item_text(item: dict) -> str:
+    # First string under a known text key, else the first string value, else the JSON form.
+    for key in _TEXT_KEYS:
+        val = item.get(key)
+        if isinstance(val, str):
+            return val.strip()
+    for val in item.values():
+        if isinstance(val, str):
+            return val.strip()
+    # Stdlib form (", "/": " separators, ASCII escapes) so the text the LLM sees is stable.
+    return json.dumps(item, ensure_ascii=True)
+
+
+def _dict_item_evidence(item: dict) -> str | None:
+    # Only the first evidence-like key present is considered, whatever its type.
+    for key in _EVIDENCE_KEYS:
+        if key in item:
+            ev = item[key]
+            if isinstance(ev, str):
+                return ev.strip()
+            if isinstance(ev, list):
+                ev_items = [e.strip() for e in ev if isinstance(e, str) and e.strip()]
+                return "; ".join(ev_items) if ev_items else None
+            return None
+    return None
@@ -3,12 +3,11 @@ LLM-driven helper utilities for the spec checklist workflow.
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import os
 from typing import Any, Dict, List, Optional
 
-from agents.common.llm_gateway import GenerationConfig, Message, MessageRole
+from agents.common.llm_gateway import GenerationConfig, Message, MessageRole, get_llm_loop
 from core.observability.agentops_tracker import get_tracker
 from agents.spec_helper.checklist import (
     CHECKLIST_SCHEMA,
@@ -37,7 +36,7 @@ def _safe_json(text: str) -> Optional[Dict[str, Any]]:
 def _log_llm_call(stage: str, spec: Dict[str, Any], resp: Any) -> None:
     tracker = get_tracker()
     try:
-        tracker.log_llm_call(
+        tracker.log_llm_call_async(
             agent="spec_helper",
             node_id=spec.get("module_name"),
             model=getattr(resp, "model_name", "unknown"),
@@ -121,10 +120,7 @@ def _run_llm(gateway: object, messages: List[Message], stage: str) -> str:
     if json_mode and provider in ("openai", "groq"):
         cfg.provider_specific.setdefault("response_format", {"type": "json_object"})
 
-    async def _generate() -> Any:
-        return await gateway.generate(messages=messages, config=cfg)  # type: ignore[arg-type]
-
-    resp = asyncio.run(_generate())
+    resp = get_llm_loop().submit(gateway, messages, cfg).result()
     _log_llm_call(stage, {}, resp)
     return resp.content.strip()
 
@@ -5,7 +5,6 @@ which fields are still missing. LLM-only (no heuristic fallback).
 """
 from __future__ import annotations
 
-import json
 import re
 from typing import Any, Dict
 
@@ -15,6 +14,9 @@ from agents.common.base import AgentWorkerBase
 from agents.common.llm_gateway import init_llm_gateway
 from agents.spec_helper.checklist import build_empty_checklist, list_missing_fields
 from agents.spec_helper.llm_helper import update_checklist_from_spec
+from core.runtime.json_codec import dumps_compact
+
+_MODULE_RE = re.compile(r"^Module:\s*(.+)$", re.MULTILINE)
 
 
 class SpecHelperWorker(AgentWorkerBase):
@@ -38,7 +40,7 @@ class SpecHelperWorker(AgentWorkerBase):
                 status=TaskStatus.FAILURE,
                 artifacts_path=None,
                 log_output="LLM is required for spec helper (set USE_LLM=1 and provider keys).",
-                reflections=json.dumps({"status": "failed", "reason": "llm_unavailable"}),
+                reflections=dumps_compact({"status": "failed", "reason": "llm_unavailable"}),
             )
 
         structured = update_checklist_from_spec(self.gateway, spec_text, checklist)
@@ -72,31 +74,32 @@ class SpecHelperWorker(AgentWorkerBase):
             status=TaskStatus.SUCCESS,
             artifacts_path=None,
             log_output="\n".join(log_lines),
-            reflections=json.dumps(payload),
+            reflections=dumps_compact(payload),
         )
 
 
 def _detect_block_diagram_module_gaps(checklist: Dict[str, Any], spec_text: str) -> list[str]:
-    module_names = _extract_module_names(spec_text)
-    module_names_lower = {name.lower() for name in module_names}
-    node_ids = []
+    module_names_lower = {name.lower() for name in _extract_module_names(spec_text)}
+    if not module_names_lower:
+        # No Module blocks in the spec at all: nothing to cross-check against.
+        return []
     l4 = checklist.get("L4") if isinstance(checklist, dict) else None
     block_diagram = l4.get("block_diagram") if isinstance(l4, dict) else None
-    if isinstance(block_diagram, list):
-        for node in block_diagram:
-            if isinstance(node, dict):
-                node_id = str(node.get("node_id", "")).strip()
-                if node_id:
-                    node_ids.append((node_id, bool(node.get("uses_standard_component"))))
-    missing_nodes = []
-    for node_id, is_std in node_ids:
-        if is_std:
-            continue
-        if module_names_lower and node_id.lower() not in module_names_lower:
-            missing_nodes.append(node_id)
-    if not missing_nodes:
+    if not isinstance(block_diagram, list):
         return []
-    missing_sorted = ", ".join(sorted(set(missing_nodes)))
+    custom_nodes = {
+        node_id
+        for node_id in (
+            str(node.get("node_id", "")).strip()
+            for node in block_diagram
+            if isinstance(node, dict) and not node.get("uses_standard_component")
+        )
+        if node_id
+    }
+    missing = sorted(node_id for node_id in custom_nodes if node_id.lower() not in module_names_lower)
+    if not missing:
+        return []
+    missing_sorted = ", ".join(missing)
     return [
         (
             "L4.block_diagram references node_id(s) not defined as Module blocks: "
@@ -106,9 +109,6 @@ def _detect_block_diagram_module_gaps(checklist: Dict[str, Any], spec_text: str)
 
 
 def _extract_module_names(spec_text: str) -> list[str]:
-    names = []
-    for match in re.finditer(r"^Module:\s*(.+)$", spec_text, flags=re.MULTILINE):
-        name = match.group(1).strip()
-        if name:
-            names.append(name)
-    return names
+    if "Module:" not in spec_text:
+        return []
+    return [name for name in (match.group(1).strip() for match in _MODULE_RE.finditer(spec_text)) if name]
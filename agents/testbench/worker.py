@@ -4,22 +4,45 @@ Fails hard if the LLM is unavailable or generation fails.
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import os
-import re
 from pathlib import Path
 from typing import List, Tuple
 
 from core.schemas.contracts import AgentType, ResultMessage, TaskMessage, TaskStatus
 from core.observability.emitter import emit_runtime_event
-from agents.common.base import AgentWorkerBase
-from agents.common.llm_gateway import init_llm_gateway, Message, MessageRole, GenerationConfig
-from agents.common.tb_sanitizer import sanitize_testbench
+from agents.common.base import AgentWorkerBase, ensure_dir, write_text_fast
+from agents.common import llm_cache
+from agents.common.sv_format import format_port_block
+from agents.common.llm_gateway import get_llm_loop, init_llm_gateway, Message, MessageRole, GenerationConfig
+from agents.common.verilog_sanitizer import sanitize_verilog
 from core.observability.agentops_tracker import get_tracker
 from core.runtime.retry import RetryableError, TaskInputError, is_transient_error
 
 
+# Kept constant (no per-node text) so the leading message is identical across requests.
+_TB_SYSTEM_PROMPT = (
+    "You are a Verification Agent. Generate a simple self-checking Verilog-2001 testbench.\n"
+    "No code fences, no `systemverilog` directive, avoid SystemVerilog-only keywords (no logic/always_ff/always_comb/interfaces). "
+    "Use regs for driven signals, wires for DUT outputs. Keep it concise and target the stated test goals. "
+    "Strict Verilog-2001 compatibility: declare all regs/wires/integers at module scope (no declarations inside initial/always/for/while blocks) "
+    "and avoid declaration-time initialization inside procedural blocks. "
+    "Name the testbench module tb_<node_id>. "
+    "Include an integer cycle counter incremented on the main clock edge. On any failure, print a single-line "
+    "message that includes cycle=<cycle> and time=<time> plus key signals. "
+    "Avoid race conditions: drive DUT inputs on the opposite clock edge (e.g. drive on negedge if DUT samples on posedge), "
+    "or after a small #1 delay, and never change stimulus in the same timestep as the sampling clock edge. "
+    "When using a reference model updated on the sampling edge with nonblocking assignments, perform checks after updates "
+    "(e.g. in an always @(posedge clk) begin #1; ... end) so DUT/ref values are stable. "
+    "Include optional VCD dump controls: if +DUMP is present (use $test$plusargs), set $dumpfile from "
+    "+DUMP_FILE=<path> (default dump.vcd) (use $value$plusargs with %s), call $dumpvars(0, tb_<node_id>), "
+    "and use $dumpoff/$dumpon to restrict to +DUMP_START=<cycle> and +DUMP_END=<cycle> if provided "
+    "(use $value$plusargs with %d; avoid SystemVerilog strings). Do NOT treat DUMP_START=0 as \"disabled\"; "
+    "if a dump window is provided and start==0, keep dumping enabled from time 0 (do not $dumpoff permanently). "
+    "Never use $stop; always terminate with $finish on pass/fail (use $finish(1) on failure, $finish(0) on pass if supported)."
+)
+
+
 class TestbenchWorker(AgentWorkerBase):
     handled_types = {AgentType.TESTBENCH}
     runtime_name = "agent_testbench"
@@ -42,7 +65,7 @@ class TestbenchWorker(AgentWorkerBase):
         if not isinstance(iface_signals, list) or not iface_signals:
             raise TaskInputError("Empty interface signals in task context.")
         tb_path = Path(ctx.get("tb_path", "")) if ctx.get("tb_path") else Path(ctx["rtl_path"]).with_name(f"{node_id}_tb.sv")
-        tb_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(tb_path.parent)
 
         if not self.gateway or not Message or not GenerationConfig:
             return ResultMessage(
@@ -53,7 +76,7 @@ class TestbenchWorker(AgentWorkerBase):
                 log_output="LLM gateway unavailable; set USE_LLM=1 and configure provider credentials.",
             )
         try:
-            tb_source, log_output = asyncio.run(self._llm_generate_tb(ctx, node_id))
+            tb_source, log_output = self.run_async(self._llm_generate_tb(ctx, node_id))
         except Exception as exc:  # noqa: BLE001
             if is_transient_error(exc):
                 raise RetryableError(f"LLM testbench transient error: {exc}")
@@ -72,27 +95,9 @@ class TestbenchWorker(AgentWorkerBase):
                 artifacts_path=None,
                 log_output="LLM returned empty testbench source.",
             )
-        tb_source = tb_source.replace("logic", "reg")
-
-        # Strip unsupported directives that occasionally show up in LLM output.
-        tb_source = "\n".join(
-            line for line in tb_source.splitlines() if not line.strip().startswith(("`systemverilog", "```"))
-        )
-        # Fix common LLM mistake: $value$plusargs("DUMP") is invalid (it requires a second variable argument).
-        # Use $test$plusargs for presence checks, and reserve $value$plusargs for value extraction with a format string.
-        tb_source = re.sub(
-            r"\$value\$plusargs\s*\(\s*(['\"])DUMP\1\s*\)",
-            r"$test$plusargs(\1DUMP\1)",
-            tb_source,
-        )
-        tb_source = re.sub(r"\$stop\s*(\([^;]*\))?\s*;", "$finish;", tb_source)
-        if not tb_source.strip().startswith("`timescale"):
-            tb_source = "`timescale 1ns/1ps\n\n" + tb_source
-        if "endmodule" not in tb_source:
-            tb_source = tb_source.rstrip() + "\nendmodule\n"
-        tb_source = sanitize_testbench(tb_source)
+        tb_source = sanitize_verilog(tb_source, kind="tb")
         try:
-            tb_path.write_text(tb_source)
+            write_text_fast(tb_path, tb_source)
         except Exception as exc:  # noqa: BLE001
             return ResultMessage(
                 task_id=task.task_id,
@@ -114,72 +119,15 @@ class TestbenchWorker(AgentWorkerBase):
             log_output=log_output,
         )
 
-    def _width_expr(self, sig) -> str:
-        raw = sig.get("width", 1)
-        if isinstance(raw, bool):
-            return "1"
-        if isinstance(raw, (int, float)):
-            return str(int(raw))
-        if isinstance(raw, str) and raw.strip():
-            return raw.strip()
-        return "1"
-
-    def _width_int(self, sig) -> int | None:
-        raw = sig.get("width", 1)
-        if isinstance(raw, bool):
-            return None
-        if isinstance(raw, int):
-            return raw
-        if isinstance(raw, float):
-            return int(raw)
-        if isinstance(raw, str):
-            text = raw.strip()
-            if text.isdigit():
-                return int(text)
-        return None
-
     async def _llm_generate_tb(self, ctx, node_id: str) -> Tuple[str, str]:
         iface = ctx["interface"]["signals"]
-        ports = []
-        for sig in iface:
-            name = sig["name"]
-            width_expr = self._width_expr(sig)
-            width_int = self._width_int(sig)
-            dir_kw = sig["direction"].lower()
-            base_type = "wire" if dir_kw == "output" else "reg"
-            if width_int and width_int > 1:
-                width_decl = f"[{width_int-1}:0] "
-            elif width_expr not in ("1", ""):
-                width_decl = f"[({width_expr})-1:0] "
-            else:
-                width_decl = ""
-            ports.append(f"{dir_kw} {base_type} {width_decl}{name}")
         verification = ctx.get("verification", {})
         behavior = ctx.get("demo_behavior", "")
         clocking = ctx.get("clocking", {})
-        system = (
-            "You are a Verification Agent. Generate a simple self-checking Verilog-2001 testbench.\n"
-            "No code fences, no `systemverilog` directive, avoid SystemVerilog-only keywords (no logic/always_ff/always_comb/interfaces). "
-            "Use regs for driven signals, wires for DUT outputs. Keep it concise and target the stated test goals. "
-            "Strict Verilog-2001 compatibility: declare all regs/wires/integers at module scope (no declarations inside initial/always/for/while blocks) "
-            "and avoid declaration-time initialization inside procedural blocks. "
-            "Name the testbench module tb_<node_id>. "
-            "Include an integer cycle counter incremented on the main clock edge. On any failure, print a single-line "
-            "message that includes cycle=<cycle> and time=<time> plus key signals. "
-            "Avoid race conditions: drive DUT inputs on the opposite clock edge (e.g. drive on negedge if DUT samples on posedge), "
-            "or after a small #1 delay, and never change stimulus in the same timestep as the sampling clock edge. "
-            "When using a reference model updated on the sampling edge with nonblocking assignments, perform checks after updates "
-            "(e.g. in an always @(posedge clk) begin #1; ... end) so DUT/ref values are stable. "
-            "Include optional VCD dump controls: if +DUMP is present (use $test$plusargs), set $dumpfile from "
-            "+DUMP_FILE=<path> (default dump.vcd) (use $value$plusargs with %s), call $dumpvars(0, tb_<node_id>), "
-            "and use $dumpoff/$dumpon to restrict to +DUMP_START=<cycle> and +DUMP_END=<cycle> if provided "
-            "(use $value$plusargs with %d; avoid SystemVerilog strings). Do NOT treat DUMP_START=0 as \"disabled\"; "
-            "if a dump window is provided and start==0, keep dumping enabled from time 0 (do not $dumpoff permanently). "
-            "Never use $stop; always terminate with $finish on pass/fail (use $finish(1) on failure, $finish(0) on pass if supported)."
-        )
+        system = _TB_SYSTEM_PROMPT
         user = (
             f"Unit Under Test: {node_id}\n"
-            f"Ports:\n" + "\n".join(f"- {p}" for p in ports) + "\n"
+            f"Ports:\n{format_port_block(iface, 'tb')}\n"
             f"Behavior summary:\n{behavior}\n"
             f"Clocking:\n{json.dumps(clocking, indent=2)}\n"
             f"Verification plan:\n{json.dumps(verification, indent=2)}\n"
@@ -192,10 +140,23 @@ class TestbenchWorker(AgentWorkerBase):
         max_tokens = int(os.getenv("LLM_MAX_TOKENS", 10000))
         temperature = float(os.getenv("LLM_TEMPERATURE", 0.2))
         cfg = GenerationConfig(temperature=temperature, max_tokens=max_tokens)
-        resp = await self.gateway.generate(messages=msgs, config=cfg)  # type: ignore[arg-type]
+        cache_key = llm_cache.make_key(
+            system,
+            user,
+            temperature,
+            model=getattr(self.gateway, "model_name", "unknown"),
+            provider=getattr(self.gateway, "provider", "unknown"),
+            max_tokens=max_tokens,
+        )
+        cached = llm_cache.lookup(cache_key)
+        if cached is not None:
+            llm_cache.record_hit(cached, agent=self.runtime_name, node_id=node_id, stage="testbench")
+            return cached.content, f"LLM cache hit ({cache_key[:12]})"
+        resp = await get_llm_loop().generate(self.gateway, msgs, cfg)
+        llm_cache.store(cache_key, resp)
         tracker = get_tracker()
         try:
-            tracker.log_llm_call(
+            tracker.log_llm_call_async(
                 agent=self.runtime_name,
                 node_id=node_id,
                 model=getattr(resp, "model_name", "unknown"),
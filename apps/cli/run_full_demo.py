@@ -31,6 +31,7 @@ from workers.tb_lint.worker import TestbenchLintWorker
 from workers.sim.worker import SimulationWorker
 from workers.distill.worker import DistillWorker
 from orchestrator.orchestrator_service import DemoOrchestrator
+from orchestrator.worker_host import WorkerHost
 from core.schemas.contracts import AgentType, EntityType, ResultMessage, TaskMessage, TaskStatus
 
 TASK_EXCHANGE = "tasks_exchange"
@@ -87,13 +88,19 @@ def main() -> None:
     task_memory_root = REPO_ROOT / "artifacts" / "task_memory"
 
     stop_event = threading.Event()
-    workers = [
+    # Agent workers share one connection and a thread pool; deterministic workers keep their own threads.
+    host = WorkerHost(params, stop_event)
+    for agent in (
         PlannerWorker(params, stop_event),
         ImplementationWorker(params, stop_event),
         TestbenchWorker(params, stop_event),
         ReflectionWorker(params, stop_event),
         DebugWorker(params, stop_event),
         SpecHelperWorker(params, stop_event),
+    ):
+        host.register(agent)
+    workers = [
+        host,
         LintWorker(params, stop_event),
         TestbenchLintWorker(params, stop_event),
         AcceptanceWorker(params, stop_event),
@@ -4,148 +4,364 @@ Run the project's pytest suite and display a Rich summary table.
 """
 from __future__ import annotations
 
+import argparse
+import importlib.util
 import os
+import subprocess
 import sys
-from collections import defaultdict
+import tempfile
+import time
+import tomllib
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from xml.etree import ElementTree
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
 
-import pytest
-from rich import box
-from rich.console import Console
-from rich.table import Table
+# pytest and rich are imported where they are used so `--help` does not pay for them.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.table import Table
+    from rich.text import Text
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
-@dataclass(frozen=True)
-class TestSuiteMeta:
+class TestSuiteMeta(NamedTuple):
     """Metadata needed to describe each logical test suite."""
 
-    path: Path
+    posix_key: str  # project-relative path; also the key ResultCollector files results under
     display_name: str
     suite_type: str  # "Unit" or "Integration"
     description: str
 
 
-TEST_SUITES: List[TestSuiteMeta] = [
-    TestSuiteMeta(
-        path=Path("tests/core/schemas/test_serialization.py"),
-        display_name="test_serialization.py",
-        suite_type="Unit",
-        description="Validates JSON serialization/deserialization fidelity for all schema models.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/core/schemas/test_models.py"),
-        display_name="test_models.py",
-        suite_type="Unit",
-        description="Exercises the Pydantic task/result/analysis models across valid, edge, and integration scenarios.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/core/schemas/test_enums.py"),
-        display_name="test_enums.py",
-        suite_type="Unit",
-        description="Confirms enum definitions for priorities, statuses, entities, agents, and workers stay stable.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/core/schemas/test_specifications.py"),
-        display_name="test_specifications.py",
-        suite_type="Unit",
-        description="Ensures the hierarchical L1-L5 specification schemas and FrozenSpecification invariants behave consistently.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/core/schemas/test_validation.py"),
-        display_name="test_validation.py",
-        suite_type="Unit",
-        description="Stresses validation and error handling paths for every schema, including extreme edge cases.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/infrastructure/test_docker_setup.py"),
-        display_name="test_docker_setup.py",
-        suite_type="Integration",
-        description="Verifies docker-compose assets, RabbitMQ definitions, and management endpoints come up healthy.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/infrastructure/test_message_flow.py"),
-        display_name="test_message_flow.py",
-        suite_type="Integration",
-        description="Exercises RabbitMQ publish/consume flows for tasks/results with priority and persistence checks.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/infrastructure/test_schema_integration.py"),
-        display_name="test_schema_integration.py",
-        suite_type="Integration",
-        description="Checks schema enums align with RabbitMQ routing keys and serialization expectations.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/infrastructure/test_queue_configuration.py"),
-        display_name="test_queue_configuration.py",
-        suite_type="Integration",
-        description="Validates RabbitMQ queues, exchanges, bindings, and priority arguments exist per definitions.",
-    ),
-    TestSuiteMeta(
-        path=Path("tests/infrastructure/test_dlq_functionality.py"),
-        display_name="test_dlq_functionality.py",
-        suite_type="Integration",
-        description="Validates DLX/DLQ plumbing including message rejection flows, headers, and monitoring heuristics.",
-    ),
-]
+SUITES_FILE = Path(__file__).with_name("test_suites.toml")
+
+
+@lru_cache(maxsize=1)
+def load_test_suites() -> Tuple[TestSuiteMeta, ...]:
+    """Suite metadata from test_suites.toml, parsed once per process."""
+    with SUITES_FILE.open("rb") as fh:
+        data = tomllib.load(fh)
+    return tuple(
+        TestSuiteMeta(
+            posix_key=entry["path"],
+            display_name=entry.get("display_name") or entry["path"].rsplit("/", 1)[-1],
+            suite_type=entry["type"],
+            description=entry.get("description", ""),
+        )
+        for entry in data.get("suite", [])
+    )
+
+
+@lru_cache(maxsize=1)
+def suite_index() -> Mapping[str, int]:
+    """Read-only posix_key -> position in load_test_suites(); shared by every collector."""
+    return MappingProxyType({suite.posix_key: i for i, suite in enumerate(load_test_suites())})
+
+
+@dataclass(slots=True)
+class Bucket:
+    """Per-file outcome counters."""
+
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    total: int = 0
+
+
+# Shared zero row for suites with no reports; read-only.
+_EMPTY_BUCKET = Bucket()
+
+# Counter offsets within a suite's slot in ResultCollector._counts.
+_PASSED, _FAILED, _SKIPPED, _TOTAL = range(4)
+_SLOT = 4
 
 
 class ResultCollector:
-    """Pytest plugin that records per-file pass/fail counts."""
+    """
+    Pytest plugin that records per-file pass/fail counts.
+    Given a console, it also renders the summary table live as reports arrive and
+    keeps failure details, since pytest's own terminal reporter is disabled then.
+    """
+
+    # Minimum seconds between live table redraws.
+    REFRESH_INTERVAL = 0.25
 
-    def __init__(self, root: Path):
+    def __init__(
+        self,
+        root: Path,
+        selected: Optional[Iterable[TestSuiteMeta]] = None,
+        console: Optional[Console] = None,
+    ):
+        suites = load_test_suites()
         self.root = root
-        self.results: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
-        )
+        self.selected = suites if selected is None else tuple(selected)
+        self.failures: List[Tuple[str, str]] = []
+        self._root_str = str(root)
+        # Only the known suites are tracked; reports from any other file are dropped. Counts live in
+        # one flat int array (a _SLOT-wide slot per suite) and become Buckets only when read.
+        self._index = suite_index()
+        self._counts = array("i", [0]) * (_SLOT * len(suites))
+        # report.location[0] -> normalized key; known suites are already canonical.
+        self._norm_cache: Dict[str, str] = {suite.posix_key: suite.posix_key for suite in suites}
+        self._live: Optional[Live] = None
+        self._last_refresh = 0.0
+        if console is not None:
+            from rich.live import Live
+
+            # Redrawn only from hooks, where pytest's output capture is suspended.
+            self._live = Live(
+                build_table(self.results, self.selected),
+                console=console,
+                auto_refresh=False,
+                redirect_stdout=False,
+                redirect_stderr=False,
+            )
 
     def _normalize(self, raw_path: str) -> str:
-        path_obj = Path(raw_path)
-        if not path_obj.is_absolute():
-            path_obj = (self.root / path_obj).resolve()
-        try:
-            rel_path = path_obj.relative_to(self.root)
-        except ValueError:
-            rel_path = path_obj
-        return rel_path.as_posix()
+        """Canonical key for a report location: the root-relative posix path, exactly as in test_suites.toml."""
+        raw_path = raw_path.removeprefix("./")
+        key = self._norm_cache.get(raw_path)
+        if key is not None:
+            return key
+        # String ops only: Path.resolve() would stat the file and could follow symlinks out of the root.
+        abs_path = raw_path if os.path.isabs(raw_path) else os.path.join(self._root_str, raw_path)
+        abs_path = os.path.normpath(abs_path)
+        rel_path = os.path.relpath(abs_path, self._root_str)
+        key = (abs_path if rel_path.startswith("..") else rel_path).replace(os.sep, "/")
+        self._norm_cache[raw_path] = key
+        return key
+
+    @property
+    def live(self) -> bool:
+        """True when rendering the table live (pytest's terminal reporter is off)."""
+        return self._live is not None
+
+    def start(self) -> None:
+        """Begin live rendering (no-op without a console)."""
+        if self._live is not None:
+            self._live.start(refresh=True)
+
+    def stop(self) -> None:
+        """Draw the final table and end live rendering."""
+        if self._live is not None:
+            self._live.update(build_table(self.results, self.selected), refresh=True)
+            self._live.stop()
+
+    def add_outcome(self, location: str, outcome: str) -> None:
+        """Count one test result ("passed", "failed" or "skipped") from outside the hook, e.g. a JUnit file."""
+        position = self._index.get(self._normalize(location))
+        if position is None:
+            return
+        base = position * _SLOT
+        if outcome == "skipped":
+            self._counts[base + _SKIPPED] += 1
+        else:
+            self._counts[base + _TOTAL] += 1
+            self._counts[base + (_PASSED if outcome == "passed" else _FAILED)] += 1
+
+    def pytest_collectreport(self, report):  # type: ignore[override]
+        if self._live is not None and report.failed:
+            self.failures.append((f"ERROR collecting {report.nodeid}", report.longreprtext))
 
     def pytest_runtest_logreport(self, report):  # type: ignore[override]
-        """Hook invoked for each test report."""
-        is_skip = getattr(report, "skipped", False)
-        if is_skip:
-            key = self._normalize(report.location[0])
-            bucket = self.results[key]
-            bucket["skipped"] += 1
+        """Hook invoked for each test report (setup, call and teardown per test)."""
+        when = report.when
+        skipped = report.skipped
+        if self._live is not None and report.failed:
+            label = f"FAILED {report.nodeid}" if when == "call" else f"ERROR at {when} of {report.nodeid}"
+            self.failures.append((label, report.longreprtext))
+        # Cheap gate first: passing setup/teardown reports need no path work at all.
+        if when != "call" and not skipped:
+            return
+
+        position = self._index.get(self._normalize(report.location[0]))
+        if position is None:
             return
+        base = position * _SLOT
+        counts = self._counts
+        if skipped:
+            # A test yields at most one skipped report (setup for markers, call for pytest.skip()).
+            counts[base + _SKIPPED] += 1
+        else:
+            counts[base + _TOTAL] += 1
+            if report.passed:
+                counts[base + _PASSED] += 1
+            elif report.failed:
+                counts[base + _FAILED] += 1
+        self._refresh()
+
+    @property
+    def results(self) -> Dict[str, Bucket]:
+        """Per-file counters keyed by suite posix path."""
+        counts = self._counts
+        results: Dict[str, Bucket] = {}
+        for key, position in self._index.items():
+            base = position * _SLOT
+            results[key] = Bucket(
+                passed=counts[base + _PASSED],
+                failed=counts[base + _FAILED],
+                skipped=counts[base + _SKIPPED],
+                total=counts[base + _TOTAL],
+            )
+        return results
 
-        if report.when != "call":
+    def _refresh(self) -> None:
+        if self._live is None:
             return
+        now = time.monotonic()
+        if now - self._last_refresh >= self.REFRESH_INTERVAL:
+            self._last_refresh = now
+            self._live.update(build_table(self.results, self.selected), refresh=True)
+
+
+def _xdist_args(suites: Iterable[TestSuiteMeta]) -> List[str]:
+    """Spread tests across all cores when pytest-xdist is installed; otherwise run serially."""
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    if any(suite.suite_type == "Integration" for suite in suites):
+        # Integration files set up RabbitMQ/docker fixtures per module; loadfile keeps each file on
+        # one worker so that setup runs once per file instead of once per worker the file lands on.
+        return ["-n", "auto", "--dist", "loadfile"]
+    # worksteal lets idle workers take queued tests from a worker that drew the slower files.
+    return ["-n", "auto", "--dist", "worksteal"]
+
+
+def select_suites(include_integration: bool) -> List[TestSuiteMeta]:
+    """Unit suites always run; Integration suites need docker-compose/RabbitMQ and are opt-in."""
+    return [suite for suite in load_test_suites() if suite.suite_type == "Unit" or include_integration]
+
+
+# Wall-clock budget for the out-of-process Integration run, in seconds.
+INTEGRATION_TIMEOUT = float(os.getenv("INTEGRATION_TIMEOUT", "900"))
+# Per-test limit passed to pytest-timeout for Integration suites when it is installed.
+INTEGRATION_TEST_TIMEOUT = 60
 
-        key = self._normalize(report.location[0])
-        bucket = self.results[key]
-        bucket["total"] += 1
 
-        if report.passed:
-            bucket["passed"] += 1
-        elif report.failed:
-            bucket["failed"] += 1
-        elif is_skip:
-            bucket["skipped"] += 1
+def _pytest_args(suites: Tuple[TestSuiteMeta, ...], live: bool) -> List[str]:
+    # Explicit file paths keep collection to the known suites; the cache provider only costs
+    # a .pytest_cache write per run here. Absolute paths plus --rootdir leave the caller's cwd
+    # untouched, and report locations stay rootdir-relative.
+    return [
+        "-p",
+        "no:cacheprovider",
+        f"--rootdir={PROJECT_ROOT}",
+        f"--confcutdir={PROJECT_ROOT}",
+        *(["-p", "no:terminal"] if live else ["-q", "--no-header"]),
+        *_xdist_args(suites),
+        *(str(PROJECT_ROOT / suite.posix_key) for suite in suites),
+    ]
 
 
-def run_pytest() -> Tuple[int, Dict[str, Dict[str, int]]]:
-    """Execute pytest once and return (exit_code, per-file results)."""
-    os.chdir(PROJECT_ROOT)
-    collector = ResultCollector(PROJECT_ROOT)
-    exit_code = pytest.main(["tests", "-q"], plugins=[collector])
-    return exit_code, collector.results
+def _run_inproc(suites: Tuple[TestSuiteMeta, ...], collector: ResultCollector) -> int:
+    """Run suites inside this process; xdist forwards worker reports to the collector's hook."""
+    import pytest
 
+    return int(pytest.main(_pytest_args(suites, collector.live), plugins=[collector]))
 
-def build_table(results: Dict[str, Dict[str, int]]) -> Table:
-    """Create a Rich table visualizing the collected results."""
+
+def _run_subproc(suites: Tuple[TestSuiteMeta, ...], collector: ResultCollector) -> int:
+    """
+    Run suites in a child `python -m pytest` so docker/RabbitMQ code cannot take the CLI down,
+    under a wall-clock timeout. Results come back through a JUnit XML file.
+    """
+    argv = [sys.executable, "-m", "pytest", *_pytest_args(suites, live=False)]
+    if importlib.util.find_spec("pytest_timeout") is not None:
+        argv.append(f"--timeout={INTEGRATION_TEST_TIMEOUT}")
+    with tempfile.TemporaryDirectory(prefix="validation-report-") as tmp:
+        junit_path = Path(tmp) / "integration.xml"
+        # xunit1 records each testcase's file, which is what results are keyed by.
+        argv += [f"--junitxml={junit_path}", "-o", "junit_family=xunit1"]
+        try:
+            proc = subprocess.run(
+                argv,
+                cwd=PROJECT_ROOT,
+                timeout=INTEGRATION_TIMEOUT,
+                # With a live table on screen the child's output is reported from the JUnit file instead.
+                capture_output=collector.live,
+                text=True,
+            )
+        except subprocess.TimeoutExpired:
+            collector.failures.append(
+                ("Integration run timed out", f"Killed after {INTEGRATION_TIMEOUT:.0f}s (INTEGRATION_TIMEOUT).")
+            )
+            return 1
+        if junit_path.exists():
+            _ingest_junit(junit_path, collector)
+        elif proc.returncode != 0:
+            collector.failures.append(
+                (f"Integration run exited with {proc.returncode}", (proc.stdout or "") + (proc.stderr or ""))
+            )
+    return proc.returncode
+
+
+def _ingest_junit(junit_path: Path, collector: ResultCollector) -> None:
+    """Fold an xunit1 JUnit report into the collector, mirroring what the report hook counts."""
+    for case in ElementTree.parse(junit_path).iter("testcase"):
+        location = case.get("file")
+        if not location:
+            continue
+        label = "::".join(part for part in (case.get("classname"), case.get("name")) if part)
+        failure = case.find("failure")
+        error = case.find("error")
+        if case.find("skipped") is not None:
+            collector.add_outcome(location, "skipped")
+        elif failure is not None:
+            collector.add_outcome(location, "failed")
+            if collector.live:
+                collector.failures.append((f"FAILED {label}", failure.text or failure.get("message", "")))
+        elif error is not None:
+            # Setup/teardown and collection errors are reported but not counted, as in-process.
+            if collector.live:
+                collector.failures.append((f"ERROR {label}", error.text or error.get("message", "")))
+        else:
+            collector.add_outcome(location, "passed")
+
+
+def run_pytest(suites: Iterable[TestSuiteMeta], console: Optional[Console] = None) -> Tuple[int, ResultCollector]:
+    """
+    Execute the given suites and return (exit_code, collector). Unit suites run in-process;
+    Integration suites run in a subprocess. With a console the collector renders the table
+    live in place of pytest's terminal output.
+    """
+    suites = tuple(suites)
+    unit = tuple(suite for suite in suites if suite.suite_type != "Integration")
+    integration = tuple(suite for suite in suites if suite.suite_type == "Integration")
+    collector = ResultCollector(PROJECT_ROOT, suites, console)
+    exit_code = 0
+    collector.start()
+    try:
+        if unit:
+            exit_code = _run_inproc(unit, collector)
+        if integration:
+            sub_code = _run_subproc(integration, collector)
+            exit_code = exit_code or sub_code
+    finally:
+        collector.stop()
+    return exit_code, collector
+
+
+@lru_cache(maxsize=1)
+def _status_cells() -> Tuple[Text, Text, Text]:
+    """Styled (pass, fail, not run) status cells, built once so rows skip rich's markup parser."""
+    from rich.text import Text
+
+    return Text("Pass", style="green"), Text("Fail", style="red"), Text("Not run", style="dim")
+
+
+def build_table(results: Dict[str, Bucket], selected: Iterable[TestSuiteMeta]) -> Table:
+    """Create a Rich table visualizing the collected results; suites not in `selected` show as not run."""
+    from rich import box
+    from rich.table import Table
+    from rich.text import Text
+
+    pass_cell, fail_cell, not_run_cell = _status_cells()
+    selected_keys = {suite.posix_key for suite in selected}
     table = Table(
         title="Test Results Summary",
         box=box.SIMPLE_HEAVY,
@@ -157,40 +373,131 @@ def build_table(results: Dict[str, Dict[str, int]]) -> Table:
     table.add_column("Status", justify="center")
     table.add_column("Count", justify="center")
 
-    for suite in TEST_SUITES:
-        key = suite.path.as_posix()
-        file_result = results.get(key) or results.get(f"./{key}") or {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
-        executed = file_result["total"]
-        passed = file_result["passed"]
-        failed = file_result["failed"]
-        skipped = file_result["skipped"]
+    for suite in load_test_suites():
+        # ResultCollector._normalize always files results under the canonical posix key.
+        file_result = results.get(suite.posix_key, _EMPTY_BUCKET)
+        executed = file_result.total
+        passed = file_result.passed
+        failed = file_result.failed
+        skipped = file_result.skipped
 
-        status_text = "[green]Pass[/green]" if failed == 0 else "[red]Fail[/red]"
-
-        if executed > 0:
-            count_text = f"{passed}/{executed} passed"
+        if suite.posix_key not in selected_keys:
+            status_cell = not_run_cell
+        elif failed == 0:
+            status_cell = pass_cell
         else:
-            count_text = "0/0 passed"
+            status_cell = fail_cell
 
+        count_cell = Text(f"{passed}/{executed} passed")
         if skipped > 0:
-            count_text += f" (+{skipped} skipped)"
+            count_cell.append(f" (+{skipped} skipped)")
 
         table.add_row(
             suite.display_name,
             suite.suite_type,
             suite.description,
-            status_text,
-            count_text,
+            status_cell,
+            count_cell,
         )
 
     return table
 
 
+# Source trees polled by --watch.
+WATCH_DIRS = ("adapters", "agents", "apps", "core", "orchestrator", "tests")
+WATCH_INTERVAL = 1.0
+
+
+def _source_snapshot() -> Dict[str, float]:
+    snapshot: Dict[str, float] = {}
+    for dirname in WATCH_DIRS:
+        for path in (PROJECT_ROOT / dirname).rglob("*.py"):
+            try:
+                snapshot[str(path)] = path.stat().st_mtime
+            except OSError:
+                continue
+    return snapshot
+
+
+_SITE_DIRS = frozenset(("site-packages", "dist-packages"))
+
+
+def _forget_project_modules() -> None:
+    """Drop project modules so the next run re-imports edited code; third-party imports stay warm."""
+    env_roots = _in_repo_env_roots()
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if name == "__main__" or not module_file:
+            continue
+        path = Path(module_file).resolve()
+        if not path.is_relative_to(PROJECT_ROOT) or _SITE_DIRS.intersection(path.parts):
+            continue
+        if any(path.is_relative_to(env_root) for env_root in env_roots):
+            continue
+        del sys.modules[name]
+
+
+def _in_repo_env_roots() -> Tuple[Path, ...]:
+    """Interpreter prefixes that live inside the repo (e.g. a .venv/), whose modules are third-party."""
+    prefixes = {Path(prefix).resolve() for prefix in (sys.prefix, sys.exec_prefix, sys.base_prefix)}
+    return tuple(prefix for prefix in prefixes if prefix != PROJECT_ROOT and prefix.is_relative_to(PROJECT_ROOT))
+
+
+def report(suites: List[TestSuiteMeta], console: Console) -> int:
+    """Run the suites once, print the summary (and failures when rendered live), return the exit code."""
+    if not console.is_terminal:
+        # Logs and CI: keep pytest's own output and print the table once at the end.
+        exit_code, collector = run_pytest(suites)
+        console.print(build_table(collector.results, suites))
+        return exit_code
+
+    exit_code, collector = run_pytest(suites, console)
+    for label, details in collector.failures:
+        console.rule(f"[red]{label}[/red]")
+        console.print(details, markup=False, highlight=False)
+    return exit_code
+
+
+def watch(suites: List[TestSuiteMeta], console: Console) -> None:
+    """Re-run the suites in this process whenever a watched source file changes."""
+    snapshot = _source_snapshot()
+    try:
+        while True:
+            report(suites, console)
+            console.print("[dim]Watching for changes (Ctrl+C to stop)...[/dim]")
+            while True:
+                time.sleep(WATCH_INTERVAL)
+                current = _source_snapshot()
+                if current != snapshot:
+                    snapshot = current
+                    break
+            _forget_project_modules()
+    except KeyboardInterrupt:
+        pass
+
+
 def main() -> None:
-    exit_code, results = run_pytest()
+    parser = argparse.ArgumentParser(description="Run the test suites and print a summary table.")
+    parser.add_argument(
+        "--integration",
+        action="store_true",
+        help="Also run the Integration suites (requires docker-compose and RabbitMQ).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-run the suites whenever a source file changes.",
+    )
+    args = parser.parse_args()
+
+    from rich.console import Console
+
+    suites = select_suites(args.integration)
     console = Console()
-    console.print(build_table(results))
-    sys.exit(exit_code)
+    if args.watch:
+        watch(suites, console)
+        return
+    sys.exit(report(suites, console))
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ LLM-driven follow-ups to complete the L1-L5 checklist and lock the specs.
 """
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import os
 import re
@@ -11,51 +13,26 @@ import shlex
 import shutil
 import subprocess
 import sys
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Tuple
 from uuid import UUID, uuid4
 
-from agents.common.llm_gateway import init_llm_gateway
 from agents.spec_helper.checklist import (
     FieldInfo,
     build_empty_checklist,
     list_missing_fields,
     set_field,
 )
-from agents.spec_helper.llm_helper import (
-    generate_field_draft,
-    generate_field_draft_options,
-    generate_followup_question,
-    update_checklist_from_spec,
-)
-from core.schemas.specifications import (
-    AcceptanceMetric,
-    ArtifactRequirement,
-    AssertionPlan,
-    BlockDiagramNode,
-    ClockDomain,
-    ClockPolarity,
-    ClockingInfo,
-    ConfigurationParameter,
-    CoverageTarget,
-    DependencyEdge,
-    Connection,
-    ConnectionEndpoint,
-    FrozenSpecification,
-    HandshakeProtocol,
-    L1Specification,
-    L2Specification,
-    L3Specification,
-    L4Specification,
-    L5Specification,
-    ResetConstraint,
-    ResetPolarity,
-    SignalDefinition,
-    SignalDirection,
-    SpecificationState,
-    VerificationScenario,
-)
+from core.runtime.json_codec import dumps_indented
+
+# The pydantic spec models and the LLM stack are imported where they are used, so
+# the CLI banner and editor come up without loading them.
+if TYPE_CHECKING:
+    from core.schemas.specifications import ClockPolarity, ResetPolarity, SignalDirection
 
 SPEC_DIR = Path("artifacts/task_memory/specs")
 
@@ -106,6 +83,7 @@ def _print_banner() -> None:
     print()
 
 
+@lru_cache(maxsize=256)
 def _sanitize_name(name: str) -> str:
     cleaned = "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in name.strip())
     if not cleaned or cleaned[0].isdigit():
@@ -127,10 +105,24 @@ def _select_editor() -> List[str]:
     editor = os.getenv("EDITOR", "").strip()
     if editor:
         return shlex.split(editor)
+    candidate = _discover_editor()
+    if candidate:
+        return [candidate]
+    raise RuntimeError("No editor found. Set $EDITOR to your preferred editor.")
+
+
+@lru_cache(maxsize=1)
+def _discover_editor() -> str | None:
+    # $EDITOR is re-read on every call; only the PATH walk is cached.
     for candidate in ("nano", "vim", "vi"):
         if shutil.which(candidate):
-            return [candidate]
-    raise RuntimeError("No editor found. Set $EDITOR to your preferred editor.")
+            return candidate
+    return None
+
+
+def _run_editor(spec_path: Path) -> None:
+    cmd = _select_editor() + [str(spec_path)]
+    subprocess.run(cmd, check=True)
 
 
 def _open_editor_for_spec() -> Tuple[str, Path]:
@@ -155,7 +147,7 @@ def _open_editor_for_spec() -> Tuple[str, Path]:
             print(f"Spec path not found or not a file: {src_path}")
             return "", spec_path
         try:
-            spec_path.write_text(src_path.read_text())
+            shutil.copyfile(src_path, spec_path)
         except Exception as exc:  # noqa: BLE001
             print(f"Could not read spec file: {exc}")
             return "", spec_path
@@ -171,13 +163,13 @@ def _open_editor_for_spec() -> Tuple[str, Path]:
     except KeyboardInterrupt:
         print("\nAborted.")
         return "", spec_path
-    cmd = _select_editor() + [str(spec_path)]
     try:
-        subprocess.run(cmd, check=True)
+        _run_editor(spec_path)
     except KeyboardInterrupt:
         print("\nAborted.")
         return "", spec_path
-    return spec_path.read_text().strip(), spec_path
+    # One read of the saved file; callers work from this text rather than reopening it.
+    return spec_path.read_bytes().decode("utf-8").strip(), spec_path
 
 
 def _append_spec_notes(spec_text: str, label: str, content: str) -> str:
@@ -191,12 +183,23 @@ def _append_spec_notes_to_file(spec_path: Path, label: str, content: str) -> Non
     trimmed = content.strip()
     if not trimmed:
         return
-    existing = ""
-    if spec_path.exists():
-        existing = spec_path.read_text().rstrip()
-    separator = "\n\n" if existing else ""
-    updated = f"{existing}{separator}[{label}]\n{trimmed}\n"
-    spec_path.write_text(updated)
+    entry = f"[{label}]\n{trimmed}\n".encode("utf-8")
+    # Append in place instead of reading and rewriting the whole file. Trailing whitespace is
+    # trimmed first (only the file's tail is read) so every entry follows exactly one blank line.
+    with spec_path.open("ab+") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        end = size
+        while end:
+            start = max(end - 4096, 0)
+            fh.seek(start)
+            kept = fh.read(end - start).rstrip()
+            if kept:
+                end = start + len(kept)
+                break
+            end = start
+        if end != size:
+            fh.truncate(end)
+        fh.write((b"\n\n" if end else b"") + entry)
 
 
 def _format_value_for_notes(value: Any) -> str:
@@ -210,7 +213,8 @@ def _format_value_for_notes(value: Any) -> str:
         return str(value)
 
 
-_MODULE_LINE_RE = re.compile(r"^\s*Module:\s*(\S+)\s*$", re.MULTILINE)
+# Horizontal whitespace only ([^\S\n]), so a match never spans lines when scanning a whole spec.
+_MODULE_LINE_RE = re.compile(r"^[^\S\n]*Module:[^\S\n]*(\S+)[^\S\n]*$", re.MULTILINE)
 _TOP_LINE_RE = re.compile(r"^\s*Top(?:\s+module)?:\s*(\S+)\s*$", re.MULTILINE | re.IGNORECASE)
 
 
@@ -233,20 +237,16 @@ def _strip_top_line(text: str) -> str:
 
 
 def _split_spec_modules(spec_text: str) -> tuple[str, list[tuple[str, str]]]:
-    lines = spec_text.splitlines()
-    module_indexes = [idx for idx, line in enumerate(lines) if _MODULE_LINE_RE.match(line)]
-    if not module_indexes:
+    matches = list(_MODULE_LINE_RE.finditer(spec_text))
+    if not matches:
         return spec_text.strip(), []
 
-    defaults = "\n".join(lines[: module_indexes[0]]).strip()
-    modules: list[tuple[str, str]] = []
-    for i, start in enumerate(module_indexes):
-        end = module_indexes[i + 1] if i + 1 < len(module_indexes) else len(lines)
-        block = "\n".join(lines[start:end]).strip()
-        module_name = _extract_module_name(block)
-        if not module_name:
-            continue
-        modules.append((_sanitize_name(module_name), block))
+    defaults = spec_text[: matches[0].start()].strip()
+    ends = [match.start() for match in matches[1:]] + [len(spec_text)]
+    modules = [
+        (_sanitize_name(match.group(1)), spec_text[match.start() : end].strip())
+        for match, end in zip(matches, ends)
+    ]
     return defaults, modules
 
 
@@ -277,7 +277,10 @@ def _set_module_name_in_text(spec_text: str, module_name: str) -> str:
 
 
 def _set_module_name_in_file(spec_path: Path, module_name: str) -> None:
-    existing = spec_path.read_text() if spec_path.exists() else ""
+    try:
+        existing = spec_path.read_text()
+    except FileNotFoundError:
+        existing = ""
     spec_path.write_text(_set_module_name_in_text(existing, module_name))
 
 
@@ -297,8 +300,30 @@ def _none_value(field: FieldInfo) -> Any:
     return "none"
 
 
+_NONE_TOKENS = frozenset({"none", "n/a", "na", "not applicable"})
+_TRUE_TOKENS = frozenset({"true", "yes", "y", "1"})
+_FALSE_TOKENS = frozenset({"false", "no", "n", "0"})
+_NEGEDGE_TOKENS = frozenset({"negedge", "neg", "falling", "negative"})
+_ACTIVE_HIGH_TOKENS = frozenset({"active_high", "high", "1", "true"})
+_ACTIVE_LOW_TOKENS = frozenset({"active_low", "low", "0", "false"})
+_DIRECTION_TOKENS = {
+    **dict.fromkeys(("INPUT", "IN", "I"), "INPUT"),
+    **dict.fromkeys(("OUTPUT", "OUT", "O"), "OUTPUT"),
+    **dict.fromkeys(("INOUT", "IO", "BIDIR"), "INOUT"),
+}
+_OP_REPLACEMENTS = {
+    "≥": ">=",
+    "≤": "<=",
+    "≠": "!=",
+    "=>": ">=",
+    "=<": "<=",
+}
+_OP_SUB_RE = re.compile("|".join(map(re.escape, _OP_REPLACEMENTS)))
+_OP_RE = re.compile(r"(==|!=|>=|<=|>|<)")
+
+
 def _is_none_token(value: str) -> bool:
-    return value.strip().lower() in ("none", "n/a", "na", "not applicable")
+    return value.strip().lower() in _NONE_TOKENS
 
 
 def _clean_text(value: Any) -> str:
@@ -323,44 +348,22 @@ def _clean_list(values: Any) -> List[Any]:
 
 
 def _dict_all_none(item: Dict[str, Any]) -> bool:
-    if not item:
-        return True
-    for val in item.values():
-        if isinstance(val, str):
-            if not _is_none_token(val):
-                return False
-        elif val not in (None, "", []):
-            return False
-    return True
+    return not any(
+        not _is_none_token(val) if isinstance(val, str) else val not in (None, "", [])
+        for val in item.values()
+    )
 
 
-def _clean_list_of_objects(values: Any) -> List[Dict[str, Any]]:
+def _iter_valid_objects(values: Any) -> Iterator[Dict[str, Any]]:
     if not isinstance(values, list):
-        return []
-    cleaned: List[Dict[str, Any]] = []
+        return
     for item in values:
-        if not isinstance(item, dict):
-            continue
-        if _dict_all_none(item):
-            continue
-        cleaned.append(item)
-    return cleaned
-
-
-def _clean_map(values: Any) -> Dict[str, Any]:
-    if not isinstance(values, dict):
-        return {}
-    if not values:
-        return {}
-    if all(isinstance(v, str) and _is_none_token(v) for v in values.values()):
-        return {}
-    return values
+        if isinstance(item, dict) and not _dict_all_none(item):
+            yield item
 
 
-def _clean_object(values: Any) -> Dict[str, Any]:
-    if not isinstance(values, dict):
-        return {}
-    if not values:
+def _clean_mapping(values: Any) -> Dict[str, Any]:
+    if not isinstance(values, dict) or not values:
         return {}
     if all(isinstance(v, str) and _is_none_token(v) for v in values.values()):
         return {}
@@ -389,19 +392,19 @@ def _coerce_answer_value(field: FieldInfo, value: Any) -> Any:
     return value
 
 
+def _blank_or_none(value: Any) -> bool:
+    text = "" if value is None else str(value).strip()
+    return not text or text.lower() in _NONE_TOKENS
+
+
 def _value_missing(field: FieldInfo, value: Any) -> bool:
     field_type = field.field_type
     if field_type == "text":
-        text = str(value or "").strip()
-        return not text or _is_none_token(text)
+        return _blank_or_none(value or "")
     if field_type == "list":
         if not isinstance(value, list) or not value:
             return True
-        for item in value:
-            text = str(item).strip()
-            if text and not _is_none_token(text):
-                return False
-        return True
+        return all(_blank_or_none(item) for item in value)
     if field_type in ("map", "object"):
         if not isinstance(value, dict) or not value:
             return True
@@ -413,13 +416,12 @@ def _value_missing(field: FieldInfo, value: Any) -> bool:
             for key in required:
                 if key not in value:
                     return True
-                val = value.get(key)
+                val = value[key]
                 if isinstance(val, list):
-                    if not val or all(_is_none_token(str(v).strip()) or not str(v).strip() for v in val):
+                    if not val or all(_blank_or_none(v) for v in val):
                         return True
                     continue
-                text = str(val or "").strip()
-                if not text or _is_none_token(text):
+                if _blank_or_none(val or ""):
                     return True
             return False
         return all(isinstance(v, str) and _is_none_token(v) for v in value.values())
@@ -437,12 +439,11 @@ def _value_missing(field: FieldInfo, value: Any) -> bool:
                     ok = False
                     break
                 if isinstance(val, list):
-                    if not val or all(_is_none_token(str(v).strip()) or not str(v).strip() for v in val):
+                    if not val or all(_blank_or_none(v) for v in val):
                         ok = False
                         break
                     continue
-                text = str(val).strip()
-                if not text or _is_none_token(text):
+                if _blank_or_none(val):
                     ok = False
                     break
             if ok:
@@ -470,42 +471,40 @@ def _require_list(values: Any, label: str) -> List[Any]:
     return cleaned
 
 
-def _require_list_of_objects(values: Any, label: str) -> List[Dict[str, Any]]:
-    cleaned = _clean_list_of_objects(values)
-    if not cleaned:
+def _require_items(items: List[Any], label: str) -> List[Any]:
+    if not items:
         raise ValueError(f"Missing required list for {label}.")
-    return cleaned
+    return items
 
 
 def _filter_none_list(values: List[Any]) -> List[str]:
-    filtered: List[str] = []
-    for item in values:
-        text = str(item).strip()
-        if not text or _is_none_token(text):
-            continue
-        filtered.append(text)
-    return filtered
+    return [text for text in (str(item).strip() for item in values) if text and text.lower() not in _NONE_TOKENS]
 
 
 def _as_bool(value: Any) -> bool | None:
-    if isinstance(value, bool):
-        return value
-    if value is None:
-        return None
+    match value:
+        case bool():
+            return value
+        case None:
+            return None
     text = str(value).strip().lower()
-    if text in ("true", "yes", "y", "1"):
+    if text in _TRUE_TOKENS:
         return True
-    if text in ("false", "no", "n", "0"):
+    if text in _FALSE_TOKENS:
         return False
     return None
 
 
 def _as_float(value: Any) -> float | None:
-    if isinstance(value, (float, int)):
-        return float(value)
-    if value is None:
-        return None
-    text = str(value).strip()
+    match value:
+        case float() | int():
+            return float(value)
+        case None:
+            return None
+        case str():
+            text = value.strip()
+        case _:
+            text = str(value).strip()
     if not text:
         return None
     try:
@@ -515,16 +514,18 @@ def _as_float(value: Any) -> float | None:
 
 
 def _as_int(value: Any) -> int | None:
-    if isinstance(value, int):
-        return value
-    if isinstance(value, float):
-        return int(value)
-    if value is None:
-        return None
-    text = str(value).strip()
-    if text.isdigit():
-        return int(text)
-    return None
+    match value:
+        case int():
+            return value
+        case float():
+            return int(value)
+        case None:
+            return None
+        case str():
+            text = value.strip()
+        case _:
+            text = str(value).strip()
+    return int(text) if text.isdigit() else None
 
 
 def _require_int(value: Any, label: str) -> int:
@@ -543,49 +544,87 @@ def _require_text(value: Any, label: str) -> str:
     return text
 
 
+def _required_extractor(section: str, *keys: str) -> Callable[[Dict[str, Any]], Tuple[str, ...]]:
+    """
+    Build a getter returning the stripped required text fields of one checklist item,
+    raising the same ValueError as _require_text for the first blank or none-like value.
+    """
+    getter = itemgetter(*keys)
+    labels = tuple(f"{section}.{key}" for key in keys)
+    single = len(keys) == 1
+
+    def extract(item: Dict[str, Any]) -> Tuple[str, ...]:
+        try:
+            values = getter(item)
+        except KeyError:
+            values = tuple(map(item.get, keys))
+        else:
+            if single:
+                values = (values,)
+        texts = []
+        for value, label in zip(values, labels):
+            text = "" if value is None else str(value).strip()
+            if not text or text.lower() in _NONE_TOKENS:
+                raise ValueError(f"Missing required text for {label}.")
+            texts.append(text)
+        return tuple(texts)
+
+    return extract
+
+
+_CLOCKING_REQUIRED = _required_extractor("L2.clocking", "clock_name")
+_SIGNAL_REQUIRED = _required_extractor("L2.signals", "name", "width_expr")
+_HANDSHAKE_REQUIRED = _required_extractor("L2.handshake_semantics", "name", "rules")
+_COVERAGE_REQUIRED = _required_extractor("L3.coverage_targets", "coverage_id", "description", "metric_type")
+_SCENARIO_REQUIRED = _required_extractor(
+    "L3.scenarios", "scenario_id", "description", "stimulus", "oracle", "pass_fail_criteria"
+)
+_BLOCK_REQUIRED = _required_extractor("L4.block_diagram", "node_id", "description", "node_type")
+_DEPENDENCY_REQUIRED = _required_extractor("L4.dependencies", "parent_id", "child_id", "dependency_type")
+_ARTIFACT_REQUIRED = _required_extractor("L5.required_artifacts", "name", "description")
+
+
 def _normalize_operator(value: Any) -> str:
     text = str(value or "").strip()
-    replacements = {
-        "≥": ">=",
-        "≤": "<=",
-        "≠": "!=",
-        "=>": ">=",
-        "=<": "<=",
-    }
-    text = replacements.get(text, text)
-    match = re.search(r"(==|!=|>=|<=|>|<)", text)
+    # Rewrite unicode/reversed spellings wherever they appear ("latency ≥ 10"), not only as the whole value.
+    text = _OP_SUB_RE.sub(lambda m: _OP_REPLACEMENTS[m.group(0)], text)
+    match = _OP_RE.search(text)
     if match:
         return match.group(1)
     return text
 
 
 def _clock_polarity(value: Any) -> ClockPolarity:
+    from core.schemas.specifications import ClockPolarity
+
     text = str(value or "").strip().lower()
-    if text in ("negedge", "neg", "falling", "negative"):
+    if text in _NEGEDGE_TOKENS:
         return ClockPolarity.NEGEDGE
     return ClockPolarity.POSEDGE
 
 
 def _reset_polarity(value: Any) -> ResetPolarity | None:
-    if value is None or _is_none_token(str(value)):
+    if value is None:
         return None
     text = str(value).strip().lower()
-    if text in ("active_high", "high", "1", "true"):
+    if text in _NONE_TOKENS:
+        return None
+    from core.schemas.specifications import ResetPolarity
+
+    if text in _ACTIVE_HIGH_TOKENS:
         return ResetPolarity.ACTIVE_HIGH
-    if text in ("active_low", "low", "0", "false"):
+    if text in _ACTIVE_LOW_TOKENS:
         return ResetPolarity.ACTIVE_LOW
     return None
 
 
 def _signal_direction(value: Any) -> SignalDirection:
-    text = str(value or "").strip().upper()
-    if text in ("INPUT", "IN", "I"):
-        return SignalDirection.INPUT
-    if text in ("OUTPUT", "OUT", "O"):
-        return SignalDirection.OUTPUT
-    if text in ("INOUT", "IO", "BIDIR"):
-        return SignalDirection.INOUT
-    raise ValueError(f"Invalid signal direction: {value}")
+    from core.schemas.specifications import SignalDirection
+
+    direction = _DIRECTION_TOKENS.get(str(value or "").strip().upper())
+    if direction is None:
+        raise ValueError(f"Invalid signal direction: {value}")
+    return SignalDirection(direction)
 
 
 def _write_artifacts(
@@ -597,6 +636,31 @@ def _write_artifacts(
     spec_id: UUID | None = None,
     filename_suffix: str = "",
 ) -> UUID:
+    from core.schemas.specifications import (
+        AcceptanceMetric,
+        ArtifactRequirement,
+        AssertionPlan,
+        BlockDiagramNode,
+        ClockDomain,
+        ClockingInfo,
+        ConfigurationParameter,
+        CoverageTarget,
+        DependencyEdge,
+        Connection,
+        ConnectionEndpoint,
+        FrozenSpecification,
+        HandshakeProtocol,
+        L1Specification,
+        L2Specification,
+        L3Specification,
+        L4Specification,
+        L5Specification,
+        ResetConstraint,
+        SignalDefinition,
+        SpecificationState,
+        VerificationScenario,
+    )
+
     SPEC_DIR.mkdir(parents=True, exist_ok=True)
     module_name = _sanitize_name(module_name or str(checklist.get("module_name", "demo_module")))
     checklist["module_name"] = module_name
@@ -607,8 +671,8 @@ def _write_artifacts(
     l4 = checklist.get("L4", {})
     l5 = checklist.get("L5", {})
 
-    spec_path.write_text(spec_text.strip() + "\n")
-    (SPEC_DIR / f"spec_checklist{suffix}.json").write_text(json.dumps(checklist, indent=2))
+    _write_bytes(spec_path, (spec_text.strip() + "\n").encode("utf-8"))
+    _write_bytes(SPEC_DIR / f"spec_checklist{suffix}.json", dumps_indented(checklist).encode("utf-8"))
 
     created_by = _current_user()
     spec_id = spec_id or uuid4()
@@ -628,12 +692,12 @@ def _write_artifacts(
         open_questions=_clean_list(l1.get("open_questions", [])),
     )
 
-    clocking_items = _require_list_of_objects(l2.get("clocking", []), "L2.clocking")
     clocking = []
-    for item in clocking_items:
+    for item in _iter_valid_objects(l2.get("clocking", [])):
+        (clock_name,) = _CLOCKING_REQUIRED(item)
         clocking.append(
             ClockingInfo(
-                clock_name=_require_text(item.get("clock_name"), "L2.clocking.clock_name"),
+                clock_name=clock_name,
                 clock_polarity=_clock_polarity(item.get("clock_polarity")),
                 reset_name=_clean_text(item.get("reset_name")) or None,
                 reset_polarity=_reset_polarity(item.get("reset_polarity")),
@@ -641,37 +705,33 @@ def _write_artifacts(
                 description=_clean_text(item.get("description")) or None,
             )
         )
+    _require_items(clocking, "L2.clocking")
 
-    signal_items = _require_list_of_objects(l2.get("signals", []), "L2.signals")
     signals = []
-    for item in signal_items:
-        width_expr = _require_text(item.get("width_expr"), "L2.signals.width_expr")
+    for item in _iter_valid_objects(l2.get("signals", [])):
+        name, width_expr = _SIGNAL_REQUIRED(item)
         signals.append(
             SignalDefinition(
-                name=_require_text(item.get("name"), "L2.signals.name"),
+                name=name,
                 direction=_signal_direction(item.get("direction")),
                 width_expr=width_expr,
                 semantics=_clean_text(item.get("semantics")) or None,
             )
         )
+    _require_items(signals, "L2.signals")
 
-    handshake_items = _clean_list_of_objects(l2.get("handshake_semantics", []))
-    handshake = [
-        HandshakeProtocol(
-            name=_require_text(item.get("name"), "L2.handshake_semantics.name"),
-            rules=_require_text(item.get("rules"), "L2.handshake_semantics.rules"),
-        )
-        for item in handshake_items
-    ]
+    handshake = []
+    for item in _iter_valid_objects(l2.get("handshake_semantics", [])):
+        name, rules = _HANDSHAKE_REQUIRED(item)
+        handshake.append(HandshakeProtocol(name=name, rules=rules))
 
-    params_items = _clean_list_of_objects(l2.get("configuration_parameters", []))
     params = [
         ConfigurationParameter(
             name=_require_text(item.get("name"), "L2.configuration_parameters.name"),
             default_value=_clean_text(item.get("default_value")) or None,
             description=_clean_text(item.get("description")) or None,
         )
-        for item in params_items
+        for item in _iter_valid_objects(l2.get("configuration_parameters", []))
     ]
 
     l2_spec = L2Specification(
@@ -686,36 +746,38 @@ def _write_artifacts(
         configuration_parameters=params,
     )
 
-    coverage_items = _clean_list_of_objects(l3.get("coverage_targets", []))
-    coverage_targets = [
-        CoverageTarget(
-            coverage_id=_require_text(item.get("coverage_id"), "L3.coverage_targets.coverage_id"),
-            description=_require_text(item.get("description"), "L3.coverage_targets.description"),
-            metric_type=_require_text(item.get("metric_type"), "L3.coverage_targets.metric_type"),
-            goal=_as_float(item.get("goal")),
-            notes=_clean_text(item.get("notes")) or None,
+    coverage_targets = []
+    for item in _iter_valid_objects(l3.get("coverage_targets", [])):
+        coverage_id, description, metric_type = _COVERAGE_REQUIRED(item)
+        coverage_targets.append(
+            CoverageTarget(
+                coverage_id=coverage_id,
+                description=description,
+                metric_type=metric_type,
+                goal=_as_float(item.get("goal")),
+                notes=_clean_text(item.get("notes")) or None,
+            )
         )
-        for item in coverage_items
-    ]
 
-    reset_obj = _clean_object(l3.get("reset_constraints", {}))
+    reset_obj = _clean_mapping(l3.get("reset_constraints", {}))
     reset_constraints = ResetConstraint(
         min_cycles_after_reset=_require_int(reset_obj.get("min_cycles_after_reset"), "L3.reset_constraints.min_cycles_after_reset"),
         ordering_notes=_clean_text(reset_obj.get("ordering_notes")) or None,
     )
 
-    scenario_items = _clean_list_of_objects(l3.get("scenarios", []))
-    scenarios = [
-        VerificationScenario(
-            scenario_id=_require_text(item.get("scenario_id"), "L3.scenarios.scenario_id"),
-            description=_require_text(item.get("description"), "L3.scenarios.description"),
-            stimulus=_require_text(item.get("stimulus"), "L3.scenarios.stimulus"),
-            oracle=_require_text(item.get("oracle"), "L3.scenarios.oracle"),
-            pass_fail_criteria=_require_text(item.get("pass_fail_criteria"), "L3.scenarios.pass_fail_criteria"),
-            illegal=bool(_as_bool(item.get("illegal")) or False),
+    scenarios = []
+    for item in _iter_valid_objects(l3.get("scenarios", [])):
+        scenario_id, description, stimulus, oracle, pass_fail_criteria = _SCENARIO_REQUIRED(item)
+        scenarios.append(
+            VerificationScenario(
+                scenario_id=scenario_id,
+                description=description,
+                stimulus=stimulus,
+                oracle=oracle,
+                pass_fail_criteria=pass_fail_criteria,
+                illegal=bool(_as_bool(item.get("illegal")) or False),
+            )
         )
-        for item in scenario_items
-    ]
 
     l3_spec = L3Specification(
         spec_id=spec_id,
@@ -731,36 +793,30 @@ def _write_artifacts(
         scenarios=scenarios,
     )
 
-    block_items = _require_list_of_objects(l4.get("block_diagram", []), "L4.block_diagram")
     block_diagram = []
-    for item in block_items:
-        interface_refs = _filter_none_list(_as_list(item.get("interface_refs", [])))
+    for item in _iter_valid_objects(l4.get("block_diagram", [])):
+        node_id, description, node_type = _BLOCK_REQUIRED(item)
         block_diagram.append(
             BlockDiagramNode(
-                node_id=_require_text(item.get("node_id"), "L4.block_diagram.node_id"),
-                description=_require_text(item.get("description"), "L4.block_diagram.description"),
-                node_type=_require_text(item.get("node_type"), "L4.block_diagram.node_type"),
-                interface_refs=interface_refs,
+                node_id=node_id,
+                description=description,
+                node_type=node_type,
+                interface_refs=_filter_none_list(_as_list(item.get("interface_refs", []))),
                 uses_standard_component=bool(_as_bool(item.get("uses_standard_component")) or False),
                 notes=_clean_text(item.get("notes")) or None,
             )
         )
+    _require_items(block_diagram, "L4.block_diagram")
 
-    dep_items = _clean_list_of_objects(l4.get("dependencies", []))
-    dependencies = [
-        DependencyEdge(
-            parent_id=_require_text(item.get("parent_id"), "L4.dependencies.parent_id"),
-            child_id=_require_text(item.get("child_id"), "L4.dependencies.child_id"),
-            dependency_type=_require_text(item.get("dependency_type"), "L4.dependencies.dependency_type"),
-        )
-        for item in dep_items
-    ]
+    dependencies = []
+    for item in _iter_valid_objects(l4.get("dependencies", [])):
+        parent_id, child_id, dependency_type = _DEPENDENCY_REQUIRED(item)
+        dependencies.append(DependencyEdge(parent_id=parent_id, child_id=child_id, dependency_type=dependency_type))
 
-    conn_items = _clean_list_of_objects(l4.get("connections", []))
     connections = []
-    for item in conn_items:
-        src_obj = _clean_object(item.get("src", {}))
-        dst_obj = _clean_object(item.get("dst", {}))
+    for item in _iter_valid_objects(l4.get("connections", [])):
+        src_obj = _clean_mapping(item.get("src", {}))
+        dst_obj = _clean_mapping(item.get("dst", {}))
         connections.append(
             Connection(
                 src=ConnectionEndpoint(
@@ -778,17 +834,16 @@ def _write_artifacts(
             )
         )
 
-    domain_items = _clean_list_of_objects(l4.get("clock_domains", []))
     clock_domains = [
         ClockDomain(
             name=_require_text(item.get("name"), "L4.clock_domains.name"),
             frequency_hz=_as_float(item.get("frequency_hz")),
             notes=_clean_text(item.get("notes")) or None,
         )
-        for item in domain_items
+        for item in _iter_valid_objects(l4.get("clock_domains", []))
     ]
 
-    assertion_obj = _clean_object(l4.get("assertion_plan", {}))
+    assertion_obj = _clean_mapping(l4.get("assertion_plan", {}))
     assertion_plan = AssertionPlan(
         sva=_filter_none_list(_as_list(assertion_obj.get("sva", []))),
         scoreboard_assertions=_filter_none_list(_as_list(assertion_obj.get("scoreboard_assertions", []))),
@@ -808,30 +863,34 @@ def _write_artifacts(
         assertion_plan=assertion_plan,
     )
 
-    artifact_items = _require_list_of_objects(l5.get("required_artifacts", []), "L5.required_artifacts")
-    required_artifacts = [
-        ArtifactRequirement(
-            name=_require_text(item.get("name"), "L5.required_artifacts.name"),
-            description=_require_text(item.get("description"), "L5.required_artifacts.description"),
-            mandatory=bool(_as_bool(item.get("mandatory")) if _as_bool(item.get("mandatory")) is not None else True),
-        )
-        for item in artifact_items
-    ]
-
-    metric_items = _require_list_of_objects(l5.get("acceptance_metrics", []), "L5.acceptance_metrics")
-    acceptance_metrics = [
-        AcceptanceMetric(
-            metric_id=_require_text(item.get("metric_id"), "L5.acceptance_metrics.metric_id"),
-            description=_require_text(item.get("description"), "L5.acceptance_metrics.description"),
-            operator=_require_text(
-                _normalize_operator(item.get("operator")),
-                "L5.acceptance_metrics.operator",
-            ),
-            target_value=_require_text(item.get("target_value"), "L5.acceptance_metrics.target_value"),
-            metric_source=_clean_text(item.get("metric_source")) or None,
+    required_artifacts = []
+    for item in _iter_valid_objects(l5.get("required_artifacts", [])):
+        name, description = _ARTIFACT_REQUIRED(item)
+        required_artifacts.append(
+            ArtifactRequirement(
+                name=name,
+                description=description,
+                mandatory=bool(_as_bool(item.get("mandatory")) if _as_bool(item.get("mandatory")) is not None else True),
+            )
         )
-        for item in metric_items
-    ]
+    _require_items(required_artifacts, "L5.required_artifacts")
+
+    acceptance_metrics = _require_items(
+        [
+            AcceptanceMetric(
+                metric_id=_require_text(item.get("metric_id"), "L5.acceptance_metrics.metric_id"),
+                description=_require_text(item.get("description"), "L5.acceptance_metrics.description"),
+                operator=_require_text(
+                    _normalize_operator(item.get("operator")),
+                    "L5.acceptance_metrics.operator",
+                ),
+                target_value=_require_text(item.get("target_value"), "L5.acceptance_metrics.target_value"),
+                metric_source=_clean_text(item.get("metric_source")) or None,
+            )
+            for item in _iter_valid_objects(l5.get("acceptance_metrics", []))
+        ],
+        "L5.acceptance_metrics",
+    )
 
     l5_spec = L5Specification(
         spec_id=spec_id,
@@ -844,7 +903,11 @@ def _write_artifacts(
         synthesis_target=_clean_text(l5.get("synthesis_target")) or None,
     )
 
-    frozen = FrozenSpecification(
+    # The bundle's only validator checks that every level is FROZEN and shares spec_id, which
+    # holds by construction here, and the L1-L5 models were validated above; skip re-validation.
+    # The levels themselves stay validated: the schema enforces operator patterns, bounds and
+    # types that the _require_* helpers do not.
+    frozen = FrozenSpecification.model_construct(
         spec_id=spec_id,
         l1=l1_spec,
         l2=l2_spec,
@@ -855,15 +918,36 @@ def _write_artifacts(
         frozen_by=created_by,
     )
 
-    (SPEC_DIR / f"L1_functional{suffix}.json").write_text(json.dumps(l1_spec.model_dump(mode="json"), indent=2))
-    (SPEC_DIR / f"L2_interface{suffix}.json").write_text(json.dumps(l2_spec.model_dump(mode="json"), indent=2))
-    (SPEC_DIR / f"L3_verification{suffix}.json").write_text(json.dumps(l3_spec.model_dump(mode="json"), indent=2))
-    (SPEC_DIR / f"L4_architecture{suffix}.json").write_text(json.dumps(l4_spec.model_dump(mode="json"), indent=2))
-    (SPEC_DIR / f"L5_acceptance{suffix}.json").write_text(json.dumps(l5_spec.model_dump(mode="json"), indent=2))
-    (SPEC_DIR / f"frozen_spec{suffix}.json").write_text(json.dumps(frozen.model_dump(mode="json"), indent=2))
+    # model_dump_json serializes straight from pydantic-core (no intermediate dict). The six
+    # files are small, so they are written in turn; a thread pool would cost more than the writes.
+    models = (l1_spec, l2_spec, l3_spec, l4_spec, l5_spec, frozen)
+    for path, model in zip(_artifact_paths(SPEC_DIR, suffix), models):
+        _write_bytes(path, model.model_dump_json(indent=2).encode("utf-8"))
     return spec_id
 
 
+_ARTIFACT_STEMS = (
+    "L1_functional",
+    "L2_interface",
+    "L3_verification",
+    "L4_architecture",
+    "L5_acceptance",
+    "frozen_spec",
+)
+
+
+@lru_cache(maxsize=32)
+def _artifact_paths(spec_dir: Path, suffix: str) -> Tuple[Path, ...]:
+    """Target paths for the L1-L5 and frozen artifacts, in _ARTIFACT_STEMS order."""
+    return tuple(spec_dir / f"{stem}{suffix}.json" for stem in _ARTIFACT_STEMS)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # Binary write of pre-encoded UTF-8: no text-layer encoding or newline handling. The buffered
+    # writer retries short writes, so the whole payload always lands.
+    path.write_bytes(data)
+
+
 def _write_lock(module_names: List[str], top_module: str, spec_id: UUID) -> None:
     lock = {
         "locked_at": datetime.now(timezone.utc).isoformat(),
@@ -872,16 +956,49 @@ def _write_lock(module_names: List[str], top_module: str, spec_id: UUID) -> None
         "modules": module_names,
         "spec_id": str(spec_id),
     }
-    (SPEC_DIR / "lock.json").write_text(json.dumps(lock, indent=2))
+    _write_bytes(SPEC_DIR / "lock.json", dumps_indented(lock).encode("utf-8"))
 
 
 def _require_gateway() -> object:
+    from agents.common.llm_gateway import init_llm_gateway
+
     gateway = init_llm_gateway()
     if not gateway:
         raise RuntimeError("Spec helper requires LLMs. Set USE_LLM=1 and provider keys.")
     return gateway
 
 
+# Results of spec-helper LLM calls keyed by a hash of everything the prompt is built
+# from, so re-asking in an unchanged state (invalid menu input, back-to-menu, a
+# checklist refresh that changed nothing) skips the gateway round-trip.
+_LLM_RESULTS: "OrderedDict[str, Any]" = OrderedDict()
+_LLM_RESULTS_MAX = 256
+
+
+def _cached_llm(fn_name: str, key_material: Dict[str, Any], call: Callable[[], Any]) -> Any:
+    material = json.dumps({"fn": fn_name, **key_material}, sort_keys=True, default=str)
+    key = hashlib.sha256(material.encode("utf-8")).hexdigest()
+    if key in _LLM_RESULTS:
+        _LLM_RESULTS.move_to_end(key)
+        # Callers mutate returned checklists in place; hand out copies.
+        return copy.deepcopy(_LLM_RESULTS[key])
+    result = call()
+    _LLM_RESULTS[key] = copy.deepcopy(result)
+    if len(_LLM_RESULTS) > _LLM_RESULTS_MAX:
+        _LLM_RESULTS.popitem(last=False)
+    return result
+
+
+def _index_missing(missing: List[FieldInfo]) -> Tuple[Dict[str, List[FieldInfo]], set[str]]:
+    """Group missing fields by top-level section (L1..L5, module_name) and collect their paths."""
+    by_phase: Dict[str, List[FieldInfo]] = {}
+    paths: set[str] = set()
+    for info in missing:
+        by_phase.setdefault(info.path.split(".", 1)[0], []).append(info)
+        paths.add(info.path)
+    return by_phase, paths
+
+
 def _complete_checklist(
     gateway: object,
     spec_text: str,
@@ -889,9 +1006,31 @@ def _complete_checklist(
     interactive: bool,
     spec_path: Path | None = None,
 ) -> Tuple[Dict[str, Any], str]:
+    from agents.spec_helper.llm_helper import (
+        generate_field_draft,
+        generate_field_draft_options,
+        generate_followup_question,
+        update_checklist_from_spec,
+    )
+
+    # Last read of spec_path, reused until the file's mtime/size change. Our own writes
+    # call _invalidate_spec_cache() too, in case they land within the mtime granularity.
+    spec_cache: Dict[str, Any] = {"stamp": None, "text": ""}
+
+    def _invalidate_spec_cache() -> None:
+        spec_cache["stamp"] = None
+
     def _load_spec_text(current: str) -> str:
-        if spec_path and spec_path.exists():
-            return spec_path.read_text().strip()
+        if spec_path:
+            try:
+                st = os.stat(spec_path)
+            except FileNotFoundError:
+                return current.strip()
+            stamp = (st.st_mtime_ns, st.st_size)
+            if stamp != spec_cache["stamp"]:
+                spec_cache["text"] = spec_path.read_text().strip()
+                spec_cache["stamp"] = stamp
+            return spec_cache["text"]
         return current.strip()
 
     def _sync_module_name_from_spec() -> None:
@@ -906,10 +1045,24 @@ def _complete_checklist(
         nonlocal spec_text
         if spec_path:
             _append_spec_notes_to_file(spec_path, label, content)
+            _invalidate_spec_cache()
             spec_text = _load_spec_text(spec_text)
             return
         spec_text = _append_spec_notes(spec_text, label, content)
 
+    # Bumped whenever drafts are rejected or unusable so the next request asks the LLM again.
+    draft_nonce = 0
+
+    def _refresh_checklist() -> Dict[str, Any]:
+        return _cached_llm(
+            "update_checklist_from_spec",
+            {"spec_text": spec_text, "checklist": checklist},
+            lambda: update_checklist_from_spec(gateway, spec_text, checklist),
+        )
+
+    def _field_key(field: FieldInfo, **extra: Any) -> Dict[str, Any]:
+        return {"spec_text": spec_text, "checklist": checklist, "field": field.path, **extra}
+
     def _thinking() -> None:
         if interactive:
             print(_style("\nThinking...", _DIM), flush=True)
@@ -949,8 +1102,9 @@ def _complete_checklist(
     spec_text = _load_spec_text(spec_text)
     _sync_module_name_from_spec()
     _thinking()
-    checklist = update_checklist_from_spec(gateway, spec_text, checklist)
+    checklist = _refresh_checklist()
     missing = list_missing_fields(checklist)
+    missing_by_phase, missing_paths = _index_missing(missing)
 
     while missing:
         field = missing[0]
@@ -958,7 +1112,11 @@ def _complete_checklist(
             spec_text = _load_spec_text(spec_text)
             _sync_module_name_from_spec()
             _thinking()
-            draft = generate_field_draft(gateway, field, checklist, spec_text)
+            draft = _cached_llm(
+                "generate_field_draft",
+                _field_key(field),
+                lambda: generate_field_draft(gateway, field, checklist, spec_text),
+            )
             if draft.get("value") is None:
                 raise RuntimeError(f"Missing field {field.path} and no draft could be generated.")
             value = _coerce_answer_value(field, draft.get("value"))
@@ -969,6 +1127,7 @@ def _complete_checklist(
                 module_name = _sanitize_name(str(value))
                 if spec_path:
                     _set_module_name_in_file(spec_path, module_name)
+                    _invalidate_spec_cache()
                     spec_text = _load_spec_text(spec_text)
                 else:
                     spec_text = _set_module_name_in_text(spec_text, module_name)
@@ -976,17 +1135,21 @@ def _complete_checklist(
             note = draft_text or _format_value_for_notes(value)
             _append_note(f"Spec helper draft for {field.path}", note)
             _thinking()
-            checklist = update_checklist_from_spec(gateway, spec_text, checklist)
+            checklist = _refresh_checklist()
             missing = list_missing_fields(checklist)
             continue
 
         while True:
             spec_text = _load_spec_text(spec_text)
             _sync_module_name_from_spec()
-            question = generate_followup_question(gateway, field, checklist, spec_text)
+            question = _cached_llm(
+                "generate_followup_question",
+                _field_key(field),
+                lambda: generate_followup_question(gateway, field, checklist, spec_text),
+            )
 
-            phase = field.path.split(".", 1)[0] if "." in field.path else field.path
-            phase_missing = [f for f in missing if f.path == phase or f.path.startswith(f"{phase}.")]
+            phase = field.path.split(".", 1)[0]
+            phase_missing = missing_by_phase.get(phase, [])
             phase_names: List[str] = []
             for info in phase_missing[:6]:
                 if "." in info.path:
@@ -1023,8 +1186,8 @@ def _complete_checklist(
                 if not spec_path:
                     print("No spec file available to edit in this mode. Choose option 2 or 3.")
                     continue
-                cmd = _select_editor() + [str(spec_path)]
-                subprocess.run(cmd, check=True)
+                _run_editor(spec_path)
+                _invalidate_spec_cache()
                 spec_text = _load_spec_text(spec_text)
                 break
 
@@ -1047,6 +1210,7 @@ def _complete_checklist(
                     set_field(checklist, field.path, module_name)
                     if spec_path:
                         _set_module_name_in_file(spec_path, module_name)
+                        _invalidate_spec_cache()
                         spec_text = _load_spec_text(spec_text)
                     else:
                         spec_text = _set_module_name_in_text(spec_text, module_name)
@@ -1065,7 +1229,11 @@ def _complete_checklist(
 
             # choice == "3"
             _thinking()
-            draft_options = generate_field_draft_options(gateway, field, checklist, spec_text, n_options=3)
+            draft_options = _cached_llm(
+                "generate_field_draft_options",
+                _field_key(field, n_options=3, nonce=draft_nonce),
+                lambda: generate_field_draft_options(gateway, field, checklist, spec_text, n_options=3),
+            )
             rendered: List[Tuple[str, Any]] = []
             for opt in draft_options:
                 if not isinstance(opt, dict):
@@ -1078,6 +1246,7 @@ def _complete_checklist(
                 rendered.append((note, value))
 
             if not rendered:
+                draft_nonce += 1
                 print(_style(f"Spec helper could not draft a valid proposal for {field.path}. Try option 1 or 2.", _YELLOW))
                 continue
 
@@ -1092,6 +1261,7 @@ def _complete_checklist(
                 if not reason:
                     reason = input("What should be different instead? (optional) ").strip()
                 _append_note(f"User rejected draft for {field.path}", reason or "rejected")
+                draft_nonce += 1
                 continue
 
             try:
@@ -1110,6 +1280,7 @@ def _complete_checklist(
                 module_name = _sanitize_name(str(value))
                 if spec_path:
                     _set_module_name_in_file(spec_path, module_name)
+                    _invalidate_spec_cache()
                     spec_text = _load_spec_text(spec_text)
                 else:
                     spec_text = _set_module_name_in_text(spec_text, module_name)
@@ -1118,9 +1289,10 @@ def _complete_checklist(
         spec_text = _load_spec_text(spec_text)
         _sync_module_name_from_spec()
         _thinking()
-        checklist = update_checklist_from_spec(gateway, spec_text, checklist)
+        checklist = _refresh_checklist()
         missing = list_missing_fields(checklist)
-        if any(item.path == field.path for item in missing):
+        missing_by_phase, missing_paths = _index_missing(missing)
+        if field.path in missing_paths:
             print(_style(f"Still missing {field.path}. The last answer could not be applied.", _RED))
 
     spec_text = _load_spec_text(spec_text)
@@ -1132,8 +1304,9 @@ def _collect_multi_specs(
     spec_text: str,
     spec_path: Path,
     interactive: bool,
+    sections: tuple[str, list[tuple[str, str]]] | None = None,
 ) -> Dict[str, Any]:
-    defaults_text, modules = _split_spec_modules(spec_text)
+    defaults_text, modules = sections or _split_spec_modules(spec_text)
     if not modules:
         raise RuntimeError("Multi-spec collection called without module sections.")
 
@@ -1186,9 +1359,9 @@ def collect_specs_from_text(module_name: str, spec_text: str, interactive: bool
     spec_path.write_text(spec_text.strip() + "\n")
 
     if not module_name:
-        defaults_text, modules = _split_spec_modules(spec_text)
-        if modules:
-            return _collect_multi_specs(gateway, spec_text, spec_path, interactive)
+        sections = _split_spec_modules(spec_text)
+        if sections[1]:
+            return _collect_multi_specs(gateway, spec_text, spec_path, interactive, sections)
 
     if module_name:
         spec_module = _extract_module_name(spec_text)
@@ -1224,10 +1397,11 @@ def collect_specs() -> None:
     if not spec_text:
         print("No spec text provided; aborting.")
         return
-    defaults_text, modules = _split_spec_modules(spec_text)
+    sections = _split_spec_modules(spec_text)
+    modules = sections[1]
     if modules:
         try:
-            _collect_multi_specs(gateway, spec_text, spec_path, interactive=True)
+            _collect_multi_specs(gateway, spec_text, spec_path, interactive=True, sections=sections)
         except KeyboardInterrupt:
             print("\nAborted.")
             return
@@ -9,12 +9,16 @@ This server runs workers in background threads and spawns an orchestrator per ru
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
 import threading
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Deque, Dict, List
+from uuid import uuid4
 
 import shutil
 import pika
@@ -39,7 +43,7 @@ from agents.spec_helper.worker import SpecHelperWorker
 from workers.lint.worker import LintWorker
 from workers.sim.worker import SimulationWorker
 from workers.distill.worker import DistillWorker
-from agents.common.llm_gateway import init_llm_gateway, Message, MessageRole, GenerationConfig
+from agents.common.llm_gateway import get_llm_loop, init_llm_gateway, Message, MessageRole, GenerationConfig
 
 ARTIFACTS = REPO_ROOT / "artifacts" / "generated"
 TASK_MEMORY = REPO_ROOT / "artifacts" / "task_memory"
@@ -57,7 +61,10 @@ state_lock = threading.Lock()
 node_state: Dict[str, Dict] = {}
 workers_started = False
 stop_event = threading.Event()
-chat_history: List[Dict[str, str]] = []
+# Bounded so a long session neither grows memory nor makes every /chat response larger.
+CHAT_HISTORY_MAX = 200
+CHAT_RESPONSE_TAIL = 50
+chat_history: Deque[Dict[str, str]] = deque(maxlen=CHAT_HISTORY_MAX)
 spec_helper_gateway = None
 
 
@@ -78,23 +85,64 @@ def state_callback(node_id: str, new_state: str) -> None:
 def reset_state():
     with state_lock:
         node_state.clear()
-    # clear task memory for fresh demo run
-    if TASK_MEMORY.exists():
-        shutil.rmtree(TASK_MEMORY)
-    TASK_MEMORY.mkdir(parents=True, exist_ok=True)
+        # clear task memory for fresh demo run: swap the tree out with one rename (under the
+        # lock, so tail_logs never sees it half-deleted) and delete it in the background.
+        trash = None
+        if TASK_MEMORY.exists():
+            trash = TASK_MEMORY.with_name(f".trash-{uuid4().hex}")
+            try:
+                os.replace(TASK_MEMORY, trash)
+            except OSError:
+                shutil.rmtree(TASK_MEMORY)
+                trash = None
+        TASK_MEMORY.mkdir(parents=True, exist_ok=True)
+    if trash is not None:
+        threading.Thread(target=_purge_trash, daemon=True).start()
     chat_history.clear()
 
 
+def _purge_trash() -> None:
+    # Also picks up trash left behind if a previous server exited mid-delete.
+    for trash in TASK_MEMORY.parent.glob(".trash-*"):
+        shutil.rmtree(trash, ignore_errors=True)
+
+
+LOG_TAIL_BYTES = 4096
+
+
+def _read_log_tail(log_file: str) -> str | None:
+    """Last LOG_TAIL_BYTES of a log (whole lines only), or None if it does not exist."""
+    try:
+        with open(log_file, "rb") as fh:
+            size = fh.seek(0, os.SEEK_END)
+            fh.seek(max(0, size - LOG_TAIL_BYTES))
+            data = fh.read()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if size > LOG_TAIL_BYTES:
+        # Drop the partial first line (and any split UTF-8 sequence with it).
+        _, newline, rest = data.partition(b"\n")
+        if newline:
+            data = rest
+    return data.decode("utf-8", "replace").strip()
+
+
 def tail_logs(node_id: str) -> str:
-    logs: List[str] = []
     node_dir = TASK_MEMORY / node_id
-    if not node_dir.exists():
+    try:
+        with os.scandir(node_dir) as entries:
+            stages = sorted(entry.name for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         return ""
-    for stage in sorted(node_dir.iterdir()):
-        log_file = stage / "log.txt"
-        if log_file.exists():
-            logs.append(f"[{stage.name}] {log_file.read_text().strip()}")
-    return "\n".join(logs[-3:]) if logs else ""
+    # Only the last three stages that have a log are shown; walk back from the newest.
+    logs: List[str] = []
+    for stage in reversed(stages):
+        text = _read_log_tail(os.path.join(node_dir, stage, "log.txt"))
+        if text is not None:
+            logs.append(f"[{stage}] {text}")
+            if len(logs) == 3:
+                break
+    return "\n".join(reversed(logs))
 
 
 def start_workers(params: pika.ConnectionParameters) -> List[threading.Thread]:
@@ -208,9 +256,15 @@ def get_logs(node_id: str):
     return {"node": node_id, "logs": "\n\n".join(logs)}
 
 
+def _history_tail(limit: int = CHAT_RESPONSE_TAIL) -> List[Dict[str, str]]:
+    skip = max(len(chat_history) - max(limit, 0), 0)
+    return list(islice(chat_history, skip, None))
+
+
 @app.get("/chat")
-def get_chat_history():
-    return {"history": chat_history}
+def get_chat_history(limit: int = CHAT_RESPONSE_TAIL):
+    """Most recent `limit` messages; pass limit=CHAT_HISTORY_MAX for everything retained."""
+    return {"history": _history_tail(limit)}
 
 
 @app.post("/chat")
@@ -220,16 +274,21 @@ async def send_chat(message: Dict[str, str]):
         raise HTTPException(status_code=400, detail="empty message")
 
     chat_history.append({"role": "user", "content": user_msg})
-    init_spec_helper_gateway()
+    if spec_helper_gateway is None:
+        # Constructing the provider client is slow; keep it off the event loop. Once built,
+        # init_llm_gateway is a cached lookup and runs inline (still picking up env changes).
+        await asyncio.to_thread(init_spec_helper_gateway)
+    else:
+        init_spec_helper_gateway()
     reply = await generate_spec_helper_reply(user_msg)
     chat_history.append({"role": "agent", "content": reply})
-    return {"reply": reply, "history": chat_history}
+    return {"reply": reply, "history": _history_tail()}
 
 
 @app.post("/chat/reset")
 def reset_chat():
     chat_history.clear()
-    return {"history": chat_history}
+    return {"history": []}
 
 
 async def generate_spec_helper_reply(user_msg: str) -> str:
@@ -245,7 +304,7 @@ async def generate_spec_helper_reply(user_msg: str) -> str:
         "Be concise; prefer bullet lists."
     )
     msgs: List[Message] = [Message(role=MessageRole.SYSTEM, content=system)]
-    for m in chat_history[-6:]:
+    for m in _history_tail(6):
         role = m.get("role", "user")
         if role == "agent":
             msgs.append(Message(role=MessageRole.ASSISTANT, content=m["content"]))
@@ -253,5 +312,7 @@ async def generate_spec_helper_reply(user_msg: str) -> str:
             msgs.append(Message(role=MessageRole.USER, content=m["content"]))
     msgs.append(Message(role=MessageRole.USER, content=user_msg))
     cfg = GenerationConfig(temperature=0.2, max_tokens=500)
-    resp = await spec_helper_gateway.generate(messages=msgs, config=cfg)  # type: ignore
+    # The gateway is shared with the in-process workers, so it runs on the shared LLM loop, not FastAPI's.
+    # Concurrent chats are each one generate() call in flight together there; nothing is coalesced.
+    resp = await asyncio.wrap_future(get_llm_loop().submit(spec_helper_gateway, msgs, cfg))
     return resp.content
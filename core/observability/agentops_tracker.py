@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import threading
 import uuid
 from datetime import datetime, timezone
@@ -54,6 +55,9 @@ class AgentOpsTracker:
         }
         self.cost_log_path = ARTIFACTS_DIR / "costs.jsonl"
         self._summary_filename = "cost_summary.json"
+        # Deferred log_llm_call records, drained by a daemon thread started on first use.
+        self._pending: "queue.Queue[tuple[Any, Dict[str, Any]]]" = queue.Queue()
+        self._drain_thread: Optional[threading.Thread] = None
         ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
 
     def _slug(self) -> str:
@@ -166,9 +170,10 @@ class AgentOpsTracker:
         total_tokens: int,
         estimated_cost_usd: Optional[float],
         metadata: Optional[Dict[str, Any]] = None,
+        ts: Optional[str] = None,
     ) -> None:
         entry = {
-            "ts": _now_iso(),
+            "ts": ts or _now_iso(),
             "run_id": self.run_id,
             "run_name": self.run_name,
             "agent": agent,
@@ -219,6 +224,41 @@ class AgentOpsTracker:
             except Exception:
                 pass
 
+    def log_llm_call_async(self, **kwargs: Any) -> None:
+        """
+        Queue a log_llm_call for the background drain thread so the caller never waits on
+        file writes or AgentOps. The call timestamp and OTel context are captured here.
+        """
+        kwargs.setdefault("ts", _now_iso())
+        ctx = otel_context.get_current() if otel_context is not None else None
+        self._pending.put((ctx, kwargs))
+        if self._drain_thread is None:
+            with self._lock:
+                if self._drain_thread is None:
+                    self._drain_thread = threading.Thread(
+                        target=self._drain_pending, name="agentops-tracker", daemon=True
+                    )
+                    self._drain_thread.start()
+
+    def flush(self) -> None:
+        """Block until every queued log_llm_call_async record has been written."""
+        if self._drain_thread is not None:
+            self._pending.join()
+
+    def _drain_pending(self) -> None:
+        while True:
+            ctx, kwargs = self._pending.get()
+            token = otel_context.attach(ctx) if otel_context is not None and ctx is not None else None
+            try:
+                self.log_llm_call(**kwargs)
+            except Exception:
+                # Observability is best-effort; never let one record stop the drain.
+                pass
+            finally:
+                if token is not None:
+                    otel_context.detach(token)
+                self._pending.task_done()
+
     def log_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         if not self.enabled or agentops is None:
             return
@@ -230,6 +270,7 @@ class AgentOpsTracker:
             pass
 
     def finalize(self) -> None:
+        self.flush()
         with self._lock:
             self._write_summary_locked()
         if self.enabled and agentops is not None:
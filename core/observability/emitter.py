@@ -1,23 +1,152 @@
 """
 Lightweight event emitter to keep observability semantics centralized.
 Actual sinks live under adapters/observability/.
+
+Events are built on the caller thread and handed to sinks by a background
+dispatcher, so runtimes never wait on a sink's I/O. The dispatcher drains
+whatever has queued up (at most max_batch events) and passes it to sinks with
+send_many as one batch, so bursts cost one sink write instead of one per event.
+Each event carries the emitting thread's OpenTelemetry context, which is attached
+around the sink calls so spans keep their parent trace.
 """
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+import atexit
+import threading
+from collections import deque
+from typing import Any, Deque, Iterable, List, Optional, Tuple
 
 from core.observability.events import Event
 
+try:
+    from opentelemetry import context as otel_context
+except ImportError:
+    otel_context = None  # type: ignore
+
 
 class EventEmitter:
-    def __init__(self, sinks: Optional[Iterable[object]] = None):
+    def __init__(
+        self,
+        sinks: Optional[Iterable[object]] = None,
+        max_queue: int = 10000,
+        max_batch: int = 256,
+        flush_interval_ms: int = 0,
+    ):
         self.sinks: List[object] = list(sinks) if sinks else []
+        self.max_queue = max(1, max_queue)
+        # A batch is dispatched once max_batch events are queued or flush_interval_ms has elapsed
+        # since the dispatcher saw the first one (0 = dispatch whatever is queued immediately).
+        self.max_batch = max(1, max_batch)
+        self.flush_interval = max(0, flush_interval_ms) / 1000.0
+        # Only events live in the bounded buffer; flush and stop are tracked by counters and a
+        # flag, so dropping the oldest event can never lose a control signal.
+        self._events: Deque[Tuple[Any, Event]] = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._accepted = 0  # events enqueued so far
+        self._settled = 0  # events dispatched or dropped so far
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
 
     def emit(self, runtime: str, event_type: str, payload: dict) -> None:
-        event = Event(runtime=runtime, event_type=event_type, payload=payload)
+        if not self.sinks:
+            return
+        ctx = otel_context.get_current() if otel_context is not None else None
+        self._enqueue(ctx, Event(runtime=runtime, event_type=event_type, payload=payload))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until everything emitted so far has been handed to the sinks (or dropped)."""
+        with self._lock:
+            if self._worker is None:
+                return True
+            target = self._accepted
+            return self._idle.wait_for(lambda: self._settled >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush queued events and stop the dispatcher thread."""
+        worker = self._worker
+        if worker is None:
+            return
+        atexit.unregister(self.flush)
+        self.flush(timeout)
+        with self._lock:
+            self._stopping = True
+            self._ready.notify()
+        worker.join(timeout)
+        with self._lock:
+            if self._worker is worker:
+                self._worker = None
+
+    def _enqueue(self, ctx: Any, event: Event) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._start_locked()
+            if len(self._events) >= self.max_queue:
+                # Sinks have fallen behind; drop the oldest event rather than block the runtime.
+                self._events.popleft()
+                self._settled += 1
+                self._idle.notify_all()
+            self._events.append((ctx, event))
+            self._accepted += 1
+            self._ready.notify()
+
+    def _start_locked(self) -> None:
+        # Started on first emit so emitters without traffic (and tests) create no thread.
+        self._stopping = False
+        worker = threading.Thread(target=self._drain, name="event-emitter", daemon=True)
+        worker.start()
+        self._worker = worker
+        atexit.register(self.flush)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                while not self._events and not self._stopping:
+                    self._ready.wait()
+                if not self._events:
+                    return
+                if self.flush_interval and len(self._events) < self.max_batch:
+                    self._ready.wait_for(
+                        lambda: len(self._events) >= self.max_batch or self._stopping,
+                        self.flush_interval,
+                    )
+                count = min(len(self._events), self.max_batch)
+                batch = [self._events.popleft() for _ in range(count)]
+            self._dispatch_in_context(batch)
+            with self._lock:
+                self._settled += len(batch)
+                self._idle.notify_all()
+
+    def _dispatch_in_context(self, batch: List[Tuple[Any, Event]]) -> None:
+        # Consecutive events from the same context go to the sinks together under that context.
+        start = 0
+        while start < len(batch):
+            ctx = batch[start][0]
+            end = start + 1
+            while end < len(batch) and batch[end][0] is ctx:
+                end += 1
+            events = [event for _, event in batch[start:end]]
+            token = otel_context.attach(ctx) if otel_context is not None and ctx is not None else None
+            try:
+                self._dispatch(events)
+            finally:
+                if token is not None:
+                    otel_context.detach(token)
+            start = end
+
+    def _dispatch(self, batch: List[Event]) -> None:
         for sink in self.sinks:
             try:
-                sink.send(event)
+                if len(batch) == 1:
+                    sink.send(batch[0])
+                    continue
+                send_many = getattr(sink, "send_many", None)
+                if send_many is not None:
+                    send_many(batch)
+                else:
+                    for event in batch:
+                        sink.send(event)
             except Exception:
                 # Sinks should be best-effort; never break runtimes.
                 continue
@@ -28,7 +157,10 @@ _default_emitter = EventEmitter()
 
 def set_global_sinks(sinks: Iterable[object]) -> None:
     global _default_emitter
+    previous = _default_emitter
     _default_emitter = EventEmitter(sinks)
+    # Deliver whatever the old sinks still had queued before they are dropped.
+    previous.close()
 
 
 def emit_runtime_event(runtime: str, event_type: str, payload: dict) -> None:
@@ -4,14 +4,21 @@ Runtimes emit these events; sinks/adapters consume them.
 """
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     runtime: str
     event_type: str
     payload: Dict[str, Any]
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Wall-clock nanoseconds; the datetime is only built when a sink asks for it.
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=nanos // 1000)
@@ -5,16 +5,25 @@ Unlike artifacts/task_memory/, these are not purged between CLI runs.
 """
 from __future__ import annotations
 
+import os
+import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from core.observability.agentops_tracker import ARTIFACTS_DIR, get_tracker
 
 
+# \w is exactly str.isalnum() plus "_", so this keeps the same characters as before.
+_SLUG_RE = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=128)
 def slugify_run_name(run_name: str) -> str:
-    safe = "".join(ch if ch.isalnum() or ch in ("_", "-") else "_" for ch in (run_name or "run"))
-    return safe or "run"
+    return _SLUG_RE.sub("_", run_name or "run")
 
 
 def get_run_artifacts_dir(*, run_name: Optional[str] = None, run_id: Optional[str] = None) -> Path:
@@ -26,20 +35,51 @@ def get_run_artifacts_dir(*, run_name: Optional[str] = None, run_id: Optional[st
     return root
 
 
+# Below this many files the copies run inline; thread hand-off would cost more than it saves.
+_PARALLEL_COPY_MIN = 4
+_copy_pool: Optional[ThreadPoolExecutor] = None
+_copy_pool_lock = threading.Lock()
+
+
+def _get_copy_pool() -> ThreadPoolExecutor:
+    global _copy_pool
+    if _copy_pool is None:
+        with _copy_pool_lock:
+            if _copy_pool is None:
+                _copy_pool = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="mirror-copy",
+                )
+    return _copy_pool
+
+
+def _copy_one(pair: Tuple[Path, Path]) -> None:
+    src, out = pair
+    try:
+        shutil.copy2(src, out)
+    except Exception:
+        try:
+            # Content only (sendfile on Linux); used when metadata cannot be copied.
+            shutil.copyfile(src, out)
+        except Exception:
+            return
+
+
 def mirror_directory(src: Path, dst: Path) -> None:
     if not src.exists():
         return
-    dst.mkdir(parents=True, exist_ok=True)
-    for path in src.rglob("*"):
-        if path.is_dir():
-            continue
-        rel = path.relative_to(src)
-        out = dst / rel
-        out.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            shutil.copy2(path, out)
-        except Exception:
-            try:
-                out.write_bytes(path.read_bytes())
-            except Exception:
-                continue
+    pairs: List[Tuple[Path, Path]] = []
+    out_dirs = {dst}
+    for root, _dirs, files in os.walk(src):
+        rel = os.path.relpath(root, src)
+        out_dir = dst if rel == os.curdir else dst / rel
+        if files:
+            out_dirs.add(out_dir)
+        pairs.extend((Path(root, name), out_dir / name) for name in files)
+    for out_dir in out_dirs:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    if len(pairs) < _PARALLEL_COPY_MIN:
+        for pair in pairs:
+            _copy_one(pair)
+        return
+    list(_get_copy_pool().map(_copy_one, pairs))
@@ -0,0 +1,48 @@
+"""
+JSON helpers for artifact and prompt dumps and for parsing model replies.
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize obj with a two-space indent (same layout as json.dumps(indent=2))."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # orjson is stricter (e.g. >64-bit ints); let the stdlib decide.
+            pass
+    return json.dumps(obj, indent=2)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialize obj without whitespace; non-ASCII is kept as UTF-8 text."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes; raises json.JSONDecodeError (or a subclass) on bad input."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity literals; let it have the final word.
+            pass
+    return json.loads(data)
+
+
+__all__ = ["dumps_indented", "dumps_compact", "loads"]
@@ -4,27 +4,67 @@ to TaskMessage with interface, rtl path, and design context hash.
 """
 from __future__ import annotations
 
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from core.runtime.json_codec import loads
+
+
+def load_design_context(path: Path) -> Mapping[str, Any]:
+    """
+    Parsed design_context.json, shared by every reader of the same file version.
+    Returned as a read-only view; nested values are shared and must not be mutated.
+    """
+    st = os.stat(path)
+    return MappingProxyType(_load_design_context(os.fspath(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_design_context(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime/size are part of the key so a re-planned design context is parsed afresh.
+    with open(path, "rb") as fh:
+        return loads(fh.read())
 
 
 class DemoContextBuilder:
     def __init__(self, design_context_path: Path, rtl_root: Path) -> None:
         self.design_context_path = design_context_path
         self.rtl_root = rtl_root
-        self._context = json.loads(design_context_path.read_text())
+        self._context = load_design_context(design_context_path)
+        self._nodes: Dict[str, Any] = self._context.get("nodes", {})
+        self._connections_default = self._context.get("connections", [])
+        self._library_refs = self._context.get("standard_library", {})
+        # The design context is fixed for the builder's lifetime, so every node's payload
+        # is assembled once here and build() only hands out copies.
+        self._built: Dict[str, Dict[str, Any]] = {}
+        for node_id in self._nodes:
+            try:
+                self._built[node_id] = self._payload(node_id)
+            except (KeyError, TypeError):
+                # Malformed node; build() recomputes it so the error surfaces at the caller.
+                continue
 
     def build(self, node_id: str) -> Dict[str, Any]:
+        payload = self._built.get(node_id)
+        if payload is None:
+            payload = self._payload(node_id)
+        # Callers add per-task keys (attempt, debug_reason) to the returned dict; nested
+        # values are shared with the cached context and must be treated as read-only.
+        return dict(payload)
+
+    def _payload(self, node_id: str) -> Dict[str, Any]:
         node = self._context["nodes"][node_id]
         rtl_path = self.rtl_root / node["rtl_file"]
         rtl_files = node.get("rtl_files") or [node["rtl_file"]]
         rtl_paths = [str(self.rtl_root / path) for path in rtl_files]
         children = node.get("children") or []
         child_interfaces = {
-            child: self._context["nodes"][child]["interface"]
+            child: self._nodes[child]["interface"]
             for child in children
-            if child in self._context.get("nodes", {})
+            if child in self._nodes
         }
         tb_path = node.get("testbench_file")
         if not tb_path:
@@ -33,7 +73,7 @@ class DemoContextBuilder:
             tb_path = self.rtl_root / tb_path
         connections = node.get("connections")
         if connections is None:
-            connections = self._context.get("connections", [])
+            connections = self._connections_default
         return {
             "node_id": node_id,
             "interface": node["interface"],
@@ -43,7 +83,7 @@ class DemoContextBuilder:
             "design_context_hash": self._context["design_context_hash"],
             "coverage_goals": node.get("coverage_goals", {}),
             "clocking": node.get("clocking", {}),
-            "library_refs": self._context.get("standard_library", {}),
+            "library_refs": self._library_refs,
             "demo_behavior": node.get("demo_behavior", "passthrough"),
             "verification": node.get("verification", {}),
             "acceptance": node.get("acceptance", {}),
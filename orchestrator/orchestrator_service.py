@@ -26,7 +26,7 @@ from core.schemas.contracts import (
 from core.observability.emitter import emit_runtime_event
 from core.observability.run_artifacts import get_run_artifacts_dir, mirror_directory
 
-from orchestrator.context_builder import DemoContextBuilder
+from orchestrator.context_builder import DemoContextBuilder, load_design_context
 from orchestrator.state_machine import Node, NodeState
 from orchestrator.task_memory import TaskMemory
 
@@ -58,7 +58,7 @@ class DemoOrchestrator:
         self.dag_path = dag_path
         self.rtl_root = rtl_root
         self.context_builder = DemoContextBuilder(design_context_path, rtl_root)
-        self._design_context = json.loads(design_context_path.read_text())
+        self._design_context = load_design_context(design_context_path)
         self._node_scopes = {
             node_id: node.get("verification_scope", "full")
             for node_id, node in self._design_context.get("nodes", {}).items()
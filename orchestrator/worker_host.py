@@ -0,0 +1,94 @@
+"""
+In-process host for REASONING agent workers.
+Holds one RabbitMQ connection with a consumer channel per queue, routes each
+delivery to the registered worker for its task type, and runs handle_task on a
+bounded thread pool. Channel operations are marshalled back onto the
+connection thread, since pika's BlockingConnection is not thread-safe.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+import pika
+from core.schemas.contracts import AgentType, ResultMessage, TaskMessage, TaskStatus
+
+from agents.common.base import AgentWorkerBase, settle_task
+
+
+class WorkerHost(threading.Thread):
+    def __init__(
+        self,
+        connection_params: pika.ConnectionParameters,
+        stop_event: threading.Event,
+        max_workers: Optional[int] = None,
+    ):
+        super().__init__(daemon=True)
+        self.connection_params = connection_params
+        self.stop_event = stop_event
+        self.max_workers = max_workers or os.cpu_count() or 4
+        # queue name -> agent type -> worker
+        self._routes: Dict[str, Dict[AgentType, AgentWorkerBase]] = {}
+        self._conn: Optional[pika.BlockingConnection] = None
+
+    def register(self, worker: AgentWorkerBase) -> None:
+        """Route the worker's handled_types on its queue to it (must be called before start())."""
+        routes = self._routes.setdefault(worker.queue_name, {})
+        for agent_type in worker.handled_types:
+            routes[agent_type] = worker
+
+    def run(self) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="worker-host") as pool:
+            with pika.BlockingConnection(self.connection_params) as conn:
+                self._conn = conn
+                for queue_name in self._routes:
+                    ch = conn.channel()
+                    # Keep the pool busy without letting one host hoard the whole queue.
+                    ch.basic_qos(prefetch_count=self.max_workers)
+                    ch.basic_consume(
+                        queue_name,
+                        functools.partial(self._on_message, pool=pool, queue_name=queue_name),
+                    )
+                while not self.stop_event.is_set():
+                    conn.process_data_events(time_limit=0.5)
+                self._conn = None
+
+    def _on_message(self, ch, method, props, body, *, pool: ThreadPoolExecutor, queue_name: str) -> None:
+        try:
+            task = TaskMessage.model_validate_json(body)
+        except Exception:
+            ch.basic_nack(method.delivery_tag, requeue=False)
+            return
+        worker = self._route(queue_name, task)
+        if worker is None:
+            ch.basic_nack(method.delivery_tag, requeue=True)
+            return
+        future = pool.submit(worker.execute, task)
+        future.add_done_callback(functools.partial(self._on_done, ch, method, props, body, task))
+
+    def _route(self, queue_name: str, task: TaskMessage) -> Optional[AgentWorkerBase]:
+        try:
+            agent_type = AgentType(task.task_type.value)
+        except Exception:
+            return None
+        return self._routes.get(queue_name, {}).get(agent_type)
+
+    def _on_done(self, ch, method, props, body, task: TaskMessage, future: Future) -> None:
+        try:
+            outcome, result = future.result()
+        except Exception as exc:  # noqa: BLE001
+            # execute() is not supposed to raise; settle anyway so the delivery never pins a prefetch slot.
+            outcome, result = "result", ResultMessage(
+                task_id=task.task_id,
+                correlation_id=task.correlation_id,
+                status=TaskStatus.FAILURE,
+                log_output=f"Unhandled agent error: {exc}",
+            )
+        conn = self._conn
+        if conn is None or not conn.is_open:
+            # Host is shutting down; the unacked delivery is redelivered to the next consumer.
+            return
+        conn.add_callback_threadsafe(functools.partial(settle_task, ch, method, props, body, task, outcome, result))
@@ -0,0 +1,120 @@
+"""
+Tests for AgentWorkerBase.execute and settle_task in agents.common.base.
+"""
+import threading
+from types import SimpleNamespace
+
+import pika
+import pytest
+
+from core.schemas import AgentType, EntityType, ResultMessage, TaskMessage, TaskStatus
+from core.runtime.retry import MAX_RETRIES, RETRY_HEADER, RetryableError, TaskInputError
+import agents.common.base as base
+from agents.common.base import AgentWorkerBase, RESULTS_ROUTING_KEY, TASK_EXCHANGE, settle_task
+
+
+class FakeChannel:
+    """Records ack/nack/publish calls in order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def basic_ack(self, delivery_tag):
+        self.calls.append(("ack", delivery_tag))
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self.calls.append(("nack", delivery_tag, requeue))
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        self.calls.append(("publish", exchange, routing_key, body, properties))
+
+
+class RaisingWorker(AgentWorkerBase):
+    handled_types = {AgentType.IMPLEMENTATION}
+
+    def __init__(self, exc):
+        super().__init__(pika.ConnectionParameters(), threading.Event())
+        self.exc = exc
+
+    def handle_task(self, task):
+        raise self.exc
+
+
+@pytest.fixture
+def task():
+    return TaskMessage(entity_type=EntityType.REASONING, task_type=AgentType.IMPLEMENTATION, context={})
+
+
+@pytest.fixture
+def method():
+    return SimpleNamespace(delivery_tag=5)
+
+
+def props_with_retries(count):
+    return pika.BasicProperties(headers={RETRY_HEADER: count})
+
+
+class TestSettleTask:
+    """Test cases for each execute() outcome."""
+
+    def test_result_is_published_then_acked(self, task, method):
+        """A result goes to RESULTS and the delivery is acked."""
+        ch = FakeChannel()
+        result = ResultMessage(task_id=task.task_id, correlation_id=task.correlation_id, status=TaskStatus.SUCCESS, log_output="ok")
+        settle_task(ch, method, props_with_retries(0), b"body", task, "result", result)
+        (publish, ack) = ch.calls
+        assert publish[:3] == ("publish", TASK_EXCHANGE, RESULTS_ROUTING_KEY)
+        assert ResultMessage.model_validate_json(publish[3]) == result
+        assert ack == ("ack", 5)
+
+    def test_drop_is_dead_lettered(self, task, method):
+        """Bad input is nacked without requeue."""
+        ch = FakeChannel()
+        settle_task(ch, method, props_with_retries(0), b"body", task, "drop", None)
+        assert ch.calls == [("nack", 5, False)]
+
+    def test_retry_republishes_with_bumped_header(self, task, method):
+        """A retry re-publishes the original body to the entity queue with the count bumped."""
+        ch = FakeChannel()
+        settle_task(ch, method, props_with_retries(MAX_RETRIES - 1), b"body", task, "retry", None)
+        (publish, ack) = ch.calls
+        assert publish[:4] == ("publish", TASK_EXCHANGE, EntityType.REASONING.value, b"body")
+        assert publish[4].headers[RETRY_HEADER] == MAX_RETRIES
+        assert ack == ("ack", 5)
+
+    def test_retry_past_max_is_dead_lettered(self, task, method):
+        """Once the retry budget is spent, the delivery is nacked without requeue."""
+        ch = FakeChannel()
+        settle_task(ch, method, props_with_retries(MAX_RETRIES), b"body", task, "retry", None)
+        assert ch.calls == [("nack", 5, False)]
+
+
+class TestExecute:
+    """Test cases for AgentWorkerBase.execute outcomes."""
+
+    def test_task_input_error_drops(self, task):
+        """TaskInputError maps to a drop."""
+        assert RaisingWorker(TaskInputError("bad")).execute(task) == ("drop", None)
+
+    def test_retryable_error_retries(self, task):
+        """RetryableError maps to a retry."""
+        assert RaisingWorker(RetryableError("later")).execute(task) == ("retry", None)
+
+    def test_unhandled_error_is_failure_result(self, task):
+        """Any other exception becomes a FAILURE result."""
+        outcome, result = RaisingWorker(ValueError("oops")).execute(task)
+        assert outcome == "result"
+        assert result.status == TaskStatus.FAILURE
+        assert "oops" in result.log_output
+
+    def test_observability_errors_do_not_escape(self, task, monkeypatch):
+        """Failures in event emission or tracing become a FAILURE result instead of raising."""
+
+        def broken_emit(**_):
+            raise RuntimeError("sink down")
+
+        monkeypatch.setattr(base, "emit_runtime_event", broken_emit)
+        outcome, result = RaisingWorker(AssertionError("unreachable")).execute(task)
+        assert outcome == "result"
+        assert result.status == TaskStatus.FAILURE
+        assert "sink down" in result.log_output
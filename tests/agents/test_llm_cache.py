@@ -0,0 +1,139 @@
+"""
+Tests for the opt-in LLM response cache in agents.common.llm_cache.
+"""
+import pytest
+
+from adapters.llm.gateway import ModelResponse
+from agents.common import llm_cache
+
+
+@pytest.fixture
+def response():
+    return ModelResponse(
+        content="module foo; endmodule",
+        input_tokens=120,
+        output_tokens=30,
+        total_tokens=150,
+        estimated_cost_usd=0.0042,
+        model_name="gpt-4.1-mini",
+        provider="openai",
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "1")
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def cache_key(**overrides):
+    """make_key with a baseline set of inputs, overriding the given fields."""
+    fields = dict(system="sys", user="user", temperature=0.2, model="gpt-4.1-mini", provider="openai", max_tokens=1000)
+    fields.update(overrides)
+    return llm_cache.make_key(
+        fields.pop("system"),
+        fields.pop("user"),
+        fields.pop("temperature"),
+        **fields,
+    )
+
+
+class TestMakeKey:
+    """Test cases for cache key derivation."""
+
+    def test_key_is_stable(self):
+        """Identical inputs produce the same key."""
+        assert cache_key() == cache_key()
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"system": "sys2"},
+            {"user": "user2"},
+            {"temperature": 0.3},
+            {"temperature": None},
+            {"model": "gpt-4.1"},
+            {"provider": "groq"},
+            {"max_tokens": 2000},
+            {"max_tokens": None},
+        ],
+    )
+    def test_key_changes_with_each_input(self, override):
+        """Prompts, temperature, model, provider and max_tokens all feed the key."""
+        assert cache_key(**override) != cache_key()
+
+    def test_parts_are_delimited(self):
+        """Moving text across the system/user boundary changes the key."""
+        assert cache_key(system="ab", user="c") != cache_key(system="a", user="bc")
+
+    def test_key_is_versioned(self, monkeypatch):
+        """Bumping the key version invalidates every existing entry."""
+        before = cache_key()
+        monkeypatch.setattr(llm_cache, "_KEY_VERSION", b"llm-cache-v3\x00")
+        assert cache_key() != before
+
+
+class TestLookupStore:
+    """Test cases for the persisted entries."""
+
+    def test_round_trip(self, cache_dir, response):
+        """A stored response is returned unchanged by lookup."""
+        key = cache_key()
+        assert llm_cache.lookup(key) is None
+        llm_cache.store(key, response)
+        cached = llm_cache.lookup(key)
+        assert cached == response
+        assert (cache_dir / key[:2] / f"{key}.json").is_file()
+        assert not list(cache_dir.rglob("*.tmp"))
+
+    def test_other_key_misses(self, cache_dir, response):
+        """Only the exact key hits."""
+        llm_cache.store(cache_key(), response)
+        assert llm_cache.lookup(cache_key(temperature=0.3)) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache_dir):
+        """Unreadable entries are treated as misses rather than raising."""
+        key = cache_key()
+        path = cache_dir / key[:2] / f"{key}.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert llm_cache.lookup(key) is None
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch, response):
+        """Without LLM_CACHE=1 nothing is read or written."""
+        monkeypatch.delenv("LLM_CACHE", raising=False)
+        monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+        key = cache_key()
+        assert not llm_cache.cache_enabled()
+        llm_cache.store(key, response)
+        assert list(tmp_path.iterdir()) == []
+        assert llm_cache.lookup(key) is None
+
+
+class TestRecordHit:
+    """Test cases for usage logging of cache hits."""
+
+    def test_hit_logged_as_zero_cost(self, monkeypatch, response):
+        """A hit is logged with the cached model/provider, no tokens and cached=True."""
+        calls = []
+
+        class FakeTracker:
+            def log_llm_call_async(self, **kwargs):
+                calls.append(kwargs)
+
+        monkeypatch.setattr(llm_cache, "get_tracker", lambda: FakeTracker())
+        llm_cache.record_hit(response, agent="implementation", node_id="foo", stage="implementation")
+        assert calls == [
+            {
+                "agent": "implementation",
+                "node_id": "foo",
+                "model": "gpt-4.1-mini",
+                "provider": "openai",
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0,
+                "estimated_cost_usd": 0.0,
+                "metadata": {"stage": "implementation", "cached": True},
+            }
+        ]
@@ -0,0 +1,87 @@
+"""
+Tests for the shared LLM event loop in agents.common.llm_gateway.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from agents.common.llm_gateway import LLMLoop, get_llm_loop
+
+
+class FakeGateway:
+    """Gateway stub that records the loop thread each generate() ran on."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = []
+
+    async def generate(self, messages, config):
+        self.calls.append((messages, config, threading.current_thread().name))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return f"reply:{messages}"
+
+
+@pytest.fixture
+def llm_loop():
+    return LLMLoop()
+
+
+class TestLLMLoop:
+    """Test cases for LLMLoop."""
+
+    def test_run_returns_coroutine_result(self, llm_loop):
+        """run() executes the coroutine on the loop thread and resolves the future."""
+
+        async def which_thread():
+            return threading.current_thread().name
+
+        assert llm_loop.run(which_thread()).result(timeout=5) == "llm-loop"
+
+    def test_submit_calls_generate_once(self, llm_loop):
+        """submit() is a single generate() call on the shared loop."""
+        gateway = FakeGateway()
+        assert llm_loop.submit(gateway, "hi", {"t": 0}).result(timeout=5) == "reply:hi"
+        assert gateway.calls == [("hi", {"t": 0}, "llm-loop")]
+
+    def test_concurrent_submits_from_threads(self, llm_loop):
+        """Submissions from many worker threads each get their own response."""
+        gateway = FakeGateway()
+        results = {}
+
+        def worker(idx):
+            results[idx] = llm_loop.submit(gateway, idx, None).result(timeout=5)
+
+        threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {idx: f"reply:{idx}" for idx in range(8)}
+        assert len(gateway.calls) == 8
+
+    def test_gateway_error_propagates(self, llm_loop):
+        """A gateway exception surfaces from result() and leaves the loop usable."""
+        with pytest.raises(RuntimeError, match="provider unavailable"):
+            llm_loop.submit(FakeGateway(fail=True), "hi", None).result(timeout=5)
+        assert llm_loop.submit(FakeGateway(), "again", None).result(timeout=5) == "reply:again"
+
+
+class TestGetLLMLoop:
+    """Test cases for the process-wide loop accessor."""
+
+    def test_returns_singleton(self):
+        """Every caller shares one loop instance."""
+        assert get_llm_loop() is get_llm_loop()
+
+    def test_singleton_across_threads(self):
+        """Racing first calls from several threads still create one loop."""
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(get_llm_loop())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(loop is seen[0] for loop in seen)
@@ -0,0 +1,30 @@
+"""
+Tests for reflection payload normalization in agents.reflection.worker.
+"""
+from agents.reflection.worker import _normalize_list_field
+
+
+class TestNormalizeListField:
+    """Test cases for _normalize_list_field."""
+
+    def test_strings_are_stripped_and_blanks_dropped(self):
+        """Plain strings are kept stripped; empty ones are dropped."""
+        assert _normalize_list_field(["  a  ", "", "b"]) == ["a", "b"]
+
+    def test_text_key_and_evidence(self):
+        """Dict items use their text key and append evidence."""
+        item = {"hypothesis": " off-by-one ", "evidence": " line 12 "}
+        assert _normalize_list_field([item]) == ["off-by-one [evidence: line 12]"]
+
+    def test_dict_without_text_uses_stdlib_json_form(self):
+        """Dicts with no string value render exactly like json.dumps(item, ensure_ascii=True)."""
+        item = {"line": 12, "tags": ["déjà"], "ok": None, "weight": 0.5}
+        assert _normalize_list_field([item]) == ['{"line": 12, "tags": ["d\\u00e9j\\u00e0"], "ok": null, "weight": 0.5}']
+
+    def test_single_dict_is_wrapped(self):
+        """A lone dict is treated as a one-item list."""
+        assert _normalize_list_field({"point": "x"}) == ["x"]
+
+    def test_non_list_is_empty(self):
+        """Anything that is not a list or dict yields no items."""
+        assert _normalize_list_field("just text") == []
@@ -0,0 +1,121 @@
+"""
+Tests for generated-Verilog cleanup in agents.common.verilog_sanitizer.
+"""
+from agents.common.verilog_sanitizer import sanitize_verilog
+
+
+class TestFences:
+    """Test cases for markdown fence stripping."""
+
+    def test_fenced_rtl(self):
+        """Fence lines, including a language tag, are dropped along with their newline."""
+        source = "```verilog\nmodule m(input wire a, output wire y);\nassign y = a;\nendmodule\n```\n"
+        assert sanitize_verilog(source, kind="rtl") == (
+            "module m(input wire a, output wire y);\nassign y = a;\nendmodule\n"
+        )
+
+    def test_systemverilog_directive_line(self):
+        """A stray `systemverilog line is removed like a fence."""
+        source = "`systemverilog\nmodule m;\nendmodule\n"
+        assert sanitize_verilog(source, kind="rtl") == "module m;\nendmodule\n"
+
+    def test_unfenced_rtl_is_unchanged(self):
+        """Plain Verilog-2001 passes through byte for byte, trailing newline included."""
+        source = "module m(input wire a, output wire y);\nassign y = a;\nendmodule\n"
+        assert sanitize_verilog(source, kind="rtl") == source
+
+    def test_inline_backticks_are_kept(self):
+        """Only whole fence lines go; compiler directives elsewhere are untouched."""
+        source = "`define W 8\nmodule m;\nendmodule\n"
+        assert sanitize_verilog(source, kind="rtl") == source
+
+
+class TestRtlRewrites:
+    """Test cases for kind="rtl" keyword rewrites."""
+
+    def test_systemverilog_keywords(self):
+        """always_ff/always_comb/logic become Verilog-2001 equivalents."""
+        source = (
+            "module m(input logic clk, input logic a, output logic y, output logic z);\n"
+            "always_ff @(posedge clk) y <= a;\n"
+            "always_comb z = a;\n"
+            "endmodule\n"
+        )
+        assert sanitize_verilog(source, kind="rtl") == (
+            "module m(input wire clk, input wire a, output reg y, output reg z);\n"
+            "always @(posedge clk) y <= a;\n"
+            "always @* z = a;\n"
+            "endmodule\n"
+        )
+
+    def test_output_with_extra_spacing(self):
+        """'output  logic' with any whitespace still becomes 'output reg'."""
+        source = "module m(output  logic y, input wire clk);\nalways @(posedge clk) y <= 1'b0;\nendmodule\n"
+        assert "output reg y" in sanitize_verilog(source, kind="rtl")
+
+    def test_outputs_stay_wires_without_always(self):
+        """Continuous-assign outputs are not turned into regs."""
+        source = "module m(output logic y);\nassign y = 1'b0;\nendmodule\n"
+        assert sanitize_verilog(source, kind="rtl") == "module m(output wire y);\nassign y = 1'b0;\nendmodule\n"
+
+    def test_identifiers_containing_keywords(self):
+        """Rewrites are whole-word, so identifiers and comments that contain the tokens survive."""
+        source = (
+            "module m(input wire clk, output logic y);\n"
+            "// logical shift, not always_ff_like\n"
+            "logic logical_q;\n"
+            "wire my_logic_bus;\n"
+            "wire always_comb_en;\n"
+            "always_ff @(posedge clk) y <= logical_q;\n"
+            "endmodule\n"
+        )
+        assert sanitize_verilog(source, kind="rtl") == (
+            "module m(input wire clk, output reg y);\n"
+            "// logical shift, not always_ff_like\n"
+            "wire logical_q;\n"
+            "wire my_logic_bus;\n"
+            "wire always_comb_en;\n"
+            "always @(posedge clk) y <= logical_q;\n"
+            "endmodule\n"
+        )
+
+
+class TestTestbench:
+    """Test cases for kind="tb" cleanup."""
+
+    def test_fenced_testbench(self):
+        """Fences go, logic becomes reg, $stop/$value$plusargs are fixed, timescale and endmodule added."""
+        source = (
+            "```systemverilog\n"
+            "module tb;\n"
+            "logic clk;\n"
+            "initial begin\n"
+            ' if ($value$plusargs("DUMP")) $dumpvars;\n'
+            " $stop;\n"
+            "end\n"
+            "```"
+        )
+        result = sanitize_verilog(source, kind="tb")
+        assert "```" not in result
+        assert result.startswith("`timescale 1ns/1ps\n\nmodule tb;\n")
+        assert "reg clk;" in result
+        assert "logic" not in result
+        assert '$test$plusargs("DUMP")' in result
+        assert "$finish;" in result and "$stop" not in result
+        assert result.rstrip().endswith("endmodule")
+
+    def test_unfenced_testbench_keeps_timescale(self):
+        """An existing timescale is not duplicated and $stop(n) becomes $finish."""
+        source = "`timescale 1ns/1ps\nmodule tb;\ninitial $stop(0);\nendmodule\n"
+        result = sanitize_verilog(source, kind="tb")
+        assert result.count("`timescale") == 1
+        assert "initial $finish;" in result
+
+
+class TestOtherKinds:
+    """Test cases for kinds without cleanup rules."""
+
+    def test_unknown_kind_passes_through(self):
+        """Unknown kinds return the source untouched, fences included."""
+        source = "```\nlogic always_ff\n```"
+        assert sanitize_verilog(source, kind="other") == source
@@ -0,0 +1,58 @@
+"""
+Tests for spec-file note handling in apps.cli.spec_flow.
+"""
+from apps.cli.spec_flow import _append_spec_notes_to_file
+
+
+class TestAppendSpecNotes:
+    """Test cases for _append_spec_notes_to_file."""
+
+    def test_two_appends_in_a_row(self, tmp_path):
+        """Consecutive notes are separated by exactly one blank line."""
+        spec = tmp_path / "spec.txt"
+        spec.write_text("Module: counter\nCounts up.\n")
+        _append_spec_notes_to_file(spec, "L1.role_summary", "  An 8-bit counter.  ")
+        _append_spec_notes_to_file(spec, "L2.signals", "clk, rst, q[7:0]\n\n")
+        assert spec.read_text() == (
+            "Module: counter\nCounts up.\n\n"
+            "[L1.role_summary]\nAn 8-bit counter.\n\n"
+            "[L2.signals]\nclk, rst, q[7:0]\n"
+        )
+
+    def test_trailing_whitespace_is_normalized(self, tmp_path):
+        """Blank lines and trailing spaces left by an editor do not pile up before the note."""
+        spec = tmp_path / "spec.txt"
+        spec.write_text("Module: counter\nCounts up.  \t\n\n\n   \n")
+        _append_spec_notes_to_file(spec, "note", "text")
+        assert spec.read_text() == "Module: counter\nCounts up.\n\n[note]\ntext\n"
+
+    def test_missing_newline_is_separated(self, tmp_path):
+        """A note never runs into a last line that lacks a newline."""
+        spec = tmp_path / "spec.txt"
+        spec.write_text("Module: counter")
+        _append_spec_notes_to_file(spec, "note", "text")
+        assert spec.read_text() == "Module: counter\n\n[note]\ntext\n"
+
+    def test_long_whitespace_tail(self, tmp_path):
+        """Whitespace runs longer than one read chunk are trimmed too."""
+        spec = tmp_path / "spec.txt"
+        spec.write_text("body" + "\n" * 10000)
+        _append_spec_notes_to_file(spec, "note", "text")
+        assert spec.read_text() == "body\n\n[note]\ntext\n"
+
+    def test_missing_or_blank_file(self, tmp_path):
+        """A missing or whitespace-only file gets the note with no leading separator."""
+        missing = tmp_path / "missing.txt"
+        _append_spec_notes_to_file(missing, "note", "text")
+        assert missing.read_text() == "[note]\ntext\n"
+        blank = tmp_path / "blank.txt"
+        blank.write_text(" \n\n")
+        _append_spec_notes_to_file(blank, "note", "text")
+        assert blank.read_text() == "[note]\ntext\n"
+
+    def test_empty_content_is_ignored(self, tmp_path):
+        """Whitespace-only notes leave the file untouched."""
+        spec = tmp_path / "spec.txt"
+        spec.write_text("body\n\n\n")
+        _append_spec_notes_to_file(spec, "note", "  \n")
+        assert spec.read_text() == "body\n\n\n"
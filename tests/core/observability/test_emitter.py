@@ -0,0 +1,205 @@
+"""
+Tests for the background EventEmitter and the JSONL sink it feeds.
+"""
+import json
+import threading
+
+import pytest
+
+import core.observability.emitter as emitter_module
+from adapters.observability.jsonl import JsonlFileSink
+from core.observability.emitter import EventEmitter
+from core.observability.events import Event
+
+
+class GatedSink:
+    """Sink that blocks in send() until released, to make the dispatcher fall behind."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.entered = threading.Event()
+        self.seen = []
+
+    def send(self, event):
+        self.entered.set()
+        self.release.wait(5)
+        self.seen.append(event.payload["n"])
+
+
+class ListSink:
+    def __init__(self):
+        self.seen = []
+
+    def send(self, event):
+        self.seen.append(event.payload["n"])
+
+
+@pytest.fixture
+def atexit_calls(monkeypatch):
+    """Record atexit registrations made by the emitter module."""
+    registered = []
+    monkeypatch.setattr(emitter_module.atexit, "register", registered.append)
+    monkeypatch.setattr(emitter_module.atexit, "unregister", registered.remove)
+    return registered
+
+
+class TestEventEmitter:
+    """Test cases for EventEmitter."""
+
+    def test_no_sinks_starts_no_thread(self):
+        """Emitting without sinks is a no-op."""
+        emitter = EventEmitter()
+        emitter.emit("rt", "evt", {"n": 1})
+        assert emitter._worker is None
+        assert emitter.flush() is True
+
+    def test_events_reach_sinks_in_order(self, atexit_calls):
+        """flush() returns once every emitted event has been dispatched."""
+        sink = ListSink()
+        emitter = EventEmitter([sink])
+        for n in range(52):
+            emitter.emit("rt", "evt", {"n": n})
+        assert emitter.flush(5) is True
+        assert sink.seen == list(range(52))
+        emitter.close()
+
+    def test_backlog_is_dispatched_through_send_many(self, atexit_calls):
+        """Events that queue up behind a slow sink reach it as send_many batches of at most max_batch."""
+
+        class BatchSink(GatedSink):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def send_many(self, events):
+                self.batches.append([event.payload["n"] for event in events])
+
+        sink = BatchSink()
+        emitter = EventEmitter([sink], max_batch=4)
+        emitter.emit("rt", "evt", {"n": 0})
+        assert sink.entered.wait(5)
+        for n in range(1, 11):
+            emitter.emit("rt", "evt", {"n": n})
+        sink.release.set()
+        assert emitter.flush(5) is True
+        assert sink.seen == [0]
+        assert sink.batches == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+        emitter.close()
+
+    def test_flush_interval_coalesces_events(self, atexit_calls):
+        """With a flush interval, events emitted close together are dispatched as one batch."""
+
+        class BatchSink(ListSink):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def send_many(self, events):
+                self.batches.append([event.payload["n"] for event in events])
+
+        sink = BatchSink()
+        emitter = EventEmitter([sink], flush_interval_ms=200)
+        for n in range(5):
+            emitter.emit("rt", "evt", {"n": n})
+        assert emitter.flush(5) is True
+        assert sink.batches == [[0, 1, 2, 3, 4]]
+        assert sink.seen == []
+        emitter.close()
+
+    def test_overflow_drops_oldest_and_flush_still_completes(self, atexit_calls):
+        """When the buffer overflows, old batches are dropped but flush is never starved."""
+        sink = GatedSink()
+        emitter = EventEmitter([sink], max_queue=3)
+        emitter.emit("rt", "evt", {"n": 0})
+        assert sink.entered.wait(5)
+        flushed = []
+        flusher = threading.Thread(target=lambda: flushed.append(emitter.flush(5)))
+        emitter.emit("rt", "evt", {"n": 1})
+        flusher.start()
+        for n in range(2, 10):
+            emitter.emit("rt", "evt", {"n": n})
+        sink.release.set()
+        flusher.join(5)
+        assert flushed == [True]
+        assert emitter.flush(5) is True
+        assert sink.seen == [0, 7, 8, 9]
+        emitter.close()
+
+    def test_close_stops_thread_with_full_buffer(self, atexit_calls):
+        """close() stops the dispatcher even when the buffer was full when it was called."""
+        sink = GatedSink()
+        emitter = EventEmitter([sink], max_queue=2)
+        for n in range(5):
+            emitter.emit("rt", "evt", {"n": n})
+        worker = emitter._worker
+        sink.release.set()
+        emitter.close(5)
+        assert not worker.is_alive()
+        assert emitter._worker is None
+
+    def test_close_unregisters_atexit_flush(self, atexit_calls):
+        """Replaced emitters are not kept alive by their atexit flush hook."""
+        emitter = EventEmitter([ListSink()])
+        emitter.emit("rt", "evt", {"n": 0})
+        assert atexit_calls == [emitter.flush]
+        emitter.close()
+        assert atexit_calls == []
+
+
+class TestJsonlFileSink:
+    """Test cases for JsonlFileSink."""
+
+    def test_writes_are_visible_after_send(self, tmp_path):
+        """Records are appended synchronously, one JSON object per line."""
+        sink = JsonlFileSink(run_name="demo run", run_id="r1", base_dir=tmp_path)
+        sink.send(Event(runtime="rt", event_type="a", payload={"n": 1}))
+        sink.send_many(
+            [Event(runtime="rt", event_type="b", payload={"n": 2}), Event(runtime="rt", event_type="c", payload={"n": 3})]
+        )
+        lines = [json.loads(line) for line in sink.path.read_text().splitlines()]
+        assert sink.path.name == "demo_run_events.jsonl"
+        assert [(line["event_type"], line["payload"]["n"], line["run_id"]) for line in lines] == [
+            ("a", 1, "r1"),
+            ("b", 2, "r1"),
+            ("c", 3, "r1"),
+        ]
+        sink.close()
+        sink.send(Event(runtime="rt", event_type="d", payload={}))
+        assert len(sink.path.read_text().splitlines()) == 3
+
+
+class TestOtelPropagation:
+    """Test cases for carrying the emitter's OpenTelemetry context to the dispatcher thread."""
+
+    def test_sinks_run_under_the_emitting_context(self, atexit_calls, monkeypatch):
+        """Each event is dispatched with the context that was current when it was emitted."""
+        local = threading.local()
+
+        class FakeContext:
+            def get_current(self):
+                return getattr(local, "ctx", None)
+
+            def attach(self, ctx):
+                token = (getattr(local, "ctx", None),)
+                local.ctx = ctx
+                return token
+
+            def detach(self, token):
+                local.ctx = token[0]
+
+        fake = FakeContext()
+        monkeypatch.setattr(emitter_module, "otel_context", fake)
+        seen = []
+
+        class ContextSink:
+            def send(self, event):
+                seen.append((event.payload["n"], fake.get_current()))
+
+        emitter = EventEmitter([ContextSink()])
+        for n, ctx in enumerate(["trace-a", "trace-a", "trace-b", None]):
+            local.ctx = ctx
+            emitter.emit("rt", "evt", {"n": n})
+        local.ctx = None
+        assert emitter.flush(5) is True
+        assert seen == [(0, "trace-a"), (1, "trace-a"), (2, "trace-b"), (3, None)]
+        emitter.close()
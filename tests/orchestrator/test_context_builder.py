@@ -0,0 +1,83 @@
+"""
+Tests for design context loading and per-node payloads in orchestrator.context_builder.
+"""
+import json
+
+import pytest
+
+from orchestrator.context_builder import DemoContextBuilder, load_design_context
+
+
+@pytest.fixture
+def design_context_path(tmp_path):
+    context = {
+        "design_context_hash": "abc123",
+        "top_module": "top",
+        "standard_library": {"fifo": {"path": "lib/fifo.v"}},
+        "connections": [{"from": "a.y", "to": "b.x"}],
+        "nodes": {
+            "top": {
+                "rtl_file": "top.v",
+                "interface": {"signals": [{"name": "clk", "direction": "INPUT", "width": 1}]},
+                "children": ["leaf"],
+                "clocking": {"clk": {"freq_hz": 100000000}},
+            },
+            "leaf": {
+                "rtl_file": "leaf.v",
+                "interface": {"signals": [{"name": "x", "direction": "INPUT", "width": 8}]},
+            },
+        },
+    }
+    path = tmp_path / "design_context.json"
+    path.write_text(json.dumps(context))
+    return path
+
+
+class TestLoadDesignContext:
+    """Test cases for load_design_context."""
+
+    def test_result_is_read_only(self, design_context_path):
+        """The shared parse is handed out as a read-only view."""
+        context = load_design_context(design_context_path)
+        with pytest.raises(TypeError):
+            context["top_module"] = "other"
+        assert load_design_context(design_context_path)["top_module"] == "top"
+
+    def test_rewritten_file_is_reparsed(self, design_context_path):
+        """A new file version is picked up."""
+        load_design_context(design_context_path)
+        data = json.loads(design_context_path.read_text())
+        data["top_module"] = "renamed_top"
+        design_context_path.write_text(json.dumps(data) + "\n")
+        assert load_design_context(design_context_path)["top_module"] == "renamed_top"
+
+
+class TestDemoContextBuilder:
+    """Test cases for DemoContextBuilder.build."""
+
+    def test_payload_fields(self, design_context_path, tmp_path):
+        """build() assembles paths, child interfaces and shared context fields."""
+        payload = DemoContextBuilder(design_context_path, tmp_path).build("top")
+        assert payload["rtl_path"] == str(tmp_path / "top.v")
+        assert payload["tb_path"] == str(tmp_path / "top_tb.sv")
+        assert payload["child_interfaces"]["leaf"]["signals"][0]["name"] == "x"
+        assert payload["connections"] == [{"from": "a.y", "to": "b.x"}]
+        assert payload["design_context_hash"] == "abc123"
+
+    def test_per_task_keys_do_not_leak(self, design_context_path, tmp_path):
+        """Top-level keys added to one build() result (as the orchestrator does) are not seen by later builds."""
+        builder = DemoContextBuilder(design_context_path, tmp_path)
+        payload = builder.build("top")
+        payload["attempt"] = 2
+        payload.update({"debug_reason": "lint failed", "interface": {"signals": []}})
+
+        again = builder.build("top")
+        assert "attempt" not in again and "debug_reason" not in again
+        assert [sig["name"] for sig in again["interface"]["signals"]] == ["clk"]
+        assert again is not payload
+        assert "attempt" not in load_design_context(design_context_path)["nodes"]["top"]
+
+    def test_unknown_node_raises(self, design_context_path, tmp_path):
+        """Nodes missing from the context still raise at build time."""
+        with pytest.raises(KeyError):
+            DemoContextBuilder(design_context_path, tmp_path).build("missing")
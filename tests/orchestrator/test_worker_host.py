@@ -0,0 +1,204 @@
+"""
+Tests for the in-process REASONING worker host, using a fake channel and connection.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pika
+import pytest
+
+from core.schemas import AgentType, EntityType, ResultMessage, TaskMessage, TaskStatus, WorkerType
+from agents.common.base import AgentWorkerBase, RESULTS_ROUTING_KEY
+from orchestrator.worker_host import WorkerHost
+
+
+class FakeChannel:
+    """Records ack/nack/publish calls in order."""
+
+    def __init__(self):
+        self.calls = []
+
+    def basic_ack(self, delivery_tag):
+        self.calls.append(("ack", delivery_tag))
+
+    def basic_nack(self, delivery_tag, requeue=True):
+        self.calls.append(("nack", delivery_tag, requeue))
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        self.calls.append(("publish", routing_key, body))
+
+
+class FakeConnection:
+    """Runs thread-safe callbacks inline, as the connection thread eventually would."""
+
+    def __init__(self, is_open=True):
+        self.is_open = is_open
+        self.callbacks = 0
+
+    def add_callback_threadsafe(self, callback):
+        self.callbacks += 1
+        callback()
+
+
+class EchoWorker(AgentWorkerBase):
+    handled_types = {AgentType.IMPLEMENTATION, AgentType.TESTBENCH}
+    runtime_name = "test_echo"
+
+    def handle_task(self, task):
+        return ResultMessage(
+            task_id=task.task_id,
+            correlation_id=task.correlation_id,
+            status=TaskStatus.SUCCESS,
+            log_output=task.context["node_id"],
+        )
+
+
+class ReflectionStub(AgentWorkerBase):
+    queue_name = "reflection_tasks"
+    handled_types = {AgentType.REFLECTION}
+
+    def handle_task(self, task):  # pragma: no cover - routing only
+        raise AssertionError("not called")
+
+
+def make_task(task_type=AgentType.IMPLEMENTATION, node_id="node_a"):
+    return TaskMessage(entity_type=EntityType.REASONING, task_type=task_type, context={"node_id": node_id})
+
+
+def deliver(host, ch, body, tag=1, queue_name="agent_tasks"):
+    """Push one delivery through _on_message and wait for the pool to settle it."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        host._on_message(
+            ch,
+            SimpleNamespace(delivery_tag=tag),
+            pika.BasicProperties(headers={}),
+            body,
+            pool=pool,
+            queue_name=queue_name,
+        )
+
+
+@pytest.fixture
+def stop_event():
+    return threading.Event()
+
+
+@pytest.fixture
+def host(stop_event):
+    params = pika.ConnectionParameters()
+    host = WorkerHost(params, stop_event, max_workers=2)
+    host.register(EchoWorker(params, stop_event))
+    host.register(ReflectionStub(params, stop_event))
+    host._conn = FakeConnection()
+    return host
+
+
+class TestRoute:
+    """Test cases for WorkerHost._route."""
+
+    def test_routes_each_handled_type(self, host):
+        """Every handled type on the worker's queue resolves to that worker."""
+        assert isinstance(host._route("agent_tasks", make_task(AgentType.IMPLEMENTATION)), EchoWorker)
+        assert isinstance(host._route("agent_tasks", make_task(AgentType.TESTBENCH)), EchoWorker)
+        assert isinstance(host._route("reflection_tasks", make_task(AgentType.REFLECTION)), ReflectionStub)
+
+    def test_wrong_queue_has_no_route(self, host):
+        """Routes are per queue; a type registered elsewhere does not match."""
+        assert host._route("agent_tasks", make_task(AgentType.REFLECTION)) is None
+        assert host._route("unknown_queue", make_task()) is None
+
+    def test_worker_task_type_has_no_route(self, host):
+        """Deterministic WorkerType tasks never route to an agent."""
+        task = TaskMessage(entity_type=EntityType.LIGHT_DETERMINISTIC, task_type=WorkerType.LINTER, context={})
+        assert host._route("agent_tasks", task) is None
+
+
+class TestOnMessage:
+    """Test cases for delivery handling."""
+
+    def test_result_is_published_and_acked(self, host):
+        """A handled task publishes its result to RESULTS and acks."""
+        ch = FakeChannel()
+        deliver(host, ch, make_task(node_id="adder").model_dump_json().encode(), tag=7)
+        assert [call[0] for call in ch.calls] == ["publish", "ack"]
+        assert ch.calls[0][1] == RESULTS_ROUTING_KEY
+        result = ResultMessage.model_validate_json(ch.calls[0][2])
+        assert result.status == TaskStatus.SUCCESS
+        assert result.log_output == "adder"
+        assert ch.calls[1] == ("ack", 7)
+        assert host._conn.callbacks == 1
+
+    def test_missing_route_is_requeued(self, host):
+        """A task with no registered worker is nacked back onto the queue."""
+        ch = FakeChannel()
+        deliver(host, ch, make_task(AgentType.DEBUG).model_dump_json().encode(), tag=3)
+        assert ch.calls == [("nack", 3, True)]
+
+    def test_invalid_body_is_dead_lettered(self, host):
+        """Bodies that are not TaskMessages are nacked without requeue."""
+        ch = FakeChannel()
+        deliver(host, ch, b"{not json", tag=4)
+        assert ch.calls == [("nack", 4, False)]
+
+    def test_failing_future_settles_as_failure(self, host, monkeypatch):
+        """If execute() itself raises, the delivery is still settled with a FAILURE result."""
+
+        def boom(self, task):
+            raise RuntimeError("tracker exploded")
+
+        monkeypatch.setattr(EchoWorker, "execute", boom)
+        ch = FakeChannel()
+        deliver(host, ch, make_task().model_dump_json().encode(), tag=9)
+        assert [call[0] for call in ch.calls] == ["publish", "ack"]
+        result = ResultMessage.model_validate_json(ch.calls[0][2])
+        assert result.status == TaskStatus.FAILURE
+        assert "tracker exploded" in result.log_output
+
+    def test_closed_connection_leaves_delivery_unsettled(self, host):
+        """During shutdown nothing is sent on the channel; the broker redelivers."""
+        host._conn = FakeConnection(is_open=False)
+        ch = FakeChannel()
+        deliver(host, ch, make_task().model_dump_json().encode())
+        assert ch.calls == []
+
+
+class TestConcurrentExecution:
+    """Registered worker instances are shared by every pool thread, so handle_task must be re-entrant."""
+
+    def test_implementation_worker_is_reentrant(self, tmp_path, stop_event, monkeypatch):
+        """Concurrent ImplementationWorker tasks each write their own RTL and result."""
+        import agents.implementation.worker as impl
+        from adapters.llm import gateway as llm_types
+
+        class FakeGateway:
+            async def generate(self, messages, config):
+                node_id = messages[1].content.split("\n", 1)[0].split(": ", 1)[1]
+                return SimpleNamespace(content=f"module {node_id};\nendmodule\n", provider="fake", model_name="fake")
+
+        # The worker module only binds the message types when a provider adapter imports.
+        for name in ("Message", "MessageRole", "GenerationConfig"):
+            monkeypatch.setattr(impl, name, getattr(llm_types, name))
+        monkeypatch.setattr(impl, "get_tracker", lambda: SimpleNamespace(log_llm_call_async=lambda **_: None))
+        worker = impl.ImplementationWorker(pika.ConnectionParameters(), stop_event)
+        worker.gateway = FakeGateway()
+        node_ids = [f"node_{idx}" for idx in range(16)]
+        tasks = [
+            TaskMessage(
+                entity_type=EntityType.REASONING,
+                task_type=AgentType.IMPLEMENTATION,
+                context={
+                    "node_id": node_id,
+                    "rtl_path": str(tmp_path / node_id / f"{node_id}.v"),
+                    "interface": {"signals": [{"name": "clk", "direction": "INPUT", "width": 1}]},
+                },
+            )
+            for node_id in node_ids
+        ]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outcomes = list(pool.map(worker.execute, tasks))
+        for node_id, task, (outcome, result) in zip(node_ids, tasks, outcomes):
+            assert outcome == "result"
+            assert result.task_id == task.task_id
+            assert result.status == TaskStatus.SUCCESS, result.log_output
+            assert (tmp_path / node_id / f"{node_id}.v").read_text() == f"module {node_id};\nendmodule\n"